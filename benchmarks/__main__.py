@@ -0,0 +1,52 @@
+"""Run benchmarks.
+
+Usage::
+
+    $ python -m benchmarks [-k PATTERN] [-n NUMBER] [-r REPEAT]
+                           [-o OUTPUT] [-c BASELINE] [-t THRESHOLD]
+
+Results are written to ``OUTPUT`` as JSON. With ``-c``, they are compared with
+the results in ``BASELINE``, and the exit status is 1 if any benchmark is
+slower by more than ``THRESHOLD`` (a ratio, 0.1 by default).
+"""
+
+import argparse
+import sys
+
+from . import harness
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("-k", dest="pattern", help="only run matched benchmarks")
+    parser.add_argument("-n", dest="number", type=int, help="calls per timing run")
+    parser.add_argument("-r", dest="repeat", type=int, help="timing runs")
+    parser.add_argument("-o", dest="output", help="write results to a JSON file")
+    parser.add_argument("-c", dest="baseline", help="compare with a JSON file")
+    parser.add_argument(
+        "-t",
+        dest="threshold",
+        type=float,
+        default=0.1,
+        help="allowed slowdown when comparing",
+    )
+    args = parser.parse_args()
+
+    harness.load_benchmarks()
+    results = harness.run(args.pattern, number=args.number, repeat=args.repeat)
+    print(harness.format_results(results))
+
+    if args.output:
+        harness.dump_results(results, args.output)
+
+    if args.baseline:
+        comparisons = harness.compare(harness.load_results(args.baseline), results)
+        print()
+        print(harness.format_comparisons(comparisons))
+
+        if any(c.change > args.threshold for c in comparisons):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
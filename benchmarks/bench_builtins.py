@@ -0,0 +1,234 @@
+"""Benchmarks of builtin families not covered by other modules.
+
+Truncation and extension are in ``bench_extend``, flags in ``bench_flags`` and
+rotates in ``bench_rotate``.
+"""
+
+from fishbones import int64, uint32, uint64, vptr
+import numpy as np
+
+from fishbones import bitfield, bits
+from fishbones.bitfield import Bitfield, Field
+from fishbones.decompiler_builtins import ghidra, ida
+from fishbones.integer import UInt32, UInt64
+from fishbones.registers import X64Registers
+
+from .harness import benchmark
+
+X32 = uint32(0x53683477)
+X64 = uint64(0x5368347753683477)
+Y64 = uint64(0xFEDCBA9876543210)
+S64 = int64(-0x5368347753683477)
+
+HIGH = vptr(bytearray(8), UInt64)
+INDEX = vptr(bytearray(4), UInt32)
+
+# 1024 values for array variants.
+VALUES = np.arange(0, 1 << 32, 1 << 22, dtype=np.uint32)
+
+
+@benchmark("parts")
+def byte2():
+    ida.byte2(X64)
+
+
+@benchmark("parts")
+def byten():
+    ida.byten(X64, 2)
+
+
+@benchmark("parts")
+def hidword():
+    ida.hidword(X64)
+
+
+@benchmark("parts")
+def sdword1():
+    ida.sdword1(X64)
+
+
+@benchmark("parts")
+def pair():
+    ida.pair(X32, X32)
+
+
+@benchmark("parts")
+def ghidra_sub84():
+    ghidra.sub84(X64, 4)
+
+
+@benchmark("parts")
+def ghidra_concat44():
+    ghidra.concat44(X32, X32)
+
+
+@benchmark("parts")
+def ghidra_sext48():
+    ghidra.sext48(X32)
+
+
+@benchmark("carry")
+def ghidra_carry4():
+    ghidra.carry4(X32, X32)
+
+
+@benchmark("carry")
+def ghidra_scarry4():
+    ghidra.scarry4(X32, X32)
+
+
+@benchmark("multiply")
+def umulh():
+    ida.umulh(X64, Y64)
+
+
+@benchmark("multiply")
+def mulh():
+    ida.mulh(S64, S64)
+
+
+@benchmark("multiply")
+def umul128():
+    ida.umul128(X64, Y64, HIGH)
+
+
+@benchmark("funnel")
+def shiftleft128():
+    ida.shiftleft128(X64, Y64, 13)
+
+
+@benchmark("funnel")
+def mkcshl():
+    ida.mkcshl(X32, 13)
+
+
+@benchmark("funnel")
+def sar():
+    ida.sar(X32, 13)
+
+
+@benchmark("bits")
+def bswap32():
+    ida.bswap32(X32)
+
+
+@benchmark("bits")
+def clz_bin():
+    # ``clz`` formatted the value as a string before.
+    return X32.size * 8 - len(bin(int(X32))[2:])
+
+
+@benchmark("bits", baseline="clz_bin")
+def clz():
+    ida.clz(X32)
+
+
+@benchmark("bits")
+def ctz():
+    ida.ctz(X32)
+
+
+@benchmark("bits")
+def popcount():
+    ida.popcount(X32)
+
+
+@benchmark("bits")
+def popcount32():
+    ida.popcount32(X32)
+
+
+@benchmark("bits")
+def bit_scan_reverse():
+    ida.bit_scan_reverse(INDEX, X32)
+
+
+@benchmark("bits", number=1000)
+def popcount_array():
+    bits.popcount_array(VALUES)
+
+
+@benchmark("bits", number=1000)
+def clz_array():
+    bits.clz_array(VALUES)
+
+
+class Header(Bitfield):
+    data_type = UInt32
+
+    length = Field(11, 5)
+
+
+HEADER = Header(X32)
+
+
+@benchmark("bitfield")
+def extract_manual():
+    return (X32 >> 11) & 0x1F
+
+
+@benchmark("bitfield", baseline="extract_manual")
+def extract():
+    bitfield.extract(X32, 11, 5)
+
+
+@benchmark("bitfield")
+def insert():
+    bitfield.insert(X32, 11, 5, 0x1F)
+
+
+@benchmark("bitfield")
+def field_get():
+    return HEADER.length
+
+
+@benchmark("bitfield")
+def field_set():
+    HEADER.length = 0x1F
+
+
+REGS = X64Registers(rax=X64)
+RAX = X64
+
+
+@benchmark("registers")
+def lobyte_write_manual():
+    return (RAX & 0xFFFFFFFFFFFFFF00) | ida.lobyte(X32)
+
+
+@benchmark("registers", baseline="lobyte_write_manual")
+def lobyte_write():
+    REGS.al = X32
+
+
+@benchmark("registers")
+def hibyte_read_manual():
+    return ida.byte1(RAX)
+
+
+@benchmark("registers", baseline="hibyte_read_manual")
+def hibyte_read():
+    return REGS.ah
+
+
+@benchmark("registers")
+def zero_extend_write():
+    REGS.eax = X32
+
+
+COUNTER = vptr(bytearray(4), UInt32)
+
+
+@benchmark("atomic")
+def increment_plain():
+    COUNTER.write(COUNTER.read() + 1)
+
+
+@benchmark("atomic", baseline="increment_plain")
+def interlocked_increment():
+    ida.interlocked_increment(COUNTER)
+
+
+@benchmark("atomic")
+def compare_exchange():
+    ida.sync_val_compare_and_swap(COUNTER, 0, 1)
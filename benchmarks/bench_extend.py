@@ -0,0 +1,131 @@
+"""Benchmarks of truncation and extension builtins.
+
+The ``*_bytes`` benchmarks time the implementations which round-trip through
+``to_bytes`` / ``from_bytes``, as a baseline of the arithmetic ones.
+"""
+
+from fishbones import int8, uint16, uint32, uint64
+from fishbones.decompiler_builtins import ghidra, ida
+from fishbones.integer import (
+    Integer,
+    Int8,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
+    get_type_size,
+)
+
+from .harness import benchmark
+
+
+def truncate_bytes(x, c, to_type):
+    data = x.to_bytes()
+    to_size = get_type_size(to_type)
+    return to_type.from_bytes(data[c : c + to_size])
+
+
+def zero_extend_bytes(x, to_type):
+    return to_type.from_bytes(x.to_bytes())
+
+
+def sign_extend_bytes(x, to_type):
+    t1 = Integer.get_type(size=x.size, signed=True)
+    t2 = Integer.get_type(size=get_type_size(to_type), signed=True)
+    return to_type.from_bytes(t2.from_bytes(t1(x).to_bytes()).to_bytes())
+
+
+X16 = uint16(0x8053)
+X32 = uint32(0x53683477)
+X64 = uint64(0x5368347753683477)
+S8 = int8(-0x53)
+
+
+@benchmark("truncate")
+def byte_n_bytes():
+    truncate_bytes(X32, 2, UInt8)
+
+
+@benchmark("truncate", baseline="byte_n_bytes")
+def byte_n():
+    ida.byten(X32, 2)
+
+
+@benchmark("truncate")
+def sbyte_n_bytes():
+    truncate_bytes(X32, 2, Int8)
+
+
+@benchmark("truncate", baseline="sbyte_n_bytes")
+def sbyte_n():
+    ida.sbyten(X32, 2)
+
+
+@benchmark("truncate")
+def hidword_bytes():
+    truncate_bytes(X64, 4, UInt32)
+
+
+@benchmark("truncate", baseline="hidword_bytes")
+def hidword():
+    ida.hidword(X64)
+
+
+@benchmark("truncate")
+def loword_bytes():
+    truncate_bytes(X32, 0, UInt16)
+
+
+@benchmark("truncate", baseline="loword_bytes")
+def loword():
+    ida.loword(X32)
+
+
+@benchmark("truncate")
+def sub42_bytes():
+    truncate_bytes(X32, 1, UInt16)
+
+
+@benchmark("truncate", baseline="sub42_bytes")
+def sub42():
+    ghidra.sub42(X32, 1)
+
+
+@benchmark("zero_extend")
+def zext28_bytes():
+    zero_extend_bytes(X16, UInt64)
+
+
+@benchmark("zero_extend", baseline="zext28_bytes")
+def zext28():
+    ghidra.zext28(X16)
+
+
+@benchmark("zero_extend")
+def zero_extend_signed_bytes():
+    zero_extend_bytes(S8, UInt16)
+
+
+@benchmark("zero_extend", baseline="zero_extend_signed_bytes")
+def zero_extend_signed():
+    ida.zero_extend(S8, UInt16)
+
+
+@benchmark("sign_extend")
+def sext28_bytes():
+    sign_extend_bytes(X16, UInt64)
+
+
+@benchmark("sign_extend", baseline="sext28_bytes")
+def sext28():
+    ghidra.sext28(X16)
+
+
+@benchmark("sign_extend")
+def sign_extend_signed_bytes():
+    sign_extend_bytes(S8, UInt16)
+
+
+@benchmark("sign_extend", baseline="sign_extend_signed_bytes")
+def sign_extend_signed():
+    ida.sign_extend(S8, UInt16)
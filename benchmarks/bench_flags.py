@@ -0,0 +1,60 @@
+"""Benchmarks of flag builtins.
+
+The ``*_separate`` benchmarks compute the sum and each flag with the
+implementations built from ``__SETS__``, as a baseline of the fused ones.
+"""
+
+from fishbones import uint32
+from fishbones.decompiler_builtins import ida
+from fishbones.integer import Integer
+
+from .harness import benchmark
+
+
+def sets_separate(x):
+    data_type = Integer.get_type(size=x.size, signed=True)
+    return int(data_type(x) < 0)
+
+
+def ofadd_separate(x, y):
+    sx = sets_separate(x)
+    return int(((1 ^ sx) ^ sets_separate(y)) & (sx ^ sets_separate(x + y)))
+
+
+def cfadd_separate(x, y):
+    data_type = Integer.get_type(size=max(x.size, y.size), signed=False)
+    return int(data_type(x) > data_type(x + y))
+
+
+X = uint32(0x7FFFFFFF)
+Y = uint32(0x53683477)
+
+
+@benchmark("flags")
+def add_cf_of_separate():
+    return X + Y, cfadd_separate(X, Y), ofadd_separate(X, Y)
+
+
+@benchmark("flags", baseline="add_cf_of_separate")
+def add_with_flags():
+    ida.add_with_flags(X, Y)
+
+
+@benchmark("flags")
+def ofadd_separate_only():
+    ofadd_separate(X, Y)
+
+
+@benchmark("flags", baseline="ofadd_separate_only")
+def ofadd():
+    ida.ofadd(X, Y)
+
+
+@benchmark("flags")
+def cfadd_separate_only():
+    cfadd_separate(X, Y)
+
+
+@benchmark("flags", baseline="cfadd_separate_only")
+def cfadd():
+    ida.cfadd(X, Y)
@@ -0,0 +1,206 @@
+"""Benchmarks of integer types.
+
+Each operator family is timed on ``UInt32`` operands, the most common type in
+ported code. Conversions are timed for 4 and 8 bytes values.
+"""
+
+import operator
+
+from fishbones import int32, uint32, uint64
+from fishbones.integer import Int32, Integer, UInt32, UInt64
+
+from fishbones.decompiler_builtins import ida
+
+from .harness import benchmark
+
+X = uint32(0x53683477)
+Y = uint32(0x7FFFFFFF)
+S = int32(-0x53683477)
+
+DATA4 = bytes.fromhex("77346853")
+DATA8 = bytes.fromhex("7734685377346853")
+
+V64 = uint64(0x5368347753683477)
+D64 = uint64(0x7477)
+
+
+@benchmark("construction")
+def from_int():
+    return UInt32(0x53683477)
+
+
+@benchmark("construction")
+def from_int_signed():
+    return Int32(-0x53683477)
+
+
+@benchmark("construction")
+def from_integer():
+    return UInt64(X)
+
+
+@benchmark("construction")
+def shorthand():
+    return uint32(0x53683477)
+
+
+@benchmark("arithmetic")
+def add():
+    return X + Y
+
+
+@benchmark("arithmetic")
+def add_int():
+    return X + 1
+
+
+@benchmark("arithmetic")
+def radd_int():
+    return 1 + X
+
+
+@benchmark("arithmetic")
+def sub():
+    return X - Y
+
+
+@benchmark("arithmetic")
+def mul():
+    return X * Y
+
+
+@benchmark("arithmetic")
+def floordiv():
+    return Y // X
+
+
+@benchmark("arithmetic")
+def mod():
+    return Y % X
+
+
+def _float_truediv(x, y):
+    """Division of integer types before, built on ``operator.truediv``.
+
+    It divides as float, which is inexact above 2 ** 53.
+    """
+    result_type = type(x)
+
+    if isinstance(y, Integer):
+        if x.size == y.size:
+            result_type = type(y if x.signed else x)
+
+        elif x.size < y.size:
+            result_type = type(y)
+
+    return result_type(operator.truediv(int(x), int(y)))
+
+
+@benchmark("division")
+def truediv_float():
+    return _float_truediv(V64, D64)
+
+
+@benchmark("division", baseline="truediv_float")
+def truediv():
+    return V64 / D64
+
+
+@benchmark("division")
+def floordiv_signed():
+    return S // X
+
+
+@benchmark("division")
+def mod_signed():
+    return S % 7
+
+
+@benchmark("division", baseline="truediv_float")
+def udiv():
+    return ida.udiv(V64, D64)
+
+
+@benchmark("arithmetic")
+def neg():
+    return -S
+
+
+@benchmark("bitwise")
+def and_():
+    return X & Y
+
+
+@benchmark("bitwise")
+def or_():
+    return X | Y
+
+
+@benchmark("bitwise")
+def xor():
+    return X ^ Y
+
+
+@benchmark("bitwise")
+def invert():
+    return ~X
+
+
+@benchmark("shift")
+def lshift():
+    return X << 7
+
+
+@benchmark("shift")
+def rshift():
+    return X >> 7
+
+
+@benchmark("shift")
+def rshift_signed():
+    return S >> 7
+
+
+@benchmark("comparison")
+def eq():
+    return X == Y
+
+
+@benchmark("comparison")
+def lt():
+    return X < Y
+
+
+@benchmark("comparison")
+def lt_int():
+    return X < 0x7FFFFFFF
+
+
+@benchmark("bytes")
+def from_bytes4():
+    return UInt32.from_bytes(DATA4)
+
+
+@benchmark("bytes")
+def from_bytes8():
+    return UInt64.from_bytes(DATA8)
+
+
+@benchmark("bytes")
+def from_bytes4_big():
+    return UInt32.from_bytes(DATA4, byteorder="big")
+
+
+@benchmark("bytes")
+def to_bytes4():
+    return X.to_bytes()
+
+
+@benchmark("bytes")
+def to_bytes8():
+    return V64.to_bytes()
+
+
+@benchmark("bytes")
+def to_bytes4_big():
+    return X.to_bytes(byteorder="big")
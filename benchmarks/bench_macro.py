@@ -0,0 +1,145 @@
+"""Benchmarks of whole routines ported from decompiled code.
+
+The routines are written the way they are ported from the output of IDA, with
+integer types, virtual pointers and builtins, so they show the cost of all of
+them working together:
+
+- TEA and XTEA encrypt one 8 bytes block with 32 rounds.
+- CRC32 generates its table, then checksums 256 bytes.
+- RC4 schedules a 16 bytes key, then generates 256 bytes of keystream.
+
+The ``*_fast`` benchmarks run the same routines in the fast profile.
+"""
+
+from fishbones import uint8, uint32, vptr
+from fishbones.decompiler_builtins import ida
+from fishbones.execution import FAST, global_profile
+from fishbones.integer import UInt32
+
+from .harness import benchmark
+
+KEY = bytearray(range(16))
+BLOCK = bytearray(b"Fishbone")
+DATA = bytearray(range(256))
+
+
+def tea_encrypt(v, k):
+    v0 = v.cast(UInt32).read()
+    v1 = v.cast(UInt32).add(1).read()
+    k0 = k.cast(UInt32).read()
+    k1 = k.cast(UInt32).add(1).read()
+    k2 = k.cast(UInt32).add(2).read()
+    k3 = k.cast(UInt32).add(3).read()
+
+    total = uint32(0)
+    delta = uint32(0x9E3779B9)
+
+    for _ in range(32):
+        total += delta
+        v0 += ((v1 << 4) + k0) ^ (v1 + total) ^ ((v1 >> 5) + k1)
+        v1 += ((v0 << 4) + k2) ^ (v0 + total) ^ ((v0 >> 5) + k3)
+
+    v.cast(UInt32).write(v0)
+    v.cast(UInt32).add(1).write(v1)
+
+
+def xtea_encrypt(v, k):
+    v0 = v.cast(UInt32).read()
+    v1 = v.cast(UInt32).add(1).read()
+    key = k.cast(UInt32)
+
+    total = uint32(0)
+    delta = uint32(0x9E3779B9)
+
+    for _ in range(32):
+        v0 += (((v1 << 4) ^ (v1 >> 5)) + v1) ^ (total + key.add(int(total & 3)).read())
+        total += delta
+        v1 += (((v0 << 4) ^ (v0 >> 5)) + v0) ^ (
+            total + key.add(int((total >> 11) & 3)).read()
+        )
+
+    v.cast(UInt32).write(v0)
+    v.cast(UInt32).add(1).write(v1)
+
+
+def crc32_make_table(table):
+    for i in range(256):
+        c = uint32(i)
+        for _ in range(8):
+            if (c & 1) != 0:
+                c = (c >> 1) ^ 0xEDB88320
+            else:
+                c >>= 1
+        table.add(i).write(c)
+
+
+def crc32(table, data, size):
+    crc = uint32(0xFFFFFFFF)
+
+    for i in range(size):
+        index = ida.lobyte(crc ^ data.add(i).read())
+        crc = table.add(int(index)).read() ^ (crc >> 8)
+
+    return ~crc
+
+
+def rc4_init(state, key, key_size):
+    for i in range(256):
+        state.add(i).write(i)
+
+    j = uint8(0)
+    for i in range(256):
+        j += state.add(i).read() + key.add(i % key_size).read()
+        t = state.add(i).read()
+        state.add(i).write(state.add(int(j)).read())
+        state.add(int(j)).write(t)
+
+
+def rc4_crypt(state, data, size):
+    i = uint8(0)
+    j = uint8(0)
+
+    for n in range(size):
+        i += 1
+        j += state.add(int(i)).read()
+        t = state.add(int(i)).read()
+        state.add(int(i)).write(state.add(int(j)).read())
+        state.add(int(j)).write(t)
+        k = state.add(int(state.add(int(i)).read() + t)).read()
+        data.add(n).write(data.add(n).read() ^ k)
+
+
+@benchmark("macro", number=100)
+def tea():
+    tea_encrypt(vptr(bytearray(BLOCK)), vptr(KEY))
+
+
+@benchmark("macro", number=100)
+def xtea():
+    xtea_encrypt(vptr(bytearray(BLOCK)), vptr(KEY))
+
+
+@benchmark("macro", number=10)
+def crc32_table():
+    table = vptr(bytearray(1024), UInt32)
+    crc32_make_table(table)
+    crc32(table, vptr(DATA), len(DATA))
+
+
+@benchmark("macro", number=10)
+def rc4():
+    state = vptr(bytearray(256))
+    rc4_init(state, vptr(KEY), len(KEY))
+    rc4_crypt(state, vptr(bytearray(256)), 256)
+
+
+@benchmark("macro", number=100, baseline="tea")
+def tea_fast():
+    with global_profile(FAST):
+        tea()
+
+
+@benchmark("macro", number=10, baseline="rc4")
+def rc4_fast():
+    with global_profile(FAST):
+        rc4()
@@ -0,0 +1,98 @@
+"""Benchmarks of rotate and shift builtins.
+
+``rol4`` / ``ror4`` / ``rol8`` run 10^7 rotates, the inner loop size of a
+typical ARX cipher run. The ``*_generic`` benchmarks time the implementation
+built from integer operators, as a baseline of the specialised ones.
+"""
+
+from fishbones import int32, uint32, uint64
+from fishbones.decompiler_builtins import ida
+from fishbones.integer import UInt32, UInt64
+
+from .harness import benchmark
+
+
+def rol_generic(value, count):
+    data_type = type(value)
+    nbits = value.size * 8
+
+    if count > 0:
+        count %= nbits
+        high = value >> (nbits - count)
+        if value.signed:
+            high &= ~(data_type(-1) << count)
+        value <<= count
+        value |= high
+
+    else:
+        count = -count % nbits
+        low = value << (nbits - count)
+        value >>= count
+        value |= low
+
+    return value
+
+
+X32 = uint32(0x53683477)
+X64 = uint64(0x5368347753683477)
+S32 = int32(-0x53683477)
+
+
+@benchmark("rotate", number=10**6, repeat=1)
+def rol4_generic():
+    UInt32(rol_generic(X32, 7))
+
+
+@benchmark("rotate", number=10**7, repeat=1, baseline="rol4_generic")
+def rol4():
+    ida.rol4(X32, 7)
+
+
+@benchmark("rotate", number=10**6, repeat=1)
+def ror4_generic():
+    UInt32(rol_generic(X32, -7))
+
+
+@benchmark("rotate", number=10**7, repeat=1, baseline="ror4_generic")
+def ror4():
+    ida.ror4(X32, 7)
+
+
+@benchmark("rotate", number=10**6, repeat=1)
+def rol8_generic():
+    UInt64(rol_generic(X64, 13))
+
+
+@benchmark("rotate", number=10**7, repeat=1, baseline="rol8_generic")
+def rol8():
+    ida.rol8(X64, 13)
+
+
+@benchmark("rotate")
+def rol_signed_generic():
+    rol_generic(S32, 7)
+
+
+@benchmark("rotate", baseline="rol_signed_generic")
+def rol_signed():
+    ida.rol(S32, 7)
+
+
+@benchmark("shift")
+def mkcshl():
+    ida.mkcshl(X32, 7)
+
+
+@benchmark("shift")
+def mkcshr():
+    ida.mkcshr(X32, 7)
+
+
+@benchmark("shift")
+def sar():
+    ida.sar(X32, 7)
+
+
+@benchmark("shift")
+def shiftleft128():
+    ida.shiftleft128(X64, X64, 13)
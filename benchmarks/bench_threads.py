@@ -0,0 +1,45 @@
+"""Scaling of ``parallel.thread_map`` from 1 thread to all CPUs.
+
+Every benchmark encrypts the same 64 blocks with TEA, each thread copying its
+blocks into a private scratch buffer. Speedups over one thread are only
+expected on free-threaded builds of CPython; with the GIL, they show the
+overhead of the pool.
+"""
+
+import os
+
+from fishbones import parallel, vptr
+
+from .bench_macro import KEY, tea_encrypt
+from .harness import benchmark
+
+BLOCKS = bytes(range(256)) * 2
+COUNT = len(BLOCKS) // 8
+
+
+def encrypt(item, regions):
+    block = regions["block"]
+    block.write_bytes(regions["blocks"].add(item * 8).read_bytes(8))
+    tea_encrypt(block, vptr(KEY))
+    return block.read_bytes(8)
+
+
+def _define(threads: int):
+    @benchmark(
+        "threads",
+        "threads_%d" % threads,
+        number=1,
+        baseline=None if threads == 1 else "threads_1",
+    )
+    def run():
+        parallel.thread_map(
+            encrypt,
+            range(COUNT),
+            shared={"blocks": BLOCKS},
+            scratch={"block": 8},
+            threads=threads,
+        )
+
+
+for _threads in sorted({1, 2, 4, os.cpu_count() or 1}):
+    _define(_threads)
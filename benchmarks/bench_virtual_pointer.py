@@ -0,0 +1,93 @@
+"""Benchmarks of virtual pointers.
+
+The ``tracing`` group times a loop of reads and writes with and without a
+``Tracer``, to show the overhead of tracing.
+"""
+
+from fishbones import vptr
+from fishbones.integer import UInt32, UInt64
+from fishbones.tracing import Tracer
+
+from .harness import benchmark
+
+SOURCE = bytearray(range(256))
+
+P8 = vptr(SOURCE)
+P32 = vptr(SOURCE, UInt32)
+P64 = vptr(SOURCE, UInt64)
+
+V32 = UInt32(0x53683477)
+
+
+@benchmark("vptr")
+def read1():
+    return P8.read()
+
+
+@benchmark("vptr")
+def read4():
+    return P32.read()
+
+
+@benchmark("vptr")
+def read8():
+    return P64.read()
+
+
+@benchmark("vptr")
+def write1():
+    return P8.write(0x77)
+
+
+@benchmark("vptr")
+def write4():
+    return P32.write(V32)
+
+
+@benchmark("vptr")
+def add():
+    return P32 + 4
+
+
+@benchmark("vptr")
+def add_method():
+    return P32.add(4)
+
+
+@benchmark("vptr")
+def cast():
+    return P8.cast(UInt32)
+
+
+@benchmark("vptr")
+def cast_name():
+    return P8.cast("uint32")
+
+
+@benchmark("vptr")
+def read_walk():
+    p = P32
+    for _ in range(16):
+        p.read()
+        p += 1
+
+
+TRACER = Tracer(capacity=1 << 16)
+
+
+def read_write_loop():
+    p = P32
+    for _ in range(64):
+        p.write(p.read() + 1)
+        p += 1
+
+
+@benchmark("tracing", number=1000)
+def untraced():
+    read_write_loop()
+
+
+@benchmark("tracing", number=1000, baseline="untraced")
+def traced():
+    with TRACER:
+        read_write_loop()
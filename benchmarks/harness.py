@@ -0,0 +1,259 @@
+"""Helpers to define and run benchmarks."""
+
+import importlib
+import json
+import os
+import pkgutil
+import platform
+import re
+import subprocess
+import timeit
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+import fishbones
+
+
+class Benchmark(NamedTuple):
+    """A registered benchmark.
+
+    Attributes:
+        group: The group of the benchmark, usually the family of operations.
+        name: The name of the benchmark, unique in its group.
+        func: The function to be timed, called without arguments.
+        number: The number of calls in each timing run.
+        repeat: The number of timing runs, if it differs from the default.
+        baseline: The name of a benchmark in the same group which this one
+            is compared with.
+    """
+
+    group: str
+    name: str
+    func: Callable[[], object]
+    number: int
+    repeat: Optional[int]
+    baseline: Optional[str]
+
+
+class Result(NamedTuple):
+    """Result of a benchmark.
+
+    Attributes:
+        group: The group of the benchmark.
+        name: The name of the benchmark.
+        number: The number of calls in each timing run.
+        seconds: The best time per call.
+        speedup: The ratio of the baseline time to this time, if the
+            benchmark has a baseline.
+    """
+
+    group: str
+    name: str
+    number: int
+    seconds: float
+    speedup: Optional[float]
+
+
+class Comparison(NamedTuple):
+    """Comparison of a benchmark between two runs.
+
+    Attributes:
+        group: The group of the benchmark.
+        name: The name of the benchmark.
+        old_seconds: The time per call in the old run.
+        new_seconds: The time per call in the new run.
+        change: The relative change of time, positive if the new run is slower.
+    """
+
+    group: str
+    name: str
+    old_seconds: float
+    new_seconds: float
+    change: float
+
+
+BENCHMARKS: List[Benchmark] = []
+
+
+def benchmark(
+    group: str,
+    name: Optional[str] = None,
+    number: int = 10000,
+    repeat: Optional[int] = None,
+    baseline: Optional[str] = None,
+):
+    """Register a function as a benchmark."""
+
+    def decorator(func: Callable[[], object]) -> Callable[[], object]:
+        BENCHMARKS.append(
+            Benchmark(
+                group=group,
+                name=name or func.__name__,
+                func=func,
+                number=number,
+                repeat=repeat,
+                baseline=baseline,
+            )
+        )
+        return func
+
+    return decorator
+
+
+def load_benchmarks():
+    """Import all ``bench_*`` modules of this package."""
+    path = os.path.dirname(__file__)
+
+    for module_info in pkgutil.iter_modules([path]):
+        if module_info.name.startswith("bench_"):
+            importlib.import_module("%s.%s" % (__package__, module_info.name))
+
+
+def measure(func: Callable[[], object], number: int, repeat: int = 5) -> float:
+    """Get the best time per call of ``func``."""
+    timer = timeit.Timer(func)
+    return min(timer.repeat(repeat=repeat, number=number)) / number
+
+
+def run(
+    pattern: Optional[str] = None,
+    number: Optional[int] = None,
+    repeat: Optional[int] = None,
+) -> List[Result]:
+    """Run registered benchmarks.
+
+    Args:
+        pattern: Only run benchmarks whose ``group.name`` matches this regular
+            expression.
+        number: Override the number of calls of every benchmark.
+        repeat: Override the number of timing runs of every benchmark.
+    """
+    selected = [
+        b
+        for b in BENCHMARKS
+        if pattern is None or re.search(pattern, "%s.%s" % (b.group, b.name))
+    ]
+
+    timings = {}
+    for b in selected:
+        timings[(b.group, b.name)] = measure(
+            b.func, number or b.number, repeat or b.repeat or 5
+        )
+
+    results = []
+    for b in selected:
+        seconds = timings[(b.group, b.name)]
+        speedup = None
+
+        if b.baseline is not None and (b.group, b.baseline) in timings:
+            speedup = timings[(b.group, b.baseline)] / seconds
+
+        results.append(
+            Result(
+                group=b.group,
+                name=b.name,
+                number=number or b.number,
+                seconds=seconds,
+                speedup=speedup,
+            )
+        )
+
+    return results
+
+
+def format_results(results: List[Result]) -> str:
+    """Format results as a table."""
+    lines = ["%-16s %-32s %14s %9s" % ("group", "name", "time (us)", "speedup")]
+
+    for r in results:
+        speedup = "" if r.speedup is None else "%.2fx" % r.speedup
+        lines.append(
+            "%-16s %-32s %14.3f %9s" % (r.group, r.name, r.seconds * 1e6, speedup)
+        )
+
+    return "\n".join(lines)
+
+
+def get_commit() -> Optional[str]:
+    """Get the current commit of the working tree, if it is a git repository."""
+    try:
+        process = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(__file__),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            universal_newlines=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+    return process.stdout.strip()
+
+
+def dump_results(results: List[Result], path: str):
+    """Write results and the environment they are measured in to a JSON file."""
+    data: Dict[str, Any] = {
+        "fishbones": fishbones.__version__,
+        "commit": get_commit(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "results": [r._asdict() for r in results],
+    }
+
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str) -> List[Result]:
+    """Read results from a JSON file written by ``dump_results``."""
+    with open(path) as f:
+        data = json.load(f)
+
+    return [Result(**r) for r in data["results"]]
+
+
+def compare(old: List[Result], new: List[Result]) -> List[Comparison]:
+    """Compare benchmarks which exist in both runs."""
+    old_seconds = {(r.group, r.name): r.seconds for r in old}
+
+    comparisons = []
+    for r in new:
+        seconds = old_seconds.get((r.group, r.name))
+        if seconds is None:
+            continue
+
+        comparisons.append(
+            Comparison(
+                group=r.group,
+                name=r.name,
+                old_seconds=seconds,
+                new_seconds=r.seconds,
+                change=r.seconds / seconds - 1,
+            )
+        )
+
+    return comparisons
+
+
+def format_comparisons(comparisons: List[Comparison]) -> str:
+    """Format comparisons as a table."""
+    lines = [
+        "%-16s %-32s %14s %14s %9s"
+        % ("group", "name", "old (us)", "new (us)", "change")
+    ]
+
+    for c in comparisons:
+        lines.append(
+            "%-16s %-32s %14.3f %14.3f %+8.1f%%"
+            % (
+                c.group,
+                c.name,
+                c.old_seconds * 1e6,
+                c.new_seconds * 1e6,
+                c.change * 100,
+            )
+        )
+
+    return "\n".join(lines)
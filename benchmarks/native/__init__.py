@@ -0,0 +1,320 @@
+"""Compare ported routines with native code compiled locally.
+
+``reference.c`` is compiled into a shared library with the system compiler
+(``$CC`` or ``cc``) and loaded with ``ctypes``. Every routine is run by both
+implementations over the same random inputs, outputs are checked for equality
+and the throughput of both is reported.
+"""
+
+import ctypes
+import functools
+import hashlib
+import os
+import random
+import subprocess
+import tempfile
+import time
+from typing import Any, Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+from fishbones import uint32, vptr
+from fishbones.decompiler_builtins import ida
+from fishbones.integer import UInt32
+
+from ..bench_macro import crc32, crc32_make_table, tea_encrypt
+
+SOURCE = os.path.join(os.path.dirname(__file__), "reference.c")
+
+
+class Routine(NamedTuple):
+    """A routine implemented in Python and C.
+
+    Attributes:
+        name: The name of the routine.
+        make_input: Generates an input from a random generator.
+        port: Runs the ported routine on an input, returns its output.
+        native: Runs the native routine of a library on an input, returns its
+            output.
+    """
+
+    name: str
+    make_input: Callable[[random.Random], Any]
+    port: Callable[[Any], Any]
+    native: Callable[[ctypes.CDLL, Any], Any]
+
+
+class NativeResult(NamedTuple):
+    """Result of a routine.
+
+    Attributes:
+        name: The name of the routine.
+        count: The number of inputs.
+        input_size: Bytes of all inputs.
+        port_seconds: Time of the ported routine over all inputs.
+        native_seconds: Time of the native routine over all inputs.
+        mismatches: The number of inputs whose outputs differ.
+    """
+
+    name: str
+    count: int
+    input_size: int
+    port_seconds: float
+    native_seconds: float
+    mismatches: int
+
+    @property
+    def ratio(self) -> float:
+        """How many times the native routine is faster."""
+        return self.port_seconds / self.native_seconds
+
+
+def compile_library(source: str = SOURCE, directory: Optional[str] = None) -> str:
+    """Compile a C source into a shared library and return its path.
+
+    The library is reused while the source and compiler are unchanged.
+
+    Raises:
+        RuntimeError: If the compiler is missing or fails.
+    """
+    compiler = os.environ.get("CC", "cc")
+
+    with open(source, "rb") as f:
+        digest = hashlib.sha256(f.read() + compiler.encode()).hexdigest()[:16]
+
+    directory = directory or os.path.join(tempfile.gettempdir(), "fishbones-native")
+    path = os.path.join(directory, "reference-%s.so" % digest)
+
+    if os.path.exists(path):
+        return path
+
+    os.makedirs(directory, exist_ok=True)
+
+    command = [compiler, "-O2", "-shared", "-fPIC", "-o", path, source]
+    try:
+        subprocess.run(command, check=True, capture_output=True)
+    except FileNotFoundError as e:
+        raise RuntimeError("C compiler not found: %s" % compiler) from e
+    except subprocess.CalledProcessError as e:
+        raise RuntimeError("Failed to compile: %s" % e.stderr.decode()) from e
+
+    return path
+
+
+def load_library(path: str) -> ctypes.CDLL:
+    """Load the compiled library and declare its functions."""
+    lib = ctypes.CDLL(path)
+
+    lib.tea_encrypt.argtypes = [ctypes.c_char_p, ctypes.c_char_p]
+    lib.tea_encrypt.restype = None
+
+    lib.crc32_make_table.argtypes = [ctypes.c_char_p]
+    lib.crc32_make_table.restype = None
+
+    lib.crc32.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_size_t]
+    lib.crc32.restype = ctypes.c_uint32
+
+    lib.fnv1a32.argtypes = [ctypes.c_char_p, ctypes.c_size_t]
+    lib.fnv1a32.restype = ctypes.c_uint32
+
+    lib.murmur3_32.argtypes = [ctypes.c_char_p, ctypes.c_size_t, ctypes.c_uint32]
+    lib.murmur3_32.restype = ctypes.c_uint32
+
+    return lib
+
+
+def fnv1a32(data, size):
+    h = uint32(0x811C9DC5)
+
+    for i in range(size):
+        h ^= data.add(i).read()
+        h *= 0x01000193
+
+    return h
+
+
+def murmur3_32(data, size, seed):
+    c1 = 0xCC9E2D51
+    c2 = 0x1B873593
+
+    h = uint32(seed)
+    blocks = data.cast(UInt32)
+
+    for i in range(size // 4):
+        k = blocks.add(i).read()
+        k *= c1
+        k = ida.rol4(k, 15)
+        k *= c2
+        h ^= k
+        h = ida.rol4(h, 13)
+        h = h * 5 + 0xE6546B64
+
+    tail = data.add(size & ~3)
+    remaining = size & 3
+
+    k = uint32(0)
+    if remaining >= 3:
+        k ^= uint32(tail.add(2).read()) << 16
+    if remaining >= 2:
+        k ^= uint32(tail.add(1).read()) << 8
+    if remaining >= 1:
+        k ^= tail.read()
+        k *= c1
+        k = ida.rol4(k, 15)
+        k *= c2
+        h ^= k
+
+    h ^= size
+    h ^= h >> 16
+    h *= 0x85EBCA6B
+    h ^= h >> 13
+    h *= 0xC2B2AE35
+    h ^= h >> 16
+
+    return h
+
+
+# Tables of CRC32 are made once, by each implementation.
+_CRC32_TABLE = vptr(bytearray(1024), UInt32)
+crc32_make_table(_CRC32_TABLE)
+
+
+def _native_crc32_table(lib: ctypes.CDLL) -> bytes:
+    table = ctypes.create_string_buffer(1024)
+    lib.crc32_make_table(table)
+    return table.raw
+
+
+def _random_bytes(rng: random.Random, size: int) -> bytes:
+    return bytes(rng.getrandbits(8) for _ in range(size))
+
+
+def _tea_port(data: bytes) -> bytes:
+    v = vptr(bytearray(data[:8]))
+    tea_encrypt(v, vptr(bytearray(data[8:])))
+    return bytes(v.source)
+
+
+def _tea_native(lib: ctypes.CDLL, data: bytes) -> bytes:
+    v = ctypes.create_string_buffer(data[:8], 8)
+    lib.tea_encrypt(v, data[8:])
+    return v.raw
+
+
+def routines(data_size: int = 64) -> List[Routine]:
+    """Get reference routines.
+
+    Args:
+        data_size: Bytes of inputs of hashes and checksums. The size of each
+            input is random between half of it and it, so that tails of
+            blocks are covered.
+    """
+
+    def make_data(rng: random.Random) -> bytes:
+        return _random_bytes(rng, rng.randint(data_size // 2, data_size))
+
+    native_tables = {}
+
+    def crc32_native(lib: ctypes.CDLL, data: bytes) -> int:
+        table = native_tables.get(id(lib))
+        if table is None:
+            table = native_tables[id(lib)] = _native_crc32_table(lib)
+
+        return lib.crc32(table, data, len(data))
+
+    return [
+        Routine(
+            "tea",
+            lambda rng: _random_bytes(rng, 24),
+            _tea_port,
+            _tea_native,
+        ),
+        Routine(
+            "crc32",
+            make_data,
+            lambda data: int(crc32(_CRC32_TABLE, vptr(data), len(data))),
+            crc32_native,
+        ),
+        Routine(
+            "fnv1a32",
+            make_data,
+            lambda data: int(fnv1a32(vptr(data), len(data))),
+            lambda lib, data: lib.fnv1a32(data, len(data)),
+        ),
+        Routine(
+            "murmur3_32",
+            make_data,
+            lambda data: int(murmur3_32(vptr(data), len(data), 0x53683477)),
+            lambda lib, data: lib.murmur3_32(data, len(data), 0x53683477),
+        ),
+    ]
+
+
+def _time(func: Callable[[Any], Any], inputs: Sequence[Any]) -> Tuple[float, List[Any]]:
+    start = time.perf_counter()
+    outputs = [func(v) for v in inputs]
+    return time.perf_counter() - start, outputs
+
+
+def run(
+    lib: ctypes.CDLL,
+    selected: Sequence[Routine],
+    count: int = 1000,
+    seed: int = 0,
+) -> List[NativeResult]:
+    """Run routines with both implementations over random inputs.
+
+    Args:
+        lib: The library loaded by ``load_library``.
+        selected: Routines to run.
+        count: The number of inputs of each routine.
+        seed: The seed of random inputs.
+    """
+    results = []
+
+    for routine in selected:
+        rng = random.Random("%s-%d" % (routine.name, seed))
+        inputs = [routine.make_input(rng) for _ in range(count)]
+
+        native_seconds, native_outputs = _time(
+            functools.partial(routine.native, lib), inputs
+        )
+        port_seconds, port_outputs = _time(routine.port, inputs)
+
+        mismatches = sum(port_outputs[i] != native_outputs[i] for i in range(count))
+        results.append(
+            NativeResult(
+                name=routine.name,
+                count=count,
+                input_size=sum(len(v) for v in inputs),
+                port_seconds=port_seconds,
+                native_seconds=native_seconds,
+                mismatches=mismatches,
+            )
+        )
+
+    return results
+
+
+def format_results(results: Sequence[NativeResult]) -> str:
+    """Format results as a table."""
+
+    def throughput(size: int, seconds: float) -> str:
+        return "%.3f" % (size / seconds / 1e6)
+
+    lines = [
+        "%-12s %8s %12s %12s %10s %10s"
+        % ("name", "inputs", "port MB/s", "native MB/s", "ratio", "mismatch")
+    ]
+    for r in results:
+        lines.append(
+            "%-12s %8d %12s %12s %9.1fx %10d"
+            % (
+                r.name,
+                r.count,
+                throughput(r.input_size, r.port_seconds),
+                throughput(r.input_size, r.native_seconds),
+                r.ratio,
+                r.mismatches,
+            )
+        )
+
+    return "\n".join(lines)
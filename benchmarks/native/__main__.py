@@ -0,0 +1,49 @@
+"""Compare ported routines with native code.
+
+Usage::
+
+    $ python -m benchmarks.native [-k PATTERN] [-n COUNT] [-s SEED] [--size SIZE]
+
+The exit status is 1 if any output of a ported routine differs from the
+native one, or if the reference library can't be compiled.
+"""
+
+import argparse
+import re
+import sys
+
+from . import compile_library, format_results, load_library, routines, run
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.native")
+    parser.add_argument("-k", dest="pattern", help="only run matched routines")
+    parser.add_argument(
+        "-n", dest="count", type=int, default=1000, help="inputs per routine"
+    )
+    parser.add_argument("-s", dest="seed", type=int, default=0, help="random seed")
+    parser.add_argument(
+        "--size", type=int, default=64, help="maximum bytes of hashed inputs"
+    )
+    args = parser.parse_args()
+
+    try:
+        lib = load_library(compile_library())
+    except RuntimeError as e:
+        print(e, file=sys.stderr)
+        sys.exit(1)
+
+    selected = [
+        r
+        for r in routines(args.size)
+        if args.pattern is None or re.search(args.pattern, r.name)
+    ]
+    results = run(lib, selected, count=args.count, seed=args.seed)
+    print(format_results(results))
+
+    if any(r.mismatches for r in results):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+/* Reference implementations of routines ported in ``benchmarks``. */
+
+#include <stddef.h>
+#include <stdint.h>
+
+#define ROL32(x, n) (((x) << (n)) | ((x) >> (32 - (n))))
+
+void tea_encrypt(uint32_t *v, const uint32_t *k)
+{
+    uint32_t v0 = v[0], v1 = v[1], total = 0;
+    const uint32_t delta = 0x9E3779B9;
+
+    for (int i = 0; i < 32; i++) {
+        total += delta;
+        v0 += ((v1 << 4) + k[0]) ^ (v1 + total) ^ ((v1 >> 5) + k[1]);
+        v1 += ((v0 << 4) + k[2]) ^ (v0 + total) ^ ((v0 >> 5) + k[3]);
+    }
+
+    v[0] = v0;
+    v[1] = v1;
+}
+
+void crc32_make_table(uint32_t *table)
+{
+    for (uint32_t i = 0; i < 256; i++) {
+        uint32_t c = i;
+        for (int j = 0; j < 8; j++)
+            c = c & 1 ? (c >> 1) ^ 0xEDB88320 : c >> 1;
+        table[i] = c;
+    }
+}
+
+uint32_t crc32(const uint32_t *table, const uint8_t *data, size_t size)
+{
+    uint32_t crc = 0xFFFFFFFF;
+
+    for (size_t i = 0; i < size; i++)
+        crc = table[(uint8_t)(crc ^ data[i])] ^ (crc >> 8);
+
+    return ~crc;
+}
+
+uint32_t fnv1a32(const uint8_t *data, size_t size)
+{
+    uint32_t h = 0x811C9DC5;
+
+    for (size_t i = 0; i < size; i++) {
+        h ^= data[i];
+        h *= 0x01000193;
+    }
+
+    return h;
+}
+
+uint32_t murmur3_32(const uint8_t *data, size_t size, uint32_t seed)
+{
+    const uint32_t c1 = 0xCC9E2D51, c2 = 0x1B873593;
+    uint32_t h = seed, k;
+    size_t i;
+
+    for (i = 0; i + 4 <= size; i += 4) {
+        k = data[i] | data[i + 1] << 8 | data[i + 2] << 16 | (uint32_t)data[i + 3] << 24;
+        k *= c1;
+        k = ROL32(k, 15);
+        k *= c2;
+        h ^= k;
+        h = ROL32(h, 13);
+        h = h * 5 + 0xE6546B64;
+    }
+
+    k = 0;
+    switch (size & 3) {
+    case 3:
+        k ^= data[i + 2] << 16;
+        /* fall through */
+    case 2:
+        k ^= data[i + 1] << 8;
+        /* fall through */
+    case 1:
+        k ^= data[i];
+        k *= c1;
+        k = ROL32(k, 15);
+        k *= c2;
+        h ^= k;
+    }
+
+    h ^= (uint32_t)size;
+    h ^= h >> 16;
+    h *= 0x85EBCA6B;
+    h ^= h >> 13;
+    h *= 0xC2B2AE35;
+    h ^= h >> 16;
+
+    return h;
+}
@@ -1,4 +1,22 @@
-from .integer import int8, int16, int32, int64, uint8, uint16, uint32, uint64
+import os
+
+from .integer import (
+    int8,
+    int16,
+    int32,
+    int64,
+    int128,
+    uint8,
+    uint16,
+    uint32,
+    uint64,
+    uint128,
+)
 from .virtual_pointer import vptr
 
 __version__ = "0.3.1"
+
+if os.environ.get("FISHBONES_PROFILE"):
+    from .execution import set_profile
+
+    set_profile(os.environ["FISHBONES_PROFILE"])
@@ -0,0 +1,178 @@
+"""Atomic operations over virtual pointers.
+
+Operations read, change and write the value at a pointer, of the width of its
+``data_type``, while holding a lock. Locks are striped: every address maps to
+one of ``STRIPES`` locks by its source and offset, so operations on different
+addresses rarely wait for each other, while operations on the same address
+always take the same lock::
+
+    counter = vptr(bytearray(4), UInt32)
+    atomic.fetch_add(counter, 1)
+
+Addresses are keyed by ``offset >> 4``, so aligned accesses to the same bytes
+through pointers of different widths share a lock. Only other atomic
+operations are excluded, plain reads and writes of the same bytes still race.
+
+Values are returned as integers of the pointer's ``data_type``. Functions of
+MSVC and GCC built on these are in ``decompiler_builtins.ida``.
+"""
+
+import threading
+from typing import List, SupportsInt
+
+from .integer import Integer
+from .virtual_pointer import VirtualPointer
+
+# The number of locks.
+STRIPES = 64
+
+_locks: List[threading.Lock] = [threading.Lock() for _ in range(STRIPES)]
+
+
+def get_lock(ptr: VirtualPointer) -> threading.Lock:
+    """Get the lock of the address of a pointer."""
+    return _locks[hash((id(ptr.source), ptr.offset >> 4)) % STRIPES]
+
+
+def load(ptr: VirtualPointer) -> Integer:
+    """Read the value."""
+    with get_lock(ptr):
+        return ptr.read()
+
+
+def store(ptr: VirtualPointer, value: SupportsInt):
+    """Write the value."""
+    with get_lock(ptr):
+        ptr.write(value)
+
+
+def exchange(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Write the value and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(value)
+
+    return old
+
+
+def compare_exchange(
+    ptr: VirtualPointer, expected: SupportsInt, desired: SupportsInt
+) -> Integer:
+    """Write ``desired`` if the value is ``expected``, and return the old one.
+
+    The old value equals ``expected`` if and only if it is written.
+    """
+    with get_lock(ptr):
+        old = ptr.read()
+        if int(old) == int(ptr.data_type(expected)):
+            ptr.write(desired)
+
+    return old
+
+
+def fetch_add(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Add to the value and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(int(old) + int(value))
+
+    return old
+
+
+def fetch_sub(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Subtract from the value and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(int(old) - int(value))
+
+    return old
+
+
+def fetch_and(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """And the value and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(int(old) & int(value))
+
+    return old
+
+
+def fetch_or(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Or the value and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(int(old) | int(value))
+
+    return old
+
+
+def fetch_xor(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Xor the value and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(int(old) ^ int(value))
+
+    return old
+
+
+def fetch_nand(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Replace the value with ``~(value & v)`` and return the old one."""
+    with get_lock(ptr):
+        old = ptr.read()
+        ptr.write(~(int(old) & int(value)))
+
+    return old
+
+
+def add_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Add to the value and return the new one."""
+    with get_lock(ptr):
+        new = ptr.data_type(int(ptr.read()) + int(value))
+        ptr.write(new)
+
+    return new
+
+
+def sub_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Subtract from the value and return the new one."""
+    with get_lock(ptr):
+        new = ptr.data_type(int(ptr.read()) - int(value))
+        ptr.write(new)
+
+    return new
+
+
+def and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """And the value and return the new one."""
+    with get_lock(ptr):
+        new = ptr.data_type(int(ptr.read()) & int(value))
+        ptr.write(new)
+
+    return new
+
+
+def or_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Or the value and return the new one."""
+    with get_lock(ptr):
+        new = ptr.data_type(int(ptr.read()) | int(value))
+        ptr.write(new)
+
+    return new
+
+
+def xor_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Xor the value and return the new one."""
+    with get_lock(ptr):
+        new = ptr.data_type(int(ptr.read()) ^ int(value))
+        ptr.write(new)
+
+    return new
+
+
+def nand_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Replace the value with ``~(value & v)`` and return the new one."""
+    with get_lock(ptr):
+        new = ptr.data_type(~(int(ptr.read()) & int(value)))
+        ptr.write(new)
+
+    return new
@@ -0,0 +1,165 @@
+"""Coalesce concurrent calls of a ported routine into batches.
+
+``Batcher`` buffers calls from asyncio tasks for a short delay or up to a batch
+size, evaluates them with one call of a batch function, and resolves the
+result of each call::
+
+    def decode_batch(tokens):
+        # Decode all tokens at once, for example with NumPy arrays.
+        ...
+
+    batcher = Batcher(decode_batch, max_size=256, delay=0.002)
+
+    async def handle(token):
+        return await batcher(token)
+"""
+
+import asyncio
+from concurrent.futures import Executor
+from typing import Any, Callable, List, Optional, Sequence, Set
+
+
+def _evaluate(func: Callable[[Any], Sequence[Any]], items: List[Any], dtype: Any):
+    """Evaluate a batch, it is a function so that it can run in processes."""
+    if dtype is None:
+        results = list(func(items))
+
+    else:
+        import numpy as np
+
+        results = np.asarray(func(np.array(items, dtype=dtype))).tolist()
+
+    if len(results) != len(items):
+        raise ValueError(
+            "Batch function returned %d results for %d items"
+            % (len(results), len(items))
+        )
+
+    return results
+
+
+class Batcher:
+    """Evaluate concurrent calls in batches.
+
+    Args:
+        func: Called with a list of items, returns a sequence of results in the
+            same order.
+        max_size: Evaluate a batch once it has this many items.
+        delay: Evaluate a batch this many seconds after its first item, if it
+            doesn't fill up before.
+        executor: Evaluate batches in this executor, such as a
+            ``ProcessPoolExecutor``. By default, they are evaluated in the event
+            loop.
+        dtype: If it is given, items are passed to ``func`` as a NumPy array of
+            this type, and the returned array is converted to a list.
+    """
+
+    def __init__(
+        self,
+        func: Callable[[Any], Sequence[Any]],
+        max_size: int = 1024,
+        delay: float = 0.001,
+        executor: Optional[Executor] = None,
+        dtype: Any = None,
+    ):
+        self.func = func
+        self.max_size = max_size
+        self.delay = delay
+        self.executor = executor
+        self.dtype = dtype
+
+        self._items: List[Any] = []
+        self._futures: List["asyncio.Future[Any]"] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+
+        # Batches being evaluated in the executor.
+        self._running: Set["asyncio.Future[Any]"] = set()
+
+    async def __call__(self, item: Any) -> Any:
+        """Evaluate an item in a batch."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        self._items.append(item)
+        self._futures.append(future)
+
+        if len(self._items) >= self.max_size:
+            self._flush()
+
+        elif self._timer is None:
+            self._timer = loop.call_later(self.delay, self._flush)
+
+        return await future
+
+    async def __aenter__(self) -> "Batcher":
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.flush()
+
+    def _flush(self):
+        """Evaluate buffered items."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        items, futures = self._items, self._futures
+        self._items, self._futures = [], []
+
+        if not items:
+            return
+
+        if self.executor is None:
+            try:
+                results = _evaluate(self.func, items, self.dtype)
+            except Exception as e:
+                self._resolve(futures, None, e)
+            else:
+                self._resolve(futures, results, None)
+
+            return
+
+        loop = asyncio.get_running_loop()
+        batch = loop.run_in_executor(
+            self.executor, _evaluate, self.func, items, self.dtype
+        )
+        self._running.add(batch)
+
+        def done(batch: "asyncio.Future[Any]"):
+            self._running.discard(batch)
+
+            if batch.cancelled():
+                for future in futures:
+                    future.cancel()
+
+            elif batch.exception() is not None:
+                self._resolve(futures, None, batch.exception())
+
+            else:
+                self._resolve(futures, batch.result(), None)
+
+        batch.add_done_callback(done)
+
+    @staticmethod
+    def _resolve(
+        futures: List["asyncio.Future[Any]"],
+        results: Optional[List[Any]],
+        exception: Optional[BaseException],
+    ):
+        for i, future in enumerate(futures):
+            # The caller may be cancelled while waiting.
+            if future.done():
+                continue
+
+            if exception is not None:
+                future.set_exception(exception)
+            else:
+                assert results is not None
+                future.set_result(results[i])
+
+    async def flush(self):
+        """Evaluate buffered items now and wait for all running batches."""
+        self._flush()
+
+        if self._running:
+            await asyncio.wait(list(self._running))
@@ -0,0 +1,165 @@
+"""Extract and insert bit fields of integers.
+
+Decompiled code accesses packed fields with shifts and masks, such as
+``(x >> 11) & 0x1F``. ``extract`` and ``insert`` do them in one operation on
+``int``, and ``Bitfield`` declares a layout of fields over an integer or a
+virtual pointer::
+
+    class Header(Bitfield):
+        data_type = UInt16
+
+        kind = Field(0, 3)
+        flag = Field(3, 1)
+        length = Field(11, 5)
+
+    header = Header(vptr(data).add(4))
+    header.length += 1
+"""
+
+from typing import Any, ClassVar, Dict, Optional, SupportsInt, Type, TypeVar, Union
+
+from .integer import Integer, UInt32, get_type_size
+from .virtual_pointer import VirtualPointer
+
+_T = TypeVar("_T", bound=SupportsInt)
+
+
+def extract(x: _T, lo: int, width: int) -> _T:
+    """Get ``width`` bits of ``x`` from bit ``lo``.
+
+    The result is of the type of ``x``, same as ``(x >> lo) & mask``.
+    """
+    value = (int(x) >> lo) & ((1 << width) - 1)
+    return type(x)(value)  # type: ignore
+
+
+def insert(x: _T, lo: int, width: int, value: SupportsInt) -> _T:
+    """Replace ``width`` bits of ``x`` from bit ``lo`` with ``value``.
+
+    The result is of the type of ``x``.
+    """
+    mask = ((1 << width) - 1) << lo
+    return type(x)((int(x) & ~mask) | ((int(value) << lo) & mask))  # type: ignore
+
+
+class Field:
+    """A field of a ``Bitfield`` layout.
+
+    Values of a field are ``int``.
+
+    Args:
+        lo: The index of the lowest bit.
+        width: The number of bits.
+        signed: Sign extend values when they are read.
+    """
+
+    def __init__(self, lo: int, width: int, signed: bool = False):
+        self.lo = lo
+        self.width = width
+        self.signed = signed
+
+        self.name = ""
+        self.mask = (1 << width) - 1
+        self.sign_bit = 1 << (width - 1) if signed else 0
+        self.modulus = 1 << width
+
+        # Mask of the field in place, and mask of other bits of the layout.
+        self.field_mask = self.mask << lo
+        self.clear_mask = ~self.field_mask
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, obj: "Bitfield", owner: Any = None) -> Any:
+        if obj is None:
+            return self
+
+        value = (obj._load() >> self.lo) & self.mask
+        if value & self.sign_bit:
+            value -= self.modulus
+
+        return value
+
+    def __set__(self, obj: "Bitfield", value: SupportsInt):
+        obj._store(
+            (obj._load() & self.clear_mask)
+            | ((int(value) << self.lo) & self.field_mask)
+        )
+
+
+class Bitfield:
+    """Base class of bit field layouts.
+
+    Subclasses set ``data_type`` and declare ``Field`` attributes. A layout is
+    created over an integer, whose value is kept in the layout, or a virtual
+    pointer, which every access reads and writes through.
+
+    Args:
+        source: The initial value or the pointer to the value.
+        fields: Initial values of fields.
+    """
+
+    data_type: ClassVar[Type[Integer]] = UInt32
+
+    _fields: ClassVar[Dict[str, Field]] = {}
+    _mask: ClassVar[int] = 0xFFFFFFFF
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        nbits = get_type_size(cls.data_type) * 8
+        fields = dict(cls._fields)
+
+        for name, value in vars(cls).items():
+            if isinstance(value, Field):
+                if value.lo < 0 or value.width <= 0 or value.lo + value.width > nbits:
+                    raise ValueError("Field out of range: %s" % name)
+
+                fields[name] = value
+
+        cls._fields = fields
+        cls._mask = (1 << nbits) - 1
+
+    def __init__(
+        self, source: Union[SupportsInt, VirtualPointer] = 0, **fields: SupportsInt
+    ):
+        self._ptr: Optional[VirtualPointer]
+
+        if isinstance(source, VirtualPointer):
+            self._ptr = source.cast(self.data_type)
+            self._value = 0
+        else:
+            self._ptr = None
+            self._value = int(source) & self._mask
+
+        for name, value in fields.items():
+            if name not in self._fields:
+                raise AttributeError("Unknown field: %s" % name)
+
+            setattr(self, name, value)
+
+    def _load(self) -> int:
+        if self._ptr is None:
+            return self._value
+
+        return int(self._ptr.read()) & self._mask
+
+    def _store(self, value: int):
+        if self._ptr is None:
+            self._value = value
+        else:
+            self._ptr.write(value)
+
+    @property
+    def value(self) -> Integer:
+        """The whole value of the layout."""
+        return self.data_type(self._load())
+
+    def __int__(self) -> int:
+        return self._load()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            "%s=%d" % (name, getattr(self, name)) for name in self._fields
+        )
+        return "%s(%s)" % (self.__class__.__name__, fields)
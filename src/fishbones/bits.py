@@ -0,0 +1,89 @@
+"""Count and scan bits of integers and arrays of them.
+
+``bit_count`` counts set bits of an ``int`` with ``int.bit_count`` where it is
+available (Python 3.10 and later), or a table of bytes otherwise. Builtins
+such as ``clz`` and ``popcount`` of IDA and ``lzcount`` of Ghidra are built on
+it.
+
+Functions with the ``_array`` suffix compute the same over NumPy arrays, lane
+by lane at the width of the array's dtype::
+
+    counts = popcount_array(np.array(values, dtype=np.uint32))
+
+They require NumPy, which is installed with ``fishbones[simd]``.
+"""
+
+from typing import Any, Callable
+
+# Set bits of every byte.
+_BYTE_COUNTS = bytes(bin(i).count("1") for i in range(256))
+
+
+def _table_bit_count(value: int) -> int:
+    value = abs(value)
+    data = value.to_bytes((value.bit_length() + 7) // 8, "little")
+    return sum(_BYTE_COUNTS[b] for b in data)
+
+
+# Count set bits of the absolute value of an ``int``.
+bit_count: Callable[[int], int]
+
+if hasattr(int, "bit_count"):
+    bit_count = int.bit_count
+else:  # pragma: no cover
+    bit_count = _table_bit_count
+
+
+def _unsigned(values: Any) -> Any:
+    """Get values as an array of unsigned integers of the same width."""
+    import numpy as np
+
+    values = np.asarray(values)
+    if values.dtype.kind not in "iu":
+        raise TypeError("Array of integers required")
+
+    return values.astype(np.dtype("u%d" % values.dtype.itemsize))
+
+
+def _popcount_unsigned(values: Any) -> Any:
+    import numpy as np
+
+    if hasattr(np, "bitwise_count"):
+        return np.bitwise_count(values).astype(np.intp)
+
+    table = np.frombuffer(_BYTE_COUNTS, dtype=np.uint8)
+    counts = table[values.reshape(-1, 1).view(np.uint8)]
+    return counts.sum(axis=1, dtype=np.intp).reshape(values.shape)
+
+
+def popcount_array(values: Any) -> Any:
+    """Count set bits of every value."""
+    return _popcount_unsigned(_unsigned(values))
+
+
+def parity_array(values: Any) -> Any:
+    """Get 1 for every value with an odd number of set bits, or 0."""
+    return popcount_array(values) & 1
+
+
+def clz_array(values: Any) -> Any:
+    """Count leading zero bits of every value, zero has as many as its width."""
+    values = _unsigned(values)
+    nbits = values.dtype.itemsize * 8
+
+    # Set all bits below the highest set bit, then count them.
+    smeared = values.copy()
+    shift = 1
+    while shift < nbits:
+        smeared |= smeared >> shift
+        shift <<= 1
+
+    return nbits - _popcount_unsigned(smeared)
+
+
+def ctz_array(values: Any) -> Any:
+    """Count trailing zero bits of every value, zero has as many as its width."""
+    values = _unsigned(values)
+
+    # Bits below the lowest set bit, all bits if it is zero.
+    return _popcount_unsigned((values & (~values + 1)) - 1)
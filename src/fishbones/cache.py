@@ -0,0 +1,215 @@
+"""Cache tables built by ported initialisation routines on disk.
+
+Routines which build lookup tables, such as CRC tables, S-boxes and key
+schedules, may take seconds when they are run with integer types. Decorate
+them with ``cached_table`` to store their output buffers in a file, which is
+read instead of running them again::
+
+    @cached_table
+    def make_crc_table(poly):
+        table = vptr(bytearray(1024), UInt32)
+        ...
+        return table
+
+The cache is keyed by the name and source of the function and the arguments
+of the call. Arguments must be ``None``, ``bool``, ``int``, ``str``,
+``bytes``, integer types or tuples of them, whose keys are the same between
+runs. Integer types are keyed by their type and value. Other arguments raise
+``TypeError``.
+"""
+
+import functools
+import hashlib
+import inspect
+import mmap
+import os
+import struct
+import sys
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, Union
+
+from .integer import Integer, UInt8
+from .virtual_pointer import VirtualPointer
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+# Magic and version of cache files.
+_MAGIC = b"FBTABLE\0"
+_VERSION = 1
+
+_HEADER = struct.Struct("<8sHHH")
+_ENTRY = struct.Struct("<QQ")
+
+# Buffers are aligned in cache files.
+_ALIGNMENT = 16
+
+# Types of arguments which are keyed by themselves.
+_KEY_TYPES = (type(None), bool, int, str, bytes)
+
+# Mappings don't keep a descriptor of the file open where it is supported.
+_MMAP_KWARGS: Dict[str, Any] = {"trackfd": False} if sys.version_info >= (3, 13) else {}
+
+
+def get_cache_dir() -> str:
+    """Get the default directory of cache files.
+
+    It is ``$FISHBONES_CACHE_DIR`` if it is set, or ``~/.cache/fishbones``.
+    """
+    return os.environ.get("FISHBONES_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "fishbones"
+    )
+
+
+def _source_hash(func: Callable[..., Any]) -> str:
+    try:
+        source = inspect.getsource(func).encode()
+    except (OSError, TypeError):
+        source = func.__code__.co_code
+
+    return hashlib.sha256(source).hexdigest()
+
+
+def _key(value: Any) -> Any:
+    """Get a key of an argument which is the same between runs."""
+    if isinstance(value, Integer):
+        return type(value).__name__, int(value)
+
+    if isinstance(value, tuple):
+        return "tuple", [_key(v) for v in value]
+
+    if isinstance(value, _KEY_TYPES):
+        return value
+
+    raise TypeError("Unsupported argument type: %s" % type(value).__name__)
+
+
+def _to_buffer(value: Any) -> Tuple[str, bytes]:
+    """Get the type name and data of an output buffer."""
+    if isinstance(value, VirtualPointer):
+        data_type = value.data_type.__name__.lower()
+        return data_type, bytes(value.source[value.offset :])
+
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return UInt8.__name__.lower(), bytes(value)
+
+    raise TypeError("Output must be VirtualPointer or bytes-like object")
+
+
+def _write(path: str, buffers: List[Tuple[str, bytes]], is_tuple: bool):
+    header = bytearray(_HEADER.pack(_MAGIC, _VERSION, is_tuple, len(buffers)))
+
+    for type_name, _ in buffers:
+        data = type_name.encode()
+        header += bytes([len(data)]) + data
+
+    base = len(header) + _ENTRY.size * len(buffers)
+    entries = bytearray()
+    contents = bytearray()
+
+    for _, data in buffers:
+        offset = (base + len(contents) + _ALIGNMENT - 1) & -_ALIGNMENT
+        contents += bytes(offset - base - len(contents))
+        entries += _ENTRY.pack(offset, len(data))
+        contents += data
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Write a temporary file first, so readers never see a partial file. Its
+    # name is unique to the thread, threads may build the same table at once.
+    temp_path = "%s.%d.%d.tmp" % (path, os.getpid(), threading.get_ident())
+    with open(temp_path, "wb") as f:
+        f.write(header + entries + contents)
+
+    os.replace(temp_path, path)
+
+
+def _read(path: str) -> Union[VirtualPointer, Tuple[VirtualPointer, ...]]:
+    with open(path, "rb") as f:
+        # Writes go to private copies of pages, they don't change the file or
+        # results of other calls.
+        data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_COPY, **_MMAP_KWARGS)
+
+    magic, version, is_tuple, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC or version != _VERSION:
+        raise ValueError("Invalid cache file")
+
+    position = _HEADER.size
+    type_names = []
+    for _ in range(count):
+        size = data[position]
+        type_names.append(data[position + 1 : position + 1 + size].decode())
+        position += 1 + size
+
+    # Pointers hold the only references to the mapping, through views of it.
+    # It is closed once they are garbage collected.
+    view = memoryview(data)
+    pointers = []
+    for i, type_name in enumerate(type_names):
+        offset, size = _ENTRY.unpack_from(data, position + i * _ENTRY.size)
+        source = view[offset : offset + size]
+        pointers.append(
+            VirtualPointer(source=source, data_type=type_name)  # type: ignore
+        )
+
+    return tuple(pointers) if is_tuple else pointers[0]
+
+
+def cached_table(
+    func: Optional[_F] = None, *, directory: Optional[str] = None
+) -> Union[_F, Callable[[_F], _F]]:
+    """Cache output buffers of a function in files.
+
+    The function returns a ``VirtualPointer`` or a bytes-like object, or a
+    tuple of them. The decorated function always returns ``VirtualPointer``
+    over a copy-on-write memory mapping of the cache file in the same
+    structure, with the data type of the original pointer. Writes through them
+    are not saved to the file. The mapping is closed once the pointers are
+    garbage collected.
+
+    The decorated function has a ``cache_path`` method which returns the path
+    of the cache file of a call.
+
+    Args:
+        func: The function to decorate.
+        directory: The directory of cache files, see ``get_cache_dir``.
+    """
+
+    def decorator(func: _F) -> _F:
+        name = "%s.%s" % (func.__module__, func.__qualname__)
+        source_hash = _source_hash(func)
+
+        def cache_path(*args, **kwargs) -> str:
+            key = repr(
+                (
+                    name,
+                    source_hash,
+                    _key(args),
+                    sorted((k, _key(v)) for k, v in kwargs.items()),
+                )
+            )
+            digest = hashlib.sha256(key.encode()).hexdigest()[:32]
+            return os.path.join(
+                directory or get_cache_dir(), "%s-%s.fbt" % (name, digest)
+            )
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            path = cache_path(*args, **kwargs)
+
+            if not os.path.exists(path):
+                result = func(*args, **kwargs)
+
+                if isinstance(result, tuple):
+                    _write(path, [_to_buffer(v) for v in result], True)
+                else:
+                    _write(path, [_to_buffer(result)], False)
+
+            return _read(path)
+
+        wrapper.cache_path = cache_path  # type: ignore
+        return wrapper  # type: ignore
+
+    if func is None:
+        return decorator
+
+    return decorator(func)
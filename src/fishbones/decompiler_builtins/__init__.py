@@ -0,0 +1,59 @@
+"""Implement functions which are used in decompiled code.
+
+Submodules are imported on first access.
+"""
+
+import importlib
+import sys
+from types import CodeType, ModuleType
+from typing import Any, Callable, Dict
+
+_SUBMODULES = ("ida", "ghidra")
+
+# Code objects of functions built on access, mapped to their names. Profilers
+# identify these functions by their code objects.
+_built_codes: Dict[CodeType, str] = {}
+
+
+def _rename_code(code: CodeType, name: str) -> CodeType:
+    """Copy a code object with another name."""
+    if sys.version_info >= (3, 8):
+        return code.replace(co_name=name)
+
+    return CodeType(
+        code.co_argcount,
+        code.co_kwonlyargcount,
+        code.co_nlocals,
+        code.co_stacksize,
+        code.co_flags,
+        code.co_code,
+        code.co_consts,
+        code.co_names,
+        code.co_varnames,
+        code.co_filename,
+        name,
+        code.co_firstlineno,
+        code.co_lnotab,
+        code.co_freevars,
+        code.co_cellvars,
+    )
+
+
+def _name_built(func: Callable[..., Any], name: str):
+    """Name a function built on access and register its code object.
+
+    Every function gets its own code object, so that profilers and tracebacks
+    show its name.
+    """
+    func.__name__ = func.__qualname__ = name
+    func.__doc__ = "Implementation of `%s`." % name.upper()
+    func.__code__ = _rename_code(func.__code__, name)
+
+    _built_codes[func.__code__] = name
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name in _SUBMODULES:
+        return importlib.import_module("." + name, __name__)
+
+    raise AttributeError("module %r has no attribute %r" % (__name__, name))
@@ -1,156 +1,245 @@
-"""Implement functions which are used in the code decompiled by Ghidra."""
-
-from ..integer import Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64
-from .ida import truncate, zero_extend, sign_extend, ofsub, ofadd, cfadd
+"""Implement functions which are used in the code decompiled by Ghidra.
+
+Ghidra names its functions after the sizes of operands, such as ``SUB42`` and
+``CONCAT44``. Instead of defining every combination, functions are built on
+first access with their constants folded in and cached in this module. For
+example, ``sub42`` takes 2 bytes from a 4 bytes value, and ``concat44`` joins
+two 4 bytes values.
+
+Sizes without a matching integer type, such as the 3 bytes result of ``SUB53``,
+are returned in the next larger unsigned type.
+"""
+
+import re
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
+
+from ..bits import bit_count
+from ..integer import (
+    Integer,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
+    UInt128,
+    get_type_size,
+)
+from . import _name_built
 
 # Refer to https://github.com/NationalSecurityAgency/ghidra/blob/master/Ghidra/Features/Decompiler/src/main/help/help/topics/DecompilePlugin/DecompilerConcepts.html    # noqa: E501
 
+MAX_SIZE = 16
+
+_TWO_SIZES_KINDS = ("sub", "zext", "sext", "concat")
+_ONE_SIZE_KINDS = ("carry", "scarry", "sborrow")
+
+_TWO_SIZES_PATTERN = re.compile(r"(%s)(\d+)$" % "|".join(_TWO_SIZES_KINDS))
+_ONE_SIZE_PATTERN = re.compile(r"(%s)(\d+)$" % "|".join(_ONE_SIZE_KINDS))
+
+
+def _result_type(size: int) -> Type[Integer]:
+    for int_type in (UInt8, UInt16, UInt32, UInt64, UInt128):
+        if get_type_size(int_type) >= size:
+            return int_type
+
+    raise ValueError("No matched type")
+
+
+def _split_sizes(kind: str, digits: str) -> Optional[Tuple[int, int]]:
+    """Split the digits of a name into two sizes.
+
+    The first valid split is used, so ``sub168`` is ``SUB`` of 16 and 8 bytes.
+    """
+    for i in range(1, len(digits)):
+        left, right = digits[:i], digits[i:]
+        if left.startswith("0") or right.startswith("0"):
+            continue
 
-def sub21(x: UInt16, c: int) -> UInt8:
-    """Implementation of `SUB21`."""
-    return truncate(x, c, UInt8)
+        size1, size2 = int(left), int(right)
+        if size1 > MAX_SIZE or size2 > MAX_SIZE:
+            continue
 
+        if kind == "sub" and size2 > size1:
+            continue
 
-def sub41(x: UInt32, c: int) -> UInt8:
-    """Implementation of `SUB41`."""
-    return truncate(x, c, UInt8)
+        if kind in ("zext", "sext") and size2 < size1:
+            continue
 
+        return size1, size2
 
-def sub42(x: UInt32, c: int) -> UInt16:
-    """Implementation of `SUB42`."""
-    return truncate(x, c, UInt16)
+    return None
 
 
-def sub81(x: UInt64, c: int) -> UInt8:
-    """Implementation of `SUB81`."""
-    return truncate(x, c, UInt8)
+def _build_sub(in_size: int, out_size: int) -> Callable[..., Integer]:
+    result_type = _result_type(out_size)
+    in_mask = (1 << in_size * 8) - 1
+    out_mask = (1 << out_size * 8) - 1
 
+    def func(x, c):
+        return result_type(((int(x) & in_mask) >> (c * 8)) & out_mask)
 
-def sub82(x: UInt64, c: int) -> UInt16:
-    """Implementation of `SUB82`."""
-    return truncate(x, c, UInt16)
+    return func
 
 
-def sub84(x: UInt64, c: int) -> UInt32:
-    """Implementation of `SUB84`."""
-    return truncate(x, c, UInt32)
+def _build_zext(in_size: int, out_size: int) -> Callable[..., Integer]:
+    result_type = _result_type(out_size)
+    in_mask = (1 << in_size * 8) - 1
 
+    def func(x):
+        return result_type(int(x) & in_mask)
 
-def zext12(x: UInt8) -> UInt16:
-    """Implementation of `ZEXT12`."""
-    return zero_extend(x, UInt16)
+    return func
 
 
-def zext14(x: UInt8) -> UInt32:
-    """Implementation of `ZEXT14`."""
-    return zero_extend(x, UInt32)
+def _build_sext(in_size: int, out_size: int) -> Callable[..., Integer]:
+    result_type = _result_type(out_size)
+    in_mask = (1 << in_size * 8) - 1
+    sign_bit = 1 << (in_size * 8 - 1)
+    extension = ((1 << out_size * 8) - 1) & ~in_mask
 
+    def func(x):
+        value = int(x) & in_mask
+        if value & sign_bit:
+            value |= extension
+        return result_type(value)
 
-def zext18(x: UInt8) -> UInt64:
-    """Implementation of `ZEXT18`."""
-    return zero_extend(x, UInt64)
+    return func
 
 
-def zext24(x: UInt16) -> UInt32:
-    """Implementation of `ZEXT24`."""
-    return zero_extend(x, UInt32)
+def _build_concat(high_size: int, low_size: int) -> Callable[..., Integer]:
+    result_type = _result_type(high_size + low_size)
+    high_mask = (1 << high_size * 8) - 1
+    low_mask = (1 << low_size * 8) - 1
+    low_bits = low_size * 8
 
+    def func(x, y):
+        return result_type(((int(x) & high_mask) << low_bits) | (int(y) & low_mask))
 
-def zext28(x: UInt16) -> UInt64:
-    """Implementation of `ZEXT28`."""
-    return zero_extend(x, UInt64)
+    return func
 
 
-def zext48(x: UInt32) -> UInt64:
-    """Implementation of `ZEXT48`."""
-    return zero_extend(x, UInt64)
+def _build_carry(size: int) -> Callable[..., int]:
+    mask = (1 << size * 8) - 1
+    nbits = size * 8
 
+    def func(x, y):
+        return ((int(x) & mask) + (int(y) & mask)) >> nbits
 
-def sext12(x: UInt8) -> UInt16:
-    """Implementation of `SEXT12`."""
-    return sign_extend(x, UInt16)
+    return func
 
 
-def sext14(x: UInt8) -> UInt32:
-    """Implementation of `SEXT14`."""
-    return sign_extend(x, UInt32)
+def _build_scarry(size: int) -> Callable[..., int]:
+    mask = (1 << size * 8) - 1
+    sign_shift = size * 8 - 1
 
+    def func(x, y):
+        ux = int(x) & mask
+        uy = int(y) & mask
+        r = (ux + uy) & mask
+        return (((ux ^ r) & (uy ^ r)) >> sign_shift) & 1
 
-def sext18(x: UInt8) -> UInt64:
-    """Implementation of `SEXT18`."""
-    return sign_extend(x, UInt64)
+    return func
 
 
-def sext24(x: UInt16) -> UInt32:
-    """Implementation of `SEXT24`."""
-    return sign_extend(x, UInt32)
+def _build_sborrow(size: int) -> Callable[..., int]:
+    mask = (1 << size * 8) - 1
+    sign_shift = size * 8 - 1
 
+    def func(x, y):
+        ux = int(x) & mask
+        uy = int(y) & mask
+        r = (ux - uy) & mask
+        return (((ux ^ uy) & (ux ^ r)) >> sign_shift) & 1
 
-def sext28(x: UInt16) -> UInt64:
-    """Implementation of `SEXT28`."""
-    return sign_extend(x, UInt64)
+    return func
 
 
-def sext48(x: UInt32) -> UInt64:
-    """Implementation of `SEXT48`."""
-    return sign_extend(x, UInt64)
+def lzcount(x: Integer) -> int:
+    """Implementation of `LZCOUNT`.
 
+    Bits are counted at the width of ``x``, zero has as many as its width.
+    """
+    return x._size * 8 - (int(x) & x._mask).bit_length()
 
-def sborrow1(x: UInt8, y: UInt8) -> int:
-    """Implementation of `SBORROW1`."""
-    return ofsub(x, y)
 
+def popcount(x: Integer) -> int:
+    """Implementation of `POPCOUNT`."""
+    return bit_count(int(x) & x._mask)
 
-def sborrow2(x: UInt16, y: UInt16) -> int:
-    """Implementation of `SBORROW2`."""
-    return ofsub(x, y)
 
+_BUILDERS: Dict[str, Callable[..., Callable[..., Any]]] = {
+    "sub": _build_sub,
+    "zext": _build_zext,
+    "sext": _build_sext,
+    "concat": _build_concat,
+    "carry": _build_carry,
+    "scarry": _build_scarry,
+    "sborrow": _build_sborrow,
+}
 
-def sborrow4(x: UInt32, y: UInt32) -> int:
-    """Implementation of `SBORROW4`."""
-    return ofsub(x, y)
 
+def _build(name: str) -> Optional[Callable[..., Any]]:
+    match = _TWO_SIZES_PATTERN.match(name)
+    if match:
+        kind = match.group(1)
+        sizes = _split_sizes(kind, match.group(2))
+        if sizes is None:
+            return None
 
-def sborrow8(x: UInt64, y: UInt64) -> int:
-    """Implementation of `SBORROW8`."""
-    return ofsub(x, y)
+        try:
+            func = _BUILDERS[kind](*sizes)
+        except ValueError:
+            return None
 
+    else:
+        match = _ONE_SIZE_PATTERN.match(name)
+        if not match:
+            return None
 
-def carry1(x: UInt8, y: UInt8) -> int:
-    """Implementation of `CARRY1`."""
-    return cfadd(x, y)
+        kind = match.group(1)
+        size = int(match.group(2))
+        if not 0 < size <= MAX_SIZE:
+            return None
 
+        func = _BUILDERS[kind](size)
 
-def carry2(x: UInt16, y: UInt16) -> int:
-    """Implementation of `CARRY2`."""
-    return cfadd(x, y)
+    func.__module__ = __name__
+    _name_built(func, name)
+    return func
 
 
-def carry4(x: UInt32, y: UInt32) -> int:
-    """Implementation of `CARRY4`."""
-    return cfadd(x, y)
+def _names() -> List[str]:
+    """Get names of all functions which can be built."""
+    names = []
 
+    for kind in _TWO_SIZES_KINDS:
+        for size1 in range(1, MAX_SIZE + 1):
+            for size2 in range(1, MAX_SIZE + 1):
+                if kind == "concat" and size1 + size2 > MAX_SIZE:
+                    continue
 
-def carry8(x: UInt64, y: UInt64) -> int:
-    """Implementation of `CARRY8`."""
-    return cfadd(x, y)
+                # Skip names which are read as other sizes, such as ``sub111``.
+                if _split_sizes(kind, "%d%d" % (size1, size2)) == (size1, size2):
+                    names.append("%s%d%d" % (kind, size1, size2))
 
+    for kind in _ONE_SIZE_KINDS:
+        names.extend("%s%d" % (kind, size) for size in range(1, MAX_SIZE + 1))
 
-def scarry1(x: Int8, y: Int8) -> int:
-    """Implementation of `SCARRY1`."""
-    return ofadd(x, y)
+    return names
 
 
-def scarry2(x: Int16, y: Int16) -> int:
-    """Implementation of `SCARRY2`."""
-    return ofadd(x, y)
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_names()))
 
 
-def scarry4(x: Int32, y: Int32) -> int:
-    """Implementation of `SCARRY4`."""
-    return ofadd(x, y)
+def __getattr__(name: str) -> Any:
+    # Names are listed on first access too, star imports build every function.
+    if name == "__all__":
+        globals()[name] = ["lzcount", "popcount"] + _names()
+        return globals()[name]
 
+    func = _build(name)
+    if func is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
-def scarry8(x: Int64, y: Int64) -> int:
-    """Implementation of `SCARRY8`."""
-    return ofadd(x, y)
+    globals()[name] = func
+    return func
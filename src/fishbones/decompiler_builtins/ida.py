@@ -1,21 +1,38 @@
 """Implement functions which are used in the code decompiled by IDA."""
 
 import sys
-from typing import Type, TypeVar
+from functools import lru_cache
+from typing import (
+    Any,
+    Callable,
+    List,
+    NamedTuple,
+    Optional,
+    SupportsInt,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
+from .. import atomic
+from ..bits import bit_count
 from ..consts import BIG_ENDIAN, LITTLE_ENDIAN
 from ..integer import (
+    _div,
+    _mod,
     Integer,
     Int8,
     Int16,
     Int32,
+    Int64,
     UInt8,
     UInt16,
     UInt32,
     UInt64,
     get_type_size,
 )
-
+from ..virtual_pointer import VirtualPointer
+from . import _name_built
 
 if sys.version_info >= (3, 8):
     from typing import Literal
@@ -26,26 +43,67 @@ else:
 _T = TypeVar("_T", bound=Integer)
 
 
+class ArithmeticResult(NamedTuple):
+    """Result of an arithmetic operation with its flags.
+
+    Attributes:
+        value: The wrapped result.
+        cf: Carry flag.
+        of: Overflow flag.
+        sf: Sign flag.
+        zf: Zero flag.
+    """
+
+    value: Integer
+    cf: int
+    of: int
+    sf: int
+    zf: int
+
+
 # Refer to defs.h of IDA.
 
 
+@lru_cache(maxsize=None)
+def _extend_constants(
+    from_type: Type[Integer], to_type: Type[Integer]
+) -> Tuple[int, int, int]:
+    """Get constants to truncate or extend ``from_type`` to ``to_type``."""
+    from_bits = get_type_size(from_type) * 8
+    to_bits = get_type_size(to_type) * 8
+
+    mask = (1 << from_bits) - 1
+    sign_bit = 1 << (from_bits - 1)
+    extension = ((1 << to_bits) - 1) & ~mask
+    return mask, sign_bit, extension
+
+
+@lru_cache(maxsize=None)
+def _width_constants(data_type: Type[Integer]) -> Tuple[int, int]:
+    """Get mask and index of sign bit of ``data_type``."""
+    nbits = get_type_size(data_type) * 8
+    return (1 << nbits) - 1, nbits - 1
+
+
 def truncate(x: Integer, c: int, to_type: Type[_T]) -> _T:
     """Truncate."""
-    data = x.to_bytes()
-    to_size = get_type_size(to_type)
-    return to_type.from_bytes(data[c : c + to_size])
+    mask = _extend_constants(type(x), to_type)[0]
+    return to_type((int(x) & mask) >> (c * 8))
 
 
 def zero_extend(x: Integer, to_type: Type[_T]) -> _T:
     """Zero extend."""
-    return to_type.from_bytes(x.to_bytes())
+    mask = _extend_constants(type(x), to_type)[0]
+    return to_type(int(x) & mask)
 
 
 def sign_extend(x: Integer, to_type: Type[_T]) -> _T:
     """Sign extend."""
-    t1 = Integer.get_type(size=x.size, signed=True)
-    t2 = Integer.get_type(size=get_type_size(to_type), signed=True)
-    return to_type.from_bytes(t2.from_bytes(t1(x).to_bytes()).to_bytes())
+    mask, sign_bit, extension = _extend_constants(type(x), to_type)
+    value = int(x) & mask
+    if value & sign_bit:
+        value |= extension
+    return to_type(value)
 
 
 def last_ind(x: Integer, part_type: Type[Integer]) -> int:
@@ -116,423 +174,560 @@ def hidword(x: Integer) -> UInt32:
     return dwordn(x, high_ind(x, UInt32))
 
 
-def byte1(x: Integer) -> UInt8:
-    """Implementation of `BYTE1`."""
-    return byten(x, 1)
+def sbyten(x: Integer, n: int) -> Int8:
+    """Implementation of `SBYTEn`."""
+    return truncate(x, n * 1, Int8)
 
 
-def byte2(x: Integer) -> UInt8:
-    """Implementation of `BYTE2`."""
-    return byten(x, 2)
+def swordn(x: Integer, n: int) -> Int16:
+    """Implementation of `SWORDn`."""
+    return truncate(x, n * 2, Int16)
 
 
-def byte3(x: Integer) -> UInt8:
-    """Implementation of `BYTE3`."""
-    return byten(x, 3)
+def sdwordn(x: Integer, n: int) -> Int32:
+    """Implementation of `SDWORDn`."""
+    return truncate(x, n * 4, Int32)
 
 
-def byte4(x: Integer) -> UInt8:
-    """Implementation of `BYTE4`."""
-    return byten(x, 4)
+def slobyte(x: Integer) -> Int8:
+    """Implementation of `SLOBYTE`."""
+    return sbyten(x, low_ind(x, Int8))
 
 
-def byte5(x: Integer) -> UInt8:
-    """Implementation of `BYTE5`."""
-    return byten(x, 5)
+def sloword(x: Integer) -> Int16:
+    """Implementation of `SLOWORD`."""
+    return swordn(x, low_ind(x, Int16))
 
 
-def byte6(x: Integer) -> UInt8:
-    """Implementation of `BYTE6`."""
-    return byten(x, 6)
+def slodword(x: Integer) -> Int32:
+    """Implementation of `SLODWORD`."""
+    return sdwordn(x, low_ind(x, Int32))
 
 
-def byte7(x: Integer) -> UInt8:
-    """Implementation of `BYTE7`."""
-    return byten(x, 7)
+def shibyte(x: Integer) -> Int8:
+    """Implementation of `SHIBYTE`."""
+    return sbyten(x, high_ind(x, Int8))
 
 
-def byte8(x: Integer) -> UInt8:
-    """Implementation of `BYTE8`."""
-    return byten(x, 8)
+def shiword(x: Integer) -> Int16:
+    """Implementation of `SHIWORD`."""
+    return swordn(x, high_ind(x, Int16))
 
 
-def byte9(x: Integer) -> UInt8:
-    """Implementation of `BYTE9`."""
-    return byten(x, 9)
+def shidword(x: Integer) -> Int32:
+    """Implementation of `SHIDWORD`."""
+    return sdwordn(x, high_ind(x, Int32))
 
 
-def byte10(x: Integer) -> UInt8:
-    """Implementation of `BYTE10`."""
-    return byten(x, 10)
+# Numbered functions, such as `BYTE1` and `SDWORD3`, are built on first access,
+# with their shift and mask folded in. Prefixes are mapped to types of result.
+_NUMBERED_FUNCTIONS = {
+    "byte": UInt8,
+    "word": UInt16,
+    "dword": UInt32,
+    "sbyte": Int8,
+    "sword": Int16,
+    "sdword": Int32,
+}
 
 
-def byte11(x: Integer) -> UInt8:
-    """Implementation of `BYTE11`."""
-    return byten(x, 11)
+def _build_numbered(name: str) -> Optional[Callable[[Integer], Integer]]:
+    prefix = name.rstrip("0123456789")
+    digits = name[len(prefix) :]
 
+    result_type = _NUMBERED_FUNCTIONS.get(prefix)
+    if result_type is None or not digits or digits.startswith("0"):
+        return None
 
-def byte12(x: Integer) -> UInt8:
-    """Implementation of `BYTE12`."""
-    return byten(x, 12)
+    size = get_type_size(result_type)
+    shift = int(digits) * size * 8
+    mask = (1 << size * 8) - 1
 
+    # The widest integer type is 16 bytes.
+    if shift >= 128:
+        return None
 
-def byte13(x: Integer) -> UInt8:
-    """Implementation of `BYTE13`."""
-    return byten(x, 13)
+    def func(x: Integer) -> Integer:
+        return result_type(((int(x) & x._mask) >> shift) & mask)
 
+    _name_built(func, name)
+    return func
 
-def byte14(x: Integer) -> UInt8:
-    """Implementation of `BYTE14`."""
-    return byten(x, 14)
 
+def _numbered_names() -> List[str]:
+    """Get names of all numbered functions."""
+    names: List[str] = []
 
-def byte15(x: Integer) -> UInt8:
-    """Implementation of `BYTE15`."""
-    return byten(x, 15)
+    for prefix, result_type in _NUMBERED_FUNCTIONS.items():
+        # The widest integer type is 16 bytes.
+        count = 16 // get_type_size(result_type)
+        names.extend("%s%d" % (prefix, n) for n in range(1, count))
 
+    return names
 
-def word1(x: Integer) -> UInt16:
-    """Implementation of `WORD1`."""
-    return wordn(x, 1)
 
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_numbered_names()))
 
-def word2(x: Integer) -> UInt16:
-    """Implementation of `WORD2`."""
-    return wordn(x, 2)
 
+def __getattr__(name: str) -> Any:
+    # Star imports provide public names as usual, and build numbered functions.
+    if name == "__all__":
+        public = [key for key in globals() if not key.startswith("_")]
+        globals()[name] = sorted(set(public) | set(_numbered_names()))
+        return globals()[name]
 
-def word3(x: Integer) -> UInt16:
-    """Implementation of `WORD3`."""
-    return wordn(x, 3)
+    func = _build_numbered(name)
+    if func is None:
+        raise AttributeError("module %r has no attribute %r" % (__name__, name))
 
+    globals()[name] = func
+    return func
 
-def word4(x: Integer) -> UInt16:
-    """Implementation of `WORD4`."""
-    return wordn(x, 4)
 
+def pair(high: Integer, low: Integer) -> Integer:
+    """Implementation of `__PAIR__`."""
+    int_type = Integer.get_type(size=high.size * 2, signed=high.signed)
+    return int_type(high) << high.size * 8 | type(high)(low)
 
-def word5(x: Integer) -> UInt16:
-    """Implementation of `WORD5`."""
-    return wordn(x, 5)
 
+def rol(value: Integer, count: int) -> Integer:
+    """Implementation of `__ROL__`."""
+    mask, sign_shift = _width_constants(type(value))
+    nbits = sign_shift + 1
+    v = int(value) & mask
+    count %= nbits
+    return type(value)(((v << count) | (v >> (nbits - count))) & mask)
 
-def word6(x: Integer) -> UInt16:
-    """Implementation of `WORD6`."""
-    return wordn(x, 6)
 
+def ror(value: Integer, count: int) -> Integer:
+    """Implementation of `__ROR__`."""
+    return rol(value, -count)
 
-def word7(x: Integer) -> UInt16:
-    """Implementation of `WORD7`."""
-    return wordn(x, 7)
 
+def rol1(value: UInt8, count: int) -> UInt8:
+    """Implementation of `__ROL1__`."""
+    v = int(value) & 0xFF
+    count &= 7
+    return UInt8(((v << count) | (v >> (8 - count))) & 0xFF)
 
-def dword1(x: Integer) -> UInt32:
-    """Implementation of `DWORD1`."""
-    return dwordn(x, 1)
 
+def rol2(value: UInt16, count: int) -> UInt16:
+    """Implementation of `__ROL2__`."""
+    v = int(value) & 0xFFFF
+    count &= 15
+    return UInt16(((v << count) | (v >> (16 - count))) & 0xFFFF)
 
-def dword2(x: Integer) -> UInt32:
-    """Implementation of `DWORD2`."""
-    return dwordn(x, 2)
 
+def rol4(value: UInt32, count: int) -> UInt32:
+    """Implementation of `__ROL4__`."""
+    v = int(value) & 0xFFFFFFFF
+    count &= 31
+    return UInt32(((v << count) | (v >> (32 - count))) & 0xFFFFFFFF)
 
-def dword3(x: Integer) -> UInt32:
-    """Implementation of `DWORD3`."""
-    return dwordn(x, 3)
 
+def rol8(value: UInt64, count: int) -> UInt64:
+    """Implementation of `__ROL8__`."""
+    v = int(value) & 0xFFFFFFFFFFFFFFFF
+    count &= 63
+    return UInt64(((v << count) | (v >> (64 - count))) & 0xFFFFFFFFFFFFFFFF)
 
-def sbyten(x: Integer, n: int) -> Int8:
-    """Implementation of `SBYTEn`."""
-    return truncate(x, n * 1, Int8)
 
+def ror1(value: UInt8, count: int) -> UInt8:
+    """Implementation of `__ROR1__`."""
+    v = int(value) & 0xFF
+    count &= 7
+    return UInt8(((v >> count) | (v << (8 - count))) & 0xFF)
 
-def swordn(x: Integer, n: int) -> Int16:
-    """Implementation of `SWORDn`."""
-    return truncate(x, n * 2, Int16)
 
+def ror2(value: UInt16, count: int) -> UInt16:
+    """Implementation of `__ROR2__`."""
+    v = int(value) & 0xFFFF
+    count &= 15
+    return UInt16(((v >> count) | (v << (16 - count))) & 0xFFFF)
 
-def sdwordn(x: Integer, n: int) -> Int32:
-    """Implementation of `SDWORDn`."""
-    return truncate(x, n * 4, Int32)
 
+def ror4(value: UInt32, count: int) -> UInt32:
+    """Implementation of `__ROR4__`."""
+    v = int(value) & 0xFFFFFFFF
+    count &= 31
+    return UInt32(((v >> count) | (v << (32 - count))) & 0xFFFFFFFF)
 
-def slobyte(x: Integer) -> Int8:
-    """Implementation of `SLOBYTE`."""
-    return sbyten(x, low_ind(x, Int8))
 
+def ror8(value: UInt64, count: int) -> UInt64:
+    """Implementation of `__ROR8__`."""
+    v = int(value) & 0xFFFFFFFFFFFFFFFF
+    count &= 63
+    return UInt64(((v >> count) | (v << (64 - count))) & 0xFFFFFFFFFFFFFFFF)
 
-def sloword(x: Integer) -> Int16:
-    """Implementation of `SLOWORD`."""
-    return swordn(x, low_ind(x, Int16))
 
+def mkcshl(value: Integer, count: int) -> int:
+    """Implementation of `__MKCSHL__`."""
+    mask, sign_shift = _width_constants(type(value))
+    nbits = sign_shift + 1
+    return ((int(value) & mask) >> (nbits - count % nbits)) & 1
 
-def slodword(x: Integer) -> Int32:
-    """Implementation of `SLODWORD`."""
-    return sdwordn(x, low_ind(x, Int32))
 
+def mkcshr(value: Integer, count: int) -> int:
+    """Implementation of `__MKCSHR__`."""
+    mask = _width_constants(type(value))[0]
+    return ((int(value) & mask) >> (count - 1)) & 1
 
-def shibyte(x: Integer) -> Int8:
-    """Implementation of `SHIBYTE`."""
-    return sbyten(x, high_ind(x, Int8))
 
+def sar(value: Integer, count: int) -> Integer:
+    """Implementation of `__SAR__`.
 
-def shiword(x: Integer) -> Int16:
-    """Implementation of `SHIWORD`."""
-    return swordn(x, high_ind(x, Int16))
+    Shift right arithmetically, regardless of the signedness of ``value``.
+    """
+    mask, sign_shift = _width_constants(type(value))
+    v = int(value) & mask
+    if v >> sign_shift:
+        v -= mask + 1
+    return type(value)(v >> count)
 
 
-def shidword(x: Integer) -> Int32:
-    """Implementation of `SHIDWORD`."""
-    return sdwordn(x, high_ind(x, Int32))
+def _signed_value(x: SupportsInt, mask: int, sign_shift: int) -> int:
+    v = int(x) & mask
+    return v - (mask + 1) if v >> sign_shift else v
 
 
-def sbyte1(x: Integer) -> Int8:
-    """Implementation of `SBYTE1`."""
-    return sbyten(x, 1)
+def udiv(x: _T, y: SupportsInt) -> _T:
+    """Divide as unsigned integers of the size of ``x``.
 
+    The result is of the type of ``x``, regardless of its signedness.
+    """
+    mask = _width_constants(type(x))[0]
+    return type(x)((int(x) & mask) // (int(y) & mask))
 
-def sbyte2(x: Integer) -> Int8:
-    """Implementation of `SBYTE2`."""
-    return sbyten(x, 2)
 
+def sdiv(x: _T, y: SupportsInt) -> _T:
+    """Divide as signed integers of the size of ``x``, truncating toward zero.
 
-def sbyte3(x: Integer) -> Int8:
-    """Implementation of `SBYTE3`."""
-    return sbyten(x, 3)
+    The result is of the type of ``x``, regardless of its signedness.
+    """
+    mask, sign_shift = _width_constants(type(x))
+    return type(x)(
+        _div(_signed_value(x, mask, sign_shift), _signed_value(y, mask, sign_shift))
+    )
 
 
-def sbyte4(x: Integer) -> Int8:
-    """Implementation of `SBYTE4`."""
-    return sbyten(x, 4)
+def urem(x: _T, y: SupportsInt) -> _T:
+    """Get the remainder of ``udiv``."""
+    mask = _width_constants(type(x))[0]
+    return type(x)((int(x) & mask) % (int(y) & mask))
 
 
-def sbyte5(x: Integer) -> Int8:
-    """Implementation of `SBYTE5`."""
-    return sbyten(x, 5)
+def srem(x: _T, y: SupportsInt) -> _T:
+    """Get the remainder of ``sdiv``, which has the sign of ``x``."""
+    mask, sign_shift = _width_constants(type(x))
+    return type(x)(
+        _mod(_signed_value(x, mask, sign_shift), _signed_value(y, mask, sign_shift))
+    )
 
 
-def sbyte6(x: Integer) -> Int8:
-    """Implementation of `SBYTE6`."""
-    return sbyten(x, 6)
+# Refer to https://gcc.gnu.org/onlinedocs/gccint/Integer-library-routines.html.
 
 
-def sbyte7(x: Integer) -> Int8:
-    """Implementation of `SBYTE7`."""
-    return sbyten(x, 7)
+def divsi3(a: SupportsInt, b: SupportsInt) -> Int32:
+    """Implementation of `__divsi3`."""
+    return sdiv(Int32(a), b)
 
 
-def sbyte8(x: Integer) -> Int8:
-    """Implementation of `SBYTE8`."""
-    return sbyten(x, 8)
+def udivsi3(a: SupportsInt, b: SupportsInt) -> UInt32:
+    """Implementation of `__udivsi3`."""
+    return udiv(UInt32(a), b)
 
 
-def sbyte9(x: Integer) -> Int8:
-    """Implementation of `SBYTE9`."""
-    return sbyten(x, 9)
+def modsi3(a: SupportsInt, b: SupportsInt) -> Int32:
+    """Implementation of `__modsi3`."""
+    return srem(Int32(a), b)
 
 
-def sbyte10(x: Integer) -> Int8:
-    """Implementation of `SBYTE10`."""
-    return sbyten(x, 10)
+def umodsi3(a: SupportsInt, b: SupportsInt) -> UInt32:
+    """Implementation of `__umodsi3`."""
+    return urem(UInt32(a), b)
 
 
-def sbyte11(x: Integer) -> Int8:
-    """Implementation of `SBYTE11`."""
-    return sbyten(x, 11)
+def divdi3(a: SupportsInt, b: SupportsInt) -> Int64:
+    """Implementation of `__divdi3`."""
+    return sdiv(Int64(a), b)
 
 
-def sbyte12(x: Integer) -> Int8:
-    """Implementation of `SBYTE12`."""
-    return sbyten(x, 12)
+def udivdi3(a: SupportsInt, b: SupportsInt) -> UInt64:
+    """Implementation of `__udivdi3`."""
+    return udiv(UInt64(a), b)
 
 
-def sbyte13(x: Integer) -> Int8:
-    """Implementation of `SBYTE13`."""
-    return sbyten(x, 13)
+def moddi3(a: SupportsInt, b: SupportsInt) -> Int64:
+    """Implementation of `__moddi3`."""
+    return srem(Int64(a), b)
 
 
-def sbyte14(x: Integer) -> Int8:
-    """Implementation of `SBYTE14`."""
-    return sbyten(x, 14)
+def umoddi3(a: SupportsInt, b: SupportsInt) -> UInt64:
+    """Implementation of `__umoddi3`."""
+    return urem(UInt64(a), b)
 
 
-def sbyte15(x: Integer) -> Int8:
-    """Implementation of `SBYTE15`."""
-    return sbyten(x, 15)
+# Division functions of the ARM EABI, which IDA shows on targets without
+# hardware division.
+aeabi_idiv = divsi3
+aeabi_uidiv = udivsi3
 
+# Refer to https://learn.microsoft.com/en-us/cpp/intrinsics/compiler-intrinsics.
 
-def sword1(x: Integer) -> Int16:
-    """Implementation of `SWORD1`."""
-    return swordn(x, 1)
 
+def bit_scan_forward(index: VirtualPointer, mask: SupportsInt) -> int:
+    """Implementation of `_BitScanForward`.
 
-def sword2(x: Integer) -> Int16:
-    """Implementation of `SWORD2`."""
-    return swordn(x, 2)
+    The index of the lowest set bit of ``mask`` is written to ``index``. If
+    ``mask`` is zero, ``index`` is not written and 0 is returned, otherwise 1.
+    """
+    v = int(mask) & 0xFFFFFFFF
+    if not v:
+        return 0
 
+    index.write((v & -v).bit_length() - 1)
+    return 1
 
-def sword3(x: Integer) -> Int16:
-    """Implementation of `SWORD3`."""
-    return swordn(x, 3)
 
+def bit_scan_forward64(index: VirtualPointer, mask: SupportsInt) -> int:
+    """Implementation of `_BitScanForward64`."""
+    v = int(mask) & 0xFFFFFFFFFFFFFFFF
+    if not v:
+        return 0
 
-def sword4(x: Integer) -> Int16:
-    """Implementation of `SWORD4`."""
-    return swordn(x, 4)
+    index.write((v & -v).bit_length() - 1)
+    return 1
 
 
-def sword5(x: Integer) -> Int16:
-    """Implementation of `SWORD5`."""
-    return swordn(x, 5)
+def bit_scan_reverse(index: VirtualPointer, mask: SupportsInt) -> int:
+    """Implementation of `_BitScanReverse`.
 
+    The index of the highest set bit of ``mask`` is written to ``index``. If
+    ``mask`` is zero, ``index`` is not written and 0 is returned, otherwise 1.
+    """
+    v = int(mask) & 0xFFFFFFFF
+    if not v:
+        return 0
 
-def sword6(x: Integer) -> Int16:
-    """Implementation of `SWORD6`."""
-    return swordn(x, 6)
+    index.write(v.bit_length() - 1)
+    return 1
 
 
-def sword7(x: Integer) -> Int16:
-    """Implementation of `SWORD7`."""
-    return swordn(x, 7)
+def bit_scan_reverse64(index: VirtualPointer, mask: SupportsInt) -> int:
+    """Implementation of `_BitScanReverse64`."""
+    v = int(mask) & 0xFFFFFFFFFFFFFFFF
+    if not v:
+        return 0
 
+    index.write(v.bit_length() - 1)
+    return 1
 
-def sdword1(x: Integer) -> Int32:
-    """Implementation of `SDWORD1`."""
-    return sdwordn(x, 1)
 
+def _result_type(x: SupportsInt, y: SupportsInt) -> Type[Integer]:
+    """Get the type of result of a binary operation, same as integer types.
 
-def sdword2(x: Integer) -> Int32:
-    """Implementation of `SDWORD2`."""
-    return sdwordn(x, 2)
+    An operand which is not an integer type takes the type of the other
+    operand, as in ``uint8(x) + 1``. If neither is an integer type, the result
+    is ``int`` of C (``Int32``), as it is for two literals.
+    """
+    if not isinstance(x, Integer):
+        return type(y) if isinstance(y, Integer) else Int32
 
+    if not isinstance(y, Integer):
+        return type(x)
 
-def sdword3(x: Integer) -> Int32:
-    """Implementation of `SDWORD3`."""
-    return sdwordn(x, 3)
+    if x.size == y.size:
+        return type(y if x.signed else x)
 
+    return type(x if x.size > y.size else y)
 
-def pair(high: Integer, low: Integer) -> Integer:
-    """Implementation of `__PAIR__`."""
-    int_type = Integer.get_type(size=high.size * 2, signed=high.signed)
-    return int_type(high) << high.size * 8 | type(high)(low)
 
+def adc(x: SupportsInt, y: SupportsInt, carry: int) -> ArithmeticResult:
+    """Add with carry, and get flags of the result."""
+    result_type = _result_type(x, y)
+    mask, sign_shift = _width_constants(result_type)
 
-def rol(value: Integer, count: int) -> Integer:
-    """Implementation of `__ROL__`."""
-    data_type = type(value)
-    nbits = value.size * 8
+    ux = int(x) & mask
+    uy = int(y) & mask
+    s = ux + uy + (carry & 1)
+    r = s & mask
 
-    if count > 0:
-        count %= nbits
-        high = value >> (nbits - count)
-        if value.signed:
-            high &= ~(data_type(-1) << count)
-        value <<= count
-        value |= high
+    return ArithmeticResult(
+        value=result_type(r),
+        cf=s >> (sign_shift + 1),
+        of=(((ux ^ r) & (uy ^ r)) >> sign_shift) & 1,
+        sf=r >> sign_shift,
+        zf=int(r == 0),
+    )
 
-    else:
-        count = -count % nbits
-        low = value << (nbits - count)
-        value >>= count
-        value |= low
 
-    return value
+def sbb(x: SupportsInt, y: SupportsInt, borrow: int) -> ArithmeticResult:
+    """Subtract with borrow, and get flags of the result."""
+    result_type = _result_type(x, y)
+    mask, sign_shift = _width_constants(result_type)
 
+    ux = int(x) & mask
+    uy = int(y) & mask
+    b = borrow & 1
+    r = (ux - uy - b) & mask
 
-def rol1(value: UInt8, count: int) -> UInt8:
-    """Implementation of `__ROL1__`."""
-    return UInt8(rol(value, count))
+    return ArithmeticResult(
+        value=result_type(r),
+        cf=int(ux < uy + b),
+        of=(((ux ^ uy) & (ux ^ r)) >> sign_shift) & 1,
+        sf=r >> sign_shift,
+        zf=int(r == 0),
+    )
 
 
-def rol2(value: UInt16, count: int) -> UInt16:
-    """Implementation of `__ROL2__`."""
-    return UInt16(rol(value, count))
+def add_with_flags(x: SupportsInt, y: SupportsInt) -> ArithmeticResult:
+    """Add, and get flags of the result."""
+    return adc(x, y, 0)
 
 
-def rol4(value: UInt32, count: int) -> UInt32:
-    """Implementation of `__ROL4__`."""
-    return UInt32(rol(value, count))
+def sub_with_flags(x: SupportsInt, y: SupportsInt) -> ArithmeticResult:
+    """Subtract, and get flags of the result."""
+    return sbb(x, y, 0)
 
 
-def rol8(value: UInt64, count: int) -> UInt64:
-    """Implementation of `__ROL8__`."""
-    return UInt64(rol(value, count))
+def sets(x: Integer) -> int:
+    """Implementation of `__SETS__`."""
+    return (int(x) >> (x.size * 8 - 1)) & 1
 
 
-def ror1(value: UInt8, count: int) -> UInt8:
-    """Implementation of `__ROR1__`."""
-    return UInt8(rol(value, -count))
+def ofsub(x: Integer, y: Integer) -> int:
+    """Implementation of `__OFSUB__`."""
+    return sbb(x, y, 0).of
 
 
-def ror2(value: UInt16, count: int) -> UInt16:
-    """Implementation of `__ROR2__`."""
-    return UInt16(rol(value, -count))
+def ofadd(x: Integer, y: Integer) -> int:
+    """Implementation of `__OFADD__`."""
+    return adc(x, y, 0).of
 
 
-def ror4(value: UInt32, count: int) -> UInt32:
-    """Implementation of `__ROR4__`."""
-    return UInt32(rol(value, -count))
+def cfsub(x: Integer, y: Integer) -> int:
+    """Implementation of `__CFSUB__`."""
+    return sbb(x, y, 0).cf
 
 
-def ror8(value: UInt64, count: int) -> UInt64:
-    """Implementation of `__ROR8__`."""
-    return UInt64(rol(value, -count))
+def cfadd(x: Integer, y: Integer) -> int:
+    """Implementation of `__CFADD__`."""
+    return adc(x, y, 0).cf
 
 
-def mkcshl(value: Integer, count: int) -> int:
-    """Implementation of `__MKCSHL__`."""
-    nbits = value.size * 8
-    count %= nbits
-    return int((value >> (nbits - count)) & 1)
+# Refer to https://learn.microsoft.com/en-us/cpp/intrinsics/compiler-intrinsics.
 
 
-def mkcshr(value: Integer, count: int) -> int:
-    """Implementation of `__MKCSHR__`."""
-    return int((value >> (count - 1)) & 1)
+def shiftleft128(low: UInt64, high: UInt64, shift: int) -> UInt64:
+    """Implementation of `__shiftleft128`."""
+    shift &= 63
+    h = int(high) & 0xFFFFFFFFFFFFFFFF
+    lo = int(low) & 0xFFFFFFFFFFFFFFFF
+    return UInt64(((h << shift) | (lo >> (64 - shift))) & 0xFFFFFFFFFFFFFFFF)
 
 
-def sets(x: Integer) -> int:
-    """Implementation of `__SETS__`."""
-    data_type = Integer.get_type(size=x.size, signed=True)
-    return int(data_type(x) < 0)
+def shiftright128(low: UInt64, high: UInt64, shift: int) -> UInt64:
+    """Implementation of `__shiftright128`."""
+    shift &= 63
+    h = int(high) & 0xFFFFFFFFFFFFFFFF
+    lo = int(low) & 0xFFFFFFFFFFFFFFFF
+    return UInt64(((lo >> shift) | (h << (64 - shift))) & 0xFFFFFFFFFFFFFFFF)
 
 
-def ofsub(x: Integer, y: Integer) -> int:
-    """Implementation of `__OFSUB__`."""
-    if x.size < y.size:
-        x2 = x
-        sx = sets(x2)
-        return int((sx ^ sets(y)) & (sx ^ sets(x2 - y)))
-    else:
-        y2 = y
-        sx = sets(x)
-        return int((sx ^ sets(y2)) & (sx ^ sets(x - y2)))
+def _to_int64(x: SupportsInt) -> int:
+    value = int(x) & 0xFFFFFFFFFFFFFFFF
+    return value - 0x10000000000000000 if value >> 63 else value
 
 
-def ofadd(x: Integer, y: Integer) -> int:
-    """Implementation of `__OFADD__`."""
-    if x.size < y.size:
-        x2 = x
-        sx = sets(x2)
-        return int(((1 ^ sx) ^ sets(y)) & (sx ^ sets(x2 + y)))
-    else:
-        y2 = y
-        sx = sets(x)
-        return int(((1 ^ sx) ^ sets(y2)) & (sx ^ sets(x + y2)))
+def umulh(a: UInt64, b: UInt64) -> UInt64:
+    """Implementation of `__umulh`."""
+    return UInt64(((int(a) & 0xFFFFFFFFFFFFFFFF) * (int(b) & 0xFFFFFFFFFFFFFFFF)) >> 64)
 
 
-def cfsub(x: Integer, y: Integer) -> int:
-    """Implementation of `__CFSUB__`."""
-    size = max(x.size, y.size)
-    data_type = Integer.get_type(size=size, signed=False)
-    return int(data_type(x) < data_type(y))
+def mulh(a: Int64, b: Int64) -> Int64:
+    """Implementation of `__mulh`."""
+    return Int64((_to_int64(a) * _to_int64(b)) >> 64)
 
 
-def cfadd(x: Integer, y: Integer) -> int:
-    """Implementation of `__CFADD__`."""
-    size = max(x.size, y.size)
-    data_type = Integer.get_type(size=size, signed=False)
-    return int(data_type(x) > data_type(x + y))
+def umul128(a: UInt64, b: UInt64, high: VirtualPointer) -> UInt64:
+    """Implementation of `_umul128`.
+
+    The high 64 bits of the product are written to ``high``.
+    """
+    product = (int(a) & 0xFFFFFFFFFFFFFFFF) * (int(b) & 0xFFFFFFFFFFFFFFFF)
+    high.write(product >> 64)
+    return UInt64(product)
+
+
+def mul128(a: Int64, b: Int64, high: VirtualPointer) -> Int64:
+    """Implementation of `_mul128`.
+
+    The high 64 bits of the product are written to ``high``.
+    """
+    product = _to_int64(a) * _to_int64(b)
+    high.write(product >> 64)
+    return Int64(product)
+
+
+# Interlocked functions operate on the width of the pointer's data type, so
+# variants with a size suffix are the same function.
+
+
+def interlocked_increment(addend: VirtualPointer) -> Integer:
+    """Implementation of `_InterlockedIncrement`."""
+    return atomic.add_fetch(addend, 1)
+
+
+def interlocked_decrement(addend: VirtualPointer) -> Integer:
+    """Implementation of `_InterlockedDecrement`."""
+    return atomic.sub_fetch(addend, 1)
+
+
+def interlocked_exchange(target: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `_InterlockedExchange`."""
+    return atomic.exchange(target, value)
+
+
+def interlocked_exchange_add(addend: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `_InterlockedExchangeAdd`."""
+    return atomic.fetch_add(addend, value)
+
+
+def interlocked_compare_exchange(
+    destination: VirtualPointer, exchange: SupportsInt, comparand: SupportsInt
+) -> Integer:
+    """Implementation of `_InterlockedCompareExchange`."""
+    return atomic.compare_exchange(destination, comparand, exchange)
+
+
+def interlocked_and(destination: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `_InterlockedAnd`."""
+    return atomic.fetch_and(destination, value)
+
+
+def interlocked_or(destination: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `_InterlockedOr`."""
+    return atomic.fetch_or(destination, value)
+
+
+def interlocked_xor(destination: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `_InterlockedXor`."""
+    return atomic.fetch_xor(destination, value)
+
+
+interlocked_increment16 = interlocked_increment64 = interlocked_increment
+interlocked_decrement16 = interlocked_decrement64 = interlocked_decrement
+interlocked_exchange8 = interlocked_exchange16 = interlocked_exchange
+interlocked_exchange64 = interlocked_exchange
+interlocked_exchange_add8 = interlocked_exchange_add16 = interlocked_exchange_add
+interlocked_exchange_add64 = interlocked_exchange_add
+interlocked_compare_exchange8 = interlocked_compare_exchange
+interlocked_compare_exchange16 = interlocked_compare_exchange
+interlocked_compare_exchange64 = interlocked_compare_exchange
+interlocked_and8 = interlocked_and16 = interlocked_and64 = interlocked_and
+interlocked_or8 = interlocked_or16 = interlocked_or64 = interlocked_or
+interlocked_xor8 = interlocked_xor16 = interlocked_xor64 = interlocked_xor
 
 
 # Refer to https://gcc.gnu.org/onlinedocs/gcc/Other-Builtins.html.
@@ -544,5 +739,305 @@ def bswap32(value: UInt32) -> UInt32:
 
 
 def clz(x: Integer) -> int:
-    """Implementation of `__clz`."""
-    return x.size * 8 - len(bin(int(x))[2:])
+    """Implementation of `__clz`.
+
+    Bits are counted at the width of ``x``, zero has as many as its width.
+    """
+    return x._size * 8 - (int(x) & x._mask).bit_length()
+
+
+def ctz(x: Integer) -> int:
+    """Count trailing zero bits at the width of ``x``.
+
+    Zero has as many as its width.
+    """
+    v = int(x) & x._mask
+    return (v & -v).bit_length() - 1 if v else x._size * 8
+
+
+def popcount(x: Integer) -> int:
+    """Count set bits at the width of ``x``."""
+    return bit_count(int(x) & x._mask)
+
+
+def parity(x: Integer) -> int:
+    """Get 1 if ``x`` has an odd number of set bits, or 0."""
+    return bit_count(int(x) & x._mask) & 1
+
+
+def clz32(x: SupportsInt) -> int:
+    """Implementation of `__builtin_clz`."""
+    return 32 - (int(x) & 0xFFFFFFFF).bit_length()
+
+
+def clz64(x: SupportsInt) -> int:
+    """Implementation of `__builtin_clzll`."""
+    return 64 - (int(x) & 0xFFFFFFFFFFFFFFFF).bit_length()
+
+
+def ctz32(x: SupportsInt) -> int:
+    """Implementation of `__builtin_ctz`."""
+    v = int(x) & 0xFFFFFFFF
+    return (v & -v).bit_length() - 1 if v else 32
+
+
+def ctz64(x: SupportsInt) -> int:
+    """Implementation of `__builtin_ctzll`."""
+    v = int(x) & 0xFFFFFFFFFFFFFFFF
+    return (v & -v).bit_length() - 1 if v else 64
+
+
+def popcount32(x: SupportsInt) -> int:
+    """Implementation of `__builtin_popcount`."""
+    return bit_count(int(x) & 0xFFFFFFFF)
+
+
+def popcount64(x: SupportsInt) -> int:
+    """Implementation of `__builtin_popcountll`."""
+    return bit_count(int(x) & 0xFFFFFFFFFFFFFFFF)
+
+
+def parity32(x: SupportsInt) -> int:
+    """Implementation of `__builtin_parity`."""
+    return bit_count(int(x) & 0xFFFFFFFF) & 1
+
+
+def parity64(x: SupportsInt) -> int:
+    """Implementation of `__builtin_parityll`."""
+    return bit_count(int(x) & 0xFFFFFFFFFFFFFFFF) & 1
+
+
+# Refer to https://gcc.gnu.org/onlinedocs/gcc/_005f_005fsync-Builtins.html.
+
+
+def sync_fetch_and_add(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_fetch_and_add`."""
+    return atomic.fetch_add(ptr, value)
+
+
+def sync_fetch_and_sub(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_fetch_and_sub`."""
+    return atomic.fetch_sub(ptr, value)
+
+
+def sync_fetch_and_or(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_fetch_and_or`."""
+    return atomic.fetch_or(ptr, value)
+
+
+def sync_fetch_and_and(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_fetch_and_and`."""
+    return atomic.fetch_and(ptr, value)
+
+
+def sync_fetch_and_xor(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_fetch_and_xor`."""
+    return atomic.fetch_xor(ptr, value)
+
+
+def sync_fetch_and_nand(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_fetch_and_nand`."""
+    return atomic.fetch_nand(ptr, value)
+
+
+def sync_add_and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_add_and_fetch`."""
+    return atomic.add_fetch(ptr, value)
+
+
+def sync_sub_and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_sub_and_fetch`."""
+    return atomic.sub_fetch(ptr, value)
+
+
+def sync_or_and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_or_and_fetch`."""
+    return atomic.or_fetch(ptr, value)
+
+
+def sync_and_and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_and_and_fetch`."""
+    return atomic.and_fetch(ptr, value)
+
+
+def sync_xor_and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_xor_and_fetch`."""
+    return atomic.xor_fetch(ptr, value)
+
+
+def sync_nand_and_fetch(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_nand_and_fetch`."""
+    return atomic.nand_fetch(ptr, value)
+
+
+def sync_bool_compare_and_swap(
+    ptr: VirtualPointer, oldval: SupportsInt, newval: SupportsInt
+) -> bool:
+    """Implementation of `__sync_bool_compare_and_swap`."""
+    return int(atomic.compare_exchange(ptr, oldval, newval)) == int(
+        ptr.data_type(oldval)
+    )
+
+
+def sync_val_compare_and_swap(
+    ptr: VirtualPointer, oldval: SupportsInt, newval: SupportsInt
+) -> Integer:
+    """Implementation of `__sync_val_compare_and_swap`."""
+    return atomic.compare_exchange(ptr, oldval, newval)
+
+
+def sync_lock_test_and_set(ptr: VirtualPointer, value: SupportsInt) -> Integer:
+    """Implementation of `__sync_lock_test_and_set`."""
+    return atomic.exchange(ptr, value)
+
+
+def sync_lock_release(ptr: VirtualPointer):
+    """Implementation of `__sync_lock_release`."""
+    atomic.store(ptr, 0)
+
+
+def sync_synchronize():
+    """Implementation of `__sync_synchronize`.
+
+    It does nothing, atomic operations are already ordered by their locks.
+    """
+
+
+# Refer to https://gcc.gnu.org/onlinedocs/gcc/_005f_005fatomic-Builtins.html.
+
+# Memory orders are accepted and ignored, all atomic operations are
+# sequentially consistent.
+ATOMIC_SEQ_CST = 5
+
+
+def atomic_load_n(ptr: VirtualPointer, memorder: int = ATOMIC_SEQ_CST) -> Integer:
+    """Implementation of `__atomic_load_n`."""
+    return atomic.load(ptr)
+
+
+def atomic_store_n(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+):
+    """Implementation of `__atomic_store_n`."""
+    atomic.store(ptr, value)
+
+
+def atomic_exchange_n(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_exchange_n`."""
+    return atomic.exchange(ptr, value)
+
+
+def atomic_compare_exchange_n(
+    ptr: VirtualPointer,
+    expected: VirtualPointer,
+    desired: SupportsInt,
+    weak: bool = False,
+    success_memorder: int = ATOMIC_SEQ_CST,
+    failure_memorder: int = ATOMIC_SEQ_CST,
+) -> bool:
+    """Implementation of `__atomic_compare_exchange_n`.
+
+    If the value differs from the one at ``expected``, it is written to
+    ``expected``. Weak exchanges never fail spuriously.
+    """
+    value = expected.read()
+    old = atomic.compare_exchange(ptr, value, desired)
+
+    if int(old) != int(ptr.data_type(value)):
+        expected.write(old)
+        return False
+
+    return True
+
+
+def atomic_fetch_add(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_fetch_add`."""
+    return atomic.fetch_add(ptr, value)
+
+
+def atomic_fetch_sub(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_fetch_sub`."""
+    return atomic.fetch_sub(ptr, value)
+
+
+def atomic_fetch_and(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_fetch_and`."""
+    return atomic.fetch_and(ptr, value)
+
+
+def atomic_fetch_or(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_fetch_or`."""
+    return atomic.fetch_or(ptr, value)
+
+
+def atomic_fetch_xor(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_fetch_xor`."""
+    return atomic.fetch_xor(ptr, value)
+
+
+def atomic_fetch_nand(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_fetch_nand`."""
+    return atomic.fetch_nand(ptr, value)
+
+
+def atomic_add_fetch(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_add_fetch`."""
+    return atomic.add_fetch(ptr, value)
+
+
+def atomic_sub_fetch(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_sub_fetch`."""
+    return atomic.sub_fetch(ptr, value)
+
+
+def atomic_and_fetch(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_and_fetch`."""
+    return atomic.and_fetch(ptr, value)
+
+
+def atomic_or_fetch(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_or_fetch`."""
+    return atomic.or_fetch(ptr, value)
+
+
+def atomic_xor_fetch(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_xor_fetch`."""
+    return atomic.xor_fetch(ptr, value)
+
+
+def atomic_nand_fetch(
+    ptr: VirtualPointer, value: SupportsInt, memorder: int = ATOMIC_SEQ_CST
+) -> Integer:
+    """Implementation of `__atomic_nand_fetch`."""
+    return atomic.nand_fetch(ptr, value)
+
+
+def atomic_thread_fence(memorder: int = ATOMIC_SEQ_CST):
+    """Implementation of `__atomic_thread_fence`.
+
+    It does nothing, atomic operations are already ordered by their locks.
+    """
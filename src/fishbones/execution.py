@@ -0,0 +1,144 @@
+"""Select checked or fast implementations of integer types and pointers.
+
+The ``checked`` profile is the default. It validates operands, data types and
+ranges of accesses, and raises errors for invalid programs. The ``fast``
+profile replaces these paths with implementations which skip validation:
+
+- Operators of integer types don't check if the other operand is an integer.
+- Copies of virtual pointers don't check their data types.
+- Reads of virtual pointers don't check their ranges. Writes out of range
+  still raise ``ValueError``, so they never resize or corrupt the buffer.
+
+Both profiles give the same results for valid programs. A profile applies to
+the whole process, including other threads, since it replaces methods of the
+classes. Select it with ``set_profile``, or with ``global_profile`` while a
+block of code runs::
+
+    with global_profile(FAST):
+        encrypt(data, key)
+
+It can also be selected at ``import fishbones`` with the environment variable
+``FISHBONES_PROFILE``.
+
+Hooks of ``fishbones.profiling`` and ``fishbones.tracing`` wrap the current
+implementations, so don't switch profiles while they are enabled. Profiles
+can't be switched while ``fishbones.parallel.thread_map`` is running, since
+its workers would see the switch.
+"""
+
+import contextlib
+import threading
+from typing import Any, Dict, Iterator, List, Tuple
+
+from . import virtual_pointer
+from .integer import (
+    _ARITHMETIC_OPERATORS,
+    _COMPARISON_OPERATORS,
+    Integer,
+    IntMeta,
+)
+from .virtual_pointer import VirtualPointer
+
+CHECKED = "checked"
+FAST = "fast"
+
+PROFILES = (CHECKED, FAST)
+
+_FAST_POINTER_METHODS = {
+    "copy": virtual_pointer._fast_copy,
+    "add": virtual_pointer._fast_add,
+    "read_bytes": virtual_pointer._fast_read_bytes,
+    "write_bytes": virtual_pointer._fast_write_bytes,
+    "read": virtual_pointer._fast_read,
+    "write": virtual_pointer._fast_write,
+}
+
+
+def _collect_implementations() -> Dict[str, List[Tuple[type, str, Any]]]:
+    checked: List[Tuple[type, str, Any]] = []
+    fast: List[Tuple[type, str, Any]] = []
+
+    for name in _ARITHMETIC_OPERATORS:
+        checked.append((Integer, name, Integer.__dict__[name]))
+        fast.append((Integer, name, IntMeta.build_fast_operator(name)))
+
+    for name in _COMPARISON_OPERATORS:
+        checked.append((Integer, name, Integer.__dict__[name]))
+        fast.append(
+            (Integer, name, IntMeta.build_fast_operator(name, is_comparison=True))
+        )
+
+    for name, func in _FAST_POINTER_METHODS.items():
+        checked.append((VirtualPointer, name, VirtualPointer.__dict__[name]))
+        fast.append((VirtualPointer, name, func))
+
+    return {CHECKED: checked, FAST: fast}
+
+
+_IMPLEMENTATIONS = _collect_implementations()
+
+_profile = CHECKED
+
+# Number of blocks in which profiles can't be switched, see ``_pin_profile``.
+_pins = 0
+_pin_lock = threading.Lock()
+
+
+def get_profile() -> str:
+    """Get the name of the current profile."""
+    return _profile
+
+
+def set_profile(name: str):
+    """Select a profile for the whole process.
+
+    Raises:
+        ValueError: If ``name`` is not a profile.
+        RuntimeError: If ``thread_map`` is running.
+    """
+    global _profile
+
+    if name not in _IMPLEMENTATIONS:
+        raise ValueError("Unknown profile: %s" % name)
+
+    with _pin_lock:
+        if _pins:
+            raise RuntimeError("Profile can't be switched while thread_map is running")
+
+        for owner, attr, func in _IMPLEMENTATIONS[name]:
+            setattr(owner, attr, func)
+
+        _profile = name
+
+
+@contextlib.contextmanager
+def global_profile(name: str) -> Iterator[None]:
+    """Select a profile for the whole process while a block of code runs.
+
+    The previous profile is selected again at the end of the block. Other
+    threads see the profile as well, it is not local to the block.
+    """
+    old = get_profile()
+    set_profile(name)
+
+    try:
+        yield
+
+    finally:
+        set_profile(old)
+
+
+@contextlib.contextmanager
+def _pin_profile() -> Iterator[None]:
+    """Prevent switching profiles in a block of code, which runs threads."""
+    global _pins
+
+    with _pin_lock:
+        _pins += 1
+
+    try:
+        yield
+
+    finally:
+        with _pin_lock:
+            _pins -= 1
@@ -0,0 +1,321 @@
+"""Emulate heap allocation over a single buffer."""
+
+import sys
+from typing import Dict, List, NamedTuple, Optional, SupportsInt, Tuple, Type, Union
+
+from .consts import LITTLE_ENDIAN
+from .integer import Integer, UInt8, get_type_size
+from .virtual_pointer import VirtualPointer
+
+if sys.version_info >= (3, 8):
+    from typing import Literal
+else:
+    from typing_extensions import Literal
+
+# Alignment of every block, matching what glibc returns on 64-bit platforms.
+ALIGNMENT = 16
+
+# Sizes up to this are rounded to a multiple of ``ALIGNMENT``, larger sizes are
+# rounded to a power of two.
+SMALL_SIZE_LIMIT = 512
+
+
+class HeapStats(NamedTuple):
+    """Statistics of a heap.
+
+    Attributes:
+        heap_size: Bytes taken from the buffer so far.
+        in_use: Bytes requested by live allocations.
+        peak_in_use: Maximum of ``in_use`` over the lifetime of the heap.
+        allocated: Bytes of live blocks, including size class padding.
+        free: Bytes of blocks held in free lists.
+        allocations: Number of live allocations.
+        fragmentation: Ratio of ``free`` to ``heap_size``.
+        internal_fragmentation: Ratio of padding to ``allocated``.
+    """
+
+    heap_size: int
+    in_use: int
+    peak_in_use: int
+    allocated: int
+    free: int
+    allocations: int
+    fragmentation: float
+    internal_fragmentation: float
+
+
+def size_class(size: int) -> int:
+    """Get the block size which an allocation of ``size`` bytes uses."""
+    if size <= SMALL_SIZE_LIMIT:
+        return (max(size, 1) + ALIGNMENT - 1) & -ALIGNMENT
+
+    return 1 << (size - 1).bit_length()
+
+
+class BoundedPointer(VirtualPointer):
+    """Pointer which checks accesses against the allocation it points into.
+
+    Args:
+        source: The source ``bytearray`` to be read / write.
+        data_type: The type of operated data.
+        offset: The distance from beginning to operating position.
+        heap: The heap which owns the allocation.
+        base: The offset of the allocation in ``source``.
+        generation: The generation of the allocation, which tells it from
+            later allocations reusing the same block.
+    """
+
+    def __init__(
+        self,
+        source: bytearray,
+        data_type: Union[Type[Integer], str] = UInt8,
+        offset: int = 0,
+        *,
+        heap: "Heap",
+        base: int,
+        generation: int,
+    ):
+        super().__init__(source=source, data_type=data_type, offset=offset)
+
+        self.heap = heap
+        self.base = base
+        self.generation = generation
+
+    def copy(self) -> "BoundedPointer":
+        """Copy this object.
+
+        The new object and the old object will operate on the same ``bytearray``.
+        """
+        return self.__class__(
+            source=self.source,
+            data_type=self.data_type,
+            offset=self.offset,
+            heap=self.heap,
+            base=self.base,
+            generation=self.generation,
+        )
+
+    def check_access(self, size: int):
+        """Check an access of ``size`` bytes at the current position.
+
+        Raises:
+            ValueError: If the allocation is freed or the access is out of it.
+        """
+        block = self.heap.blocks.get(self.base)
+
+        # Freed blocks are reused by later allocations of the same size class.
+        if block is None or block[2] != self.generation:
+            raise ValueError("Use after free")
+
+        if self.offset < self.base or self.offset + size > self.base + block[1]:
+            raise ValueError("Access out of allocation")
+
+    def read_bytes(self, size: int) -> bytes:
+        """Read bytes from source ``bytearray``."""
+        self.check_access(size)
+        return super().read_bytes(size)
+
+    def write_bytes(self, data):
+        """Write bytes into source ``bytearray``."""
+        self.check_access(len(data))
+        super().write_bytes(data)
+
+    def read(self, byteorder: Literal["big", "little"] = LITTLE_ENDIAN) -> Integer:
+        """Read an integer from source ``bytearray``."""
+        self.check_access(get_type_size(self.data_type))
+        return super().read(byteorder=byteorder)
+
+    def write(
+        self, value: SupportsInt, byteorder: Literal["big", "little"] = LITTLE_ENDIAN
+    ):
+        """Write an integer into source ``bytearray``."""
+        self.check_access(get_type_size(self.data_type))
+        super().write(value, byteorder=byteorder)
+
+
+class Heap:
+    """Emulate ``malloc`` / ``free`` over a single buffer.
+
+    Blocks are rounded up to size classes and freed blocks are kept in a free
+    list per size class, so both allocation and deallocation are O(1).
+
+    Args:
+        source: The buffer to allocate from. If it is None, a new ``bytearray``
+            is created.
+        offset: The beginning of the managed region in ``source``.
+        size: The size of the managed region. If it is None and ``source`` is a
+            ``bytearray``, the region extends to the end of ``source`` and
+            ``source`` grows on demand.
+        bounds_check: Return ``BoundedPointer`` which checks every access
+            against its allocation.
+    """
+
+    def __init__(
+        self,
+        source: Optional[bytearray] = None,
+        offset: int = 0,
+        size: Optional[int] = None,
+        bounds_check: bool = False,
+    ):
+        if source is None:
+            source = bytearray()
+
+        self.source = source
+        self.offset = offset
+        self.bounds_check = bounds_check
+
+        self.growable = size is None and isinstance(source, bytearray)
+        self.limit = len(source) if size is None else offset + size
+
+        # Offset of the first unused byte of the region.
+        self.top = offset
+
+        # Live blocks, mapping offset to (block size, requested size,
+        # generation).
+        self.blocks: Dict[int, Tuple[int, int, int]] = {}
+        self.free_lists: Dict[int, List[int]] = {}
+
+        # Count of allocations, every allocation has its own generation.
+        self.generation = 0
+
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.allocated = 0
+        self.free_size = 0
+
+    def _pointer(self, offset: int) -> VirtualPointer:
+        if self.bounds_check:
+            return BoundedPointer(
+                source=self.source,
+                offset=offset,
+                heap=self,
+                base=offset,
+                generation=self.blocks[offset][2],
+            )
+
+        return VirtualPointer(source=self.source, offset=offset)
+
+    def _allocate(self, size: int) -> int:
+        block_size = size_class(size)
+        free_list = self.free_lists.get(block_size)
+
+        if free_list:
+            offset = free_list.pop()
+            self.free_size -= block_size
+
+        else:
+            offset = self.top
+            end = offset + block_size
+
+            if end > self.limit:
+                if not self.growable:
+                    raise MemoryError("Out of memory")
+
+                self.source.extend(bytes(end - self.limit))
+                self.limit = end
+
+            self.top = end
+
+        self.generation += 1
+        self.blocks[offset] = (block_size, size, self.generation)
+        self.allocated += block_size
+        self.in_use += size
+
+        if self.in_use > self.peak_in_use:
+            self.peak_in_use = self.in_use
+
+        return offset
+
+    def _block(self, ptr: VirtualPointer) -> Tuple[int, int, int]:
+        block = self.blocks.get(ptr.offset)
+        if ptr.source is not self.source or block is None:
+            raise ValueError("Invalid pointer")
+
+        # A stale pointer to a block which is reused by another allocation.
+        if isinstance(ptr, BoundedPointer) and ptr.generation != block[2]:
+            raise ValueError("Invalid pointer")
+
+        return block
+
+    def malloc(self, size: int) -> VirtualPointer:
+        """Implementation of `malloc`.
+
+        Raises:
+            MemoryError: If the region is exhausted and can't grow.
+        """
+        return self._pointer(self._allocate(size))
+
+    def calloc(self, num: int, size: int) -> VirtualPointer:
+        """Implementation of `calloc`."""
+        total = num * size
+        offset = self._allocate(total)
+        self.source[offset : offset + total] = bytes(total)
+        return self._pointer(offset)
+
+    def realloc(self, ptr: Optional[VirtualPointer], size: int) -> VirtualPointer:
+        """Implementation of `realloc`.
+
+        The returned pointer is the same as ``ptr`` if the new size fits in the
+        block of ``ptr``.
+        """
+        if ptr is None:
+            return self.malloc(size)
+
+        block_size, old_size, generation = self._block(ptr)
+
+        if size_class(size) == block_size:
+            self.blocks[ptr.offset] = (block_size, size, generation)
+            self.in_use += size - old_size
+
+            if self.in_use > self.peak_in_use:
+                self.peak_in_use = self.in_use
+
+            return self._pointer(ptr.offset)
+
+        offset = self._allocate(size)
+        copy_size = min(size, old_size)
+        self.source[offset : offset + copy_size] = self.source[
+            ptr.offset : ptr.offset + copy_size
+        ]
+        self.free(ptr)
+        return self._pointer(offset)
+
+    def free(self, ptr: Optional[VirtualPointer]):
+        """Implementation of `free`.
+
+        Raises:
+            ValueError: If ``ptr`` is not the start of a live allocation.
+        """
+        if ptr is None:
+            return
+
+        block_size, size, _ = self._block(ptr)
+        del self.blocks[ptr.offset]
+
+        self.free_lists.setdefault(block_size, []).append(ptr.offset)
+        self.free_size += block_size
+        self.allocated -= block_size
+        self.in_use -= size
+
+    def usable_size(self, ptr: VirtualPointer) -> int:
+        """Implementation of `malloc_usable_size`."""
+        return self._block(ptr)[0]
+
+    def stats(self) -> HeapStats:
+        """Get statistics of this heap."""
+        heap_size = self.top - self.offset
+
+        return HeapStats(
+            heap_size=heap_size,
+            in_use=self.in_use,
+            peak_in_use=self.peak_in_use,
+            allocated=self.allocated,
+            free=self.free_size,
+            allocations=len(self.blocks),
+            fragmentation=self.free_size / heap_size if heap_size else 0.0,
+            internal_fragmentation=(
+                (self.allocated - self.in_use) / self.allocated
+                if self.allocated
+                else 0.0
+            ),
+        )
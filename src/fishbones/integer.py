@@ -1,16 +1,6 @@
-import ctypes
 import operator
-import re
 import sys
-from typing import (
-    Iterable,
-    Optional,
-    SupportsBytes,
-    SupportsInt,
-    Type,
-    Union,
-    get_type_hints,
-)
+from typing import Iterable, Optional, SupportsBytes, SupportsInt, Type, Union
 
 from .consts import LITTLE_ENDIAN
 
@@ -35,25 +25,115 @@ class _ComparisonOp:
         pass
 
 
+# Operators of integer types, they are declared in ``Integer`` for type checkers.
+_ARITHMETIC_OPERATORS = (
+    "__neg__",
+    "__pos__",
+    "__abs__",
+    "__add__",
+    "__radd__",
+    "__sub__",
+    "__rsub__",
+    "__mul__",
+    "__rmul__",
+    "__truediv__",
+    "__rtruediv__",
+    "__floordiv__",
+    "__rfloordiv__",
+    "__mod__",
+    "__rmod__",
+    "__invert__",
+    "__and__",
+    "__rand__",
+    "__or__",
+    "__ror__",
+    "__xor__",
+    "__rxor__",
+    "__lshift__",
+    "__rlshift__",
+    "__rshift__",
+    "__rrshift__",
+)
+_UNARY_OPERATORS = ("__neg__", "__pos__", "__abs__", "__invert__")
+_COMPARISON_OPERATORS = ("__eq__", "__ne__", "__gt__", "__ge__", "__le__", "__lt__")
+
+
+def _div(x: int, y: int) -> int:
+    """Divide with truncation toward zero, as C does."""
+    if x >= 0 and y > 0:
+        return x // y
+
+    q = abs(x) // abs(y)
+    return -q if (x < 0) != (y < 0) else q
+
+
+def _mod(x: int, y: int) -> int:
+    """Get the remainder of ``_div``, which has the sign of ``x``."""
+    if x >= 0 and y > 0:
+        return x % y
+
+    return x - y * _div(x, y)
+
+
+def _rdiv(x: int, y: int) -> int:
+    return _div(y, x)
+
+
+def _rmod(x: int, y: int) -> int:
+    return _mod(y, x)
+
+
+# Division and remainder of C, both ``/`` and ``//`` are integer division.
+# Operands are converted to the type of the result before the operation, so
+# that a signed operand with an unsigned one is divided as unsigned. The
+# second function is the same operation of ``int``, which is used when both
+# operands are positive.
+_DIVISION_OPERATORS = {
+    "__truediv__": (_div, int.__floordiv__),
+    "__rtruediv__": (_rdiv, int.__rfloordiv__),
+    "__floordiv__": (_div, int.__floordiv__),
+    "__rfloordiv__": (_rdiv, int.__rfloordiv__),
+    "__mod__": (_mod, int.__mod__),
+    "__rmod__": (_rmod, int.__rmod__),
+}
+
+
+def _convert(value: int, int_type: "Type[Integer]") -> int:
+    """Convert a value to the value of ``int_type``, same as wrapping it."""
+    value &= int_type._mask
+    if value & int_type._sign_bit:
+        value -= int_type._modulus
+    return value
+
+
 class IntMeta(type):
-    """Metaclass of integer type."""
+    """Metaclass of integer type.
+
+    Operators are built once for the base class and inherited by subclasses.
+    """
 
     def __init__(cls, name, bases, attr_dict):
         super().__init__(name, bases, attr_dict)
 
-        for name, hint_type in get_type_hints(cls).items():
-            if hint_type in (_BinaryOp, _UnaryOp):
+        if "_size" in attr_dict:
+            nbits = cls._size * 8
+            cls._mask = (1 << nbits) - 1
+            cls._modulus = 1 << nbits
+            cls._sign_bit = 1 << (nbits - 1) if cls._signed else 0
+
+        if not bases:
+            for name in _ARITHMETIC_OPERATORS:
                 setattr(cls, name, cls.build_operator(name))
 
-            elif hint_type == _ComparisonOp:
+            for name in _COMPARISON_OPERATORS:
                 setattr(cls, name, cls.build_operator(name, is_comparison=True))
 
-        for name in ("__eq__", "__ne__"):
-            setattr(cls, name, cls.build_operator(name, is_comparison=True))
-
     @staticmethod
     def build_operator(func_name: str, is_comparison: bool = False):
         """Build operation method to integer type."""
+        if func_name in _DIVISION_OPERATORS:
+            return IntMeta._build_division(func_name)
+
         f = getattr(operator, func_name, None) or getattr(int, func_name)
 
         def decorator(*args):
@@ -74,13 +154,11 @@ class IntMeta(type):
 
                     # If their sizes are not equal, the type of result is
                     # larger size type.
-                    else:
-                        if x.size < y.size:
-                            result_type = type(y)
-                            x, y = y, x
+                    elif x.size < y.size:
+                        result_type = type(y)
 
-                        else:
-                            result_type = type(x)
+                    else:
+                        result_type = type(x)
 
                 elif not hasattr(y, "__int__"):
                     return NotImplemented
@@ -91,13 +169,129 @@ class IntMeta(type):
 
         return decorator
 
+    @staticmethod
+    def _build_division(func_name: str):
+        """Build division or remainder method with C semantics."""
+        f, positive = _DIVISION_OPERATORS[func_name]
+
+        def division(x, y):
+            result_type = type(x)
+            a = int(x)
+
+            if isinstance(y, Integer):
+                if x.size == y.size:
+                    result_type = type(y if x.signed else x)
+
+                elif x.size < y.size:
+                    result_type = type(y)
+
+                # Values of integer types are converted only if their types
+                # differ from the type of result.
+                if result_type is not type(x):
+                    a = _convert(a, result_type)
+
+                b = int(y)
+                if result_type is not type(y):
+                    b = _convert(b, result_type)
+
+            elif hasattr(y, "__int__"):
+                b = _convert(int(y), result_type)
+
+            else:
+                return NotImplemented
+
+            if a > 0 and b > 0:
+                return result_type(positive(a, b))
+
+            return result_type(f(a, b))
+
+        return division
+
+    @staticmethod
+    def build_fast_operator(func_name: str, is_comparison: bool = False):
+        """Build operation method which doesn't check the other operand.
+
+        It is used by the fast profile, where the other operand must be an
+        integer type or ``int``.
+        """
+        if func_name in _DIVISION_OPERATORS:
+            f, positive = _DIVISION_OPERATORS[func_name]
+
+            def division(x, y):
+                result_type = type(x)
+
+                if isinstance(y, Integer):
+                    if x._size == y._size:
+                        result_type = type(y if x._signed else x)
+
+                    elif x._size < y._size:
+                        result_type = type(y)
+
+                    y = y._value
+
+                a = x._value
+                if result_type is not type(x):
+                    a = _convert(a, result_type)
+
+                if 0 < y <= result_type._mask >> 1 and a > 0:
+                    return result_type(positive(a, y))
+
+                return result_type(f(a, _convert(y, result_type)))
+
+            return division
+
+        f = getattr(operator, func_name, None) or getattr(int, func_name)
+
+        if is_comparison:
+
+            def compare(x, y):
+                return f(x._value, y)
+
+            return compare
+
+        if func_name in _UNARY_OPERATORS:
+
+            def unary(x):
+                return type(x)(f(x._value))
+
+            return unary
+
+        def binary(x, y):
+            if isinstance(y, Integer):
+                if x._size == y._size:
+                    result_type = type(y if x._signed else x)
+
+                elif x._size < y._size:
+                    result_type = type(y)
+
+                else:
+                    result_type = type(x)
+
+                return result_type(f(x._value, y._value))
+
+            return type(x)(f(x._value, y))
+
+        return binary
+
 
 class Integer(metaclass=IntMeta):
-    """Base class of integer type."""
+    """Base class of integer type.
+
+    Subclasses define ``_size`` (bytes) and ``_signed``, the metaclass derives
+    the constants used to wrap values from them.
+    """
+
+    _size: int
+    _signed: bool
+    _mask: int
+    _modulus: int
+    _sign_bit: int
 
     def __init__(self, x: SupportsInt):
-        ctypes_cls = getattr(ctypes, "c_%s" % self.__class__.__name__.lower())
-        self._value = ctypes_cls(int(x))
+        value = int(x) & self._mask
+        if value & self._sign_bit:
+            value -= self._modulus
+        self._value = value
 
     __neg__: _UnaryOp
     __pos__: _UnaryOp
@@ -131,18 +325,27 @@ class Integer(metaclass=IntMeta):
     __lt__: _ComparisonOp
 
     def __int__(self) -> int:
-        return int(self._value.value)
+        return self._value
 
     def __str__(self) -> str:
         return str(self.__int__())
 
+    def __reduce__(self):
+        # Pickle builtin types as (type id, value), which is smaller than the
+        # default of class and ``__dict__``.
+        type_id = _TYPE_IDS.get(type(self))
+        if type_id is None:
+            return type(self), (self._value,)
+
+        return _from_type_id, (type_id, self._value)
+
     @property
     def size(self) -> int:
-        return get_type_size(self.__class__)
+        return self._size
 
     @property
     def signed(self) -> bool:
-        return get_type_signed(self.__class__)
+        return self._signed
 
     @classmethod
     def from_bytes(
@@ -180,9 +383,13 @@ class Integer(metaclass=IntMeta):
         Raises:
             ValueError: If no matched type.
         """
-        int_types = [Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64]
-
         if type_name is not None:
+            int_type = _TYPES_BY_NAME.get(type_name)
+            if int_type is not None:
+                return int_type
+
+            import re
+
             match = re.match(r"(u*)int(\d+)", type_name)
 
             if match:
@@ -192,12 +399,9 @@ class Integer(metaclass=IntMeta):
                     size = nbits // 8
 
         if size is not None and signed is not None:
-            for int_type in int_types:
-                if (
-                    get_type_size(int_type) == size
-                    and get_type_signed(int_type) == signed
-                ):
-                    return int_type
+            int_type = _TYPES_BY_SIZE.get((size, signed))
+            if int_type is not None:
+                return int_type
 
         raise ValueError("No matched type")
 
@@ -205,34 +409,85 @@ class Integer(metaclass=IntMeta):
 class Int8(Integer):
     """Int8"""
 
+    _size = 1
+    _signed = True
+
 
 class Int16(Integer):
     """Int16"""
 
+    _size = 2
+    _signed = True
+
 
 class Int32(Integer):
     """Int32"""
 
+    _size = 4
+    _signed = True
+
 
 class Int64(Integer):
     """Int64"""
 
+    _size = 8
+    _signed = True
+
+
+class Int128(Integer):
+    """Int128"""
+
+    _size = 16
+    _signed = True
+
 
 class UInt8(Integer):
     """UInt8"""
 
+    _size = 1
+    _signed = False
+
 
 class UInt16(Integer):
     """UInt16"""
 
+    _size = 2
+    _signed = False
+
 
 class UInt32(Integer):
     """UInt32"""
 
+    _size = 4
+    _signed = False
+
 
 class UInt64(Integer):
     """UInt64"""
 
+    _size = 8
+    _signed = False
+
+
+class UInt128(Integer):
+    """UInt128"""
+
+    _size = 16
+    _signed = False
+
+
+_INT_TYPES = (Int8, Int16, Int32, Int64, Int128, UInt8, UInt16, UInt32, UInt64, UInt128)
+
+_TYPES_BY_NAME = {t.__name__.lower(): t for t in _INT_TYPES}
+_TYPES_BY_SIZE = {(t._size, t._signed): t for t in _INT_TYPES}
+
+# Ids of types in pickles and packed data, don't change existing ones.
+_TYPE_IDS = {t: i for i, t in enumerate(_INT_TYPES)}
+
+
+def _from_type_id(type_id: int, value: int) -> Integer:
+    return _INT_TYPES[type_id](value)
+
 
 def int8(x: SupportsInt) -> Int8:
     """Shorthand for `Int8(x)`."""
@@ -254,6 +509,11 @@ def int64(x: SupportsInt) -> Int64:
     return Int64(x)
 
 
+def int128(x: SupportsInt) -> Int128:
+    """Shorthand for `Int128(x)`."""
+    return Int128(x)
+
+
 def uint8(x: SupportsInt) -> UInt8:
     """Shorthand for `UInt8(x)`."""
     return UInt8(x)
@@ -274,15 +534,24 @@ def uint64(x: SupportsInt) -> UInt64:
     return UInt64(x)
 
 
+def uint128(x: SupportsInt) -> UInt128:
+    """Shorthand for `UInt128(x)`."""
+    return UInt128(x)
+
+
 def get_type_size(t: Type[Integer]) -> int:
     """Get size (bytes) of the type."""
-    match_obj = re.match(r"(U*)Int(\d+)", t.__name__)
-    if not match_obj:
-        raise ValueError("Invalid type")
+    try:
+        return t._size
 
-    return int(match_obj.group(2)) // 8
+    except AttributeError as e:
+        raise ValueError("Invalid type") from e
 
 
 def get_type_signed(t: Type[Integer]) -> bool:
     """Get signed of the type."""
-    return bool(re.match(r"Int\d+", t.__name__))
+    try:
+        return t._signed
+
+    except AttributeError as e:
+        raise ValueError("Invalid type") from e
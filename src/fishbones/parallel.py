@@ -0,0 +1,318 @@
+"""Run ported routines in parallel.
+
+``map`` calls a function over many inputs in a pool of processes. Buffers
+which the function needs, such as tables and input / output regions, are
+placed in shared memory once instead of being pickled for every call, and
+workers access them through virtual pointers without copying::
+
+    def check(key, regions):
+        return crc32(regions["table"], key) == EXPECTED
+
+    results = parallel.map(check, keys, shared={"table": table})
+
+``map`` requires Python 3.8 or later for shared memory, ``thread_map`` doesn't.
+
+``thread_map`` calls a function in a pool of threads instead, which shares
+buffers without copying them and gives every thread private scratch buffers::
+
+    results = parallel.thread_map(
+        decrypt, blocks, shared={"table": table}, scratch={"state": 256}
+    )
+
+Threads only run in parallel on free-threaded builds of CPython, see "Thread
+safety" in the README for what may be shared between threads.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from multiprocessing import Pool, util
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from .execution import _pin_profile
+from .virtual_pointer import VirtualPointer
+
+# Shared buffers of the current worker process.
+_memories: List[Any] = []
+_views: List[memoryview] = []
+_regions: Dict[str, VirtualPointer] = {}
+_func: Optional[Callable[[Any, Dict[str, VirtualPointer]], Any]] = None
+
+
+def _shared_memory() -> Any:
+    """Import ``multiprocessing.shared_memory``, which is new in Python 3.8."""
+    try:
+        from multiprocessing import shared_memory
+    except ImportError as e:  # pragma: no cover
+        raise ImportError(
+            "Shared memory is required by fishbones.parallel.map, which "
+            "requires Python 3.8 or later"
+        ) from e
+
+    return shared_memory
+
+
+def _view(memory: Any, size: int) -> memoryview:
+    """Get the first ``size`` bytes of shared memory, which may be larger."""
+    buf = memory.buf
+    assert buf is not None
+    return buf[:size]
+
+
+def _initialize(
+    func: Callable[[Any, Dict[str, VirtualPointer]], Any],
+    layout: Dict[str, Tuple[str, int]],
+    initializer: Optional[Callable[..., Any]],
+    initargs: Sequence[Any],
+):
+    """Attach shared buffers in a worker process."""
+    global _func
+
+    _func = func
+
+    shared_memory = _shared_memory()
+    for name, (memory_name, size) in layout.items():
+        memory = shared_memory.SharedMemory(name=memory_name)
+        _memories.append(memory)
+
+        view = _view(memory, size)
+        _views.append(view)
+        _regions[name] = VirtualPointer(source=view)  # type: ignore
+
+    # Detach when the worker exits, finalizers run at exit of processes of
+    # multiprocessing while atexit hooks don't.
+    util.Finalize(None, _close, exitpriority=0)
+
+    if initializer is not None:
+        initializer(_regions, *initargs)
+
+
+def _close():
+    """Detach shared buffers in a worker process."""
+    _regions.clear()
+
+    while _views:
+        _views.pop().release()
+
+    while _memories:
+        _memories.pop().close()
+
+
+def _call(item: Any) -> Any:
+    assert _func is not None
+    return _func(item, _regions)
+
+
+def _create_memory(data: Union[bytes, bytearray, int]) -> Any:
+    size = data if isinstance(data, int) else len(data)
+
+    # Shared memory of size 0 is not allowed.
+    memory = _shared_memory().SharedMemory(create=True, size=max(size, 1))
+
+    if not isinstance(data, int):
+        _view(memory, size)[:] = data
+
+    return memory
+
+
+def map(
+    func: Callable[[Any, Dict[str, VirtualPointer]], Any],
+    inputs: Iterable[Any],
+    shared: Optional[Mapping[str, Union[bytes, bytearray, int]]] = None,
+    processes: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Sequence[Any] = (),
+) -> List[Any]:
+    """Call ``func(item, regions)`` for every item of ``inputs`` in processes.
+
+    ``regions`` maps names of ``shared`` to ``VirtualPointer`` over shared
+    memory. The pointers are reused by all calls in a worker, so use their
+    copies (such as ``add`` and ``cast``) instead of changing them.
+
+    ``func`` and ``initializer`` must be picklable, which means they are
+    defined at the top level of a module.
+
+    Args:
+        func: The function to call.
+        inputs: Items to be passed to ``func``.
+        shared: Buffers to be shared with workers, mapped from names. A ``bytes``
+            is read-only by convention. A ``bytearray`` is copied back after all
+            calls, so workers can write results into it. An ``int`` creates a
+            zeroed buffer of that size, which is only visible to workers.
+        processes: The number of worker processes, ``os.cpu_count()`` by
+            default.
+        chunksize: The number of items sent to a worker at once. By default,
+            inputs are split into about 4 chunks per worker.
+        ordered: Return results in the order of ``inputs``. Otherwise, they
+            are returned in the order they are completed.
+        initializer: Called with ``regions`` and ``initargs`` in every worker
+            before any items, to prepare worker-local states.
+        initargs: Extra arguments of ``initializer``.
+
+    Returns:
+        Results of ``func``.
+
+    Raises:
+        ImportError: If Python is older than 3.8.
+    """
+    _shared_memory()
+
+    shared = shared or {}
+    processes = processes or os.cpu_count() or 1
+
+    if chunksize is None:
+        if not isinstance(inputs, Sequence):
+            inputs = list(inputs)
+
+        chunksize = max(len(inputs) // (processes * 4), 1)
+
+    memories: Dict[str, Any] = {}
+    layout: Dict[str, Tuple[str, int]] = {}
+
+    try:
+        for name, data in shared.items():
+            memory = memories[name] = _create_memory(data)
+            layout[name] = (memory.name, data if isinstance(data, int) else len(data))
+
+        with Pool(
+            processes,
+            initializer=_initialize,
+            initargs=(func, layout, initializer, initargs),
+        ) as pool:
+            if ordered:
+                results = list(pool.imap(_call, inputs, chunksize))
+            else:
+                results = list(pool.imap_unordered(_call, inputs, chunksize))
+
+            # Let workers exit by themselves and detach, instead of being
+            # terminated.
+            pool.close()
+            pool.join()
+
+        for name, data in shared.items():
+            if isinstance(data, bytearray):
+                data[:] = _view(memories[name], len(data))
+
+    finally:
+        for memory in memories.values():
+            memory.close()
+            memory.unlink()
+
+    return results
+
+
+def _chunks(inputs: Iterable[Any], chunksize: int) -> Iterator[List[Any]]:
+    chunk = []
+
+    for item in inputs:
+        chunk.append(item)
+
+        if len(chunk) == chunksize:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def thread_map(
+    func: Callable[[Any, Dict[str, VirtualPointer]], Any],
+    inputs: Iterable[Any],
+    shared: Optional[Mapping[str, Union[bytes, bytearray, int]]] = None,
+    scratch: Optional[Mapping[str, int]] = None,
+    threads: Optional[int] = None,
+    chunksize: Optional[int] = None,
+    ordered: bool = True,
+    initializer: Optional[Callable[..., Any]] = None,
+    initargs: Sequence[Any] = (),
+) -> List[Any]:
+    """Call ``func(item, regions)`` for every item of ``inputs`` in threads.
+
+    It is the same as ``map``, except that ``regions`` also has private
+    buffers of every thread, and ``func`` doesn't need to be picklable.
+    ``regions`` is created for every thread, and is passed to all calls in
+    that thread. The execution profile is the same in all threads, it can't
+    be switched until ``thread_map`` returns.
+
+    Args:
+        func: The function to call.
+        inputs: Items to be passed to ``func``.
+        shared: Buffers shared by all threads without copying, mapped from
+            names. A ``bytes`` is read-only, writes through its pointer raise
+            ``TypeError``. Threads may write into a ``bytearray``, as long as
+            they write different bytes. An ``int`` creates a zeroed
+            ``bytearray`` of that size.
+        scratch: Sizes of private buffers, mapped from names. Every thread has
+            its own zeroed buffers, which are reused by its calls.
+        threads: The number of threads, ``os.cpu_count()`` by default.
+        chunksize: The number of items given to a thread at once. By default,
+            inputs are split into about 4 chunks per thread.
+        ordered: Return results in the order of ``inputs``. Otherwise, they
+            are returned in the order chunks are completed.
+        initializer: Called with ``regions`` and ``initargs`` in every thread
+            before any items, to prepare thread-local states.
+        initargs: Extra arguments of ``initializer``.
+
+    Returns:
+        Results of ``func``.
+
+    Raises:
+        RuntimeError: If ``func`` or ``initializer`` switches the execution
+            profile.
+    """
+    threads = threads or os.cpu_count() or 1
+
+    if chunksize is None:
+        if not isinstance(inputs, Sequence):
+            inputs = list(inputs)
+
+        chunksize = max(len(inputs) // (threads * 4), 1)
+
+    buffers = {
+        name: bytearray(data) if isinstance(data, int) else data
+        for name, data in (shared or {}).items()
+    }
+
+    local = threading.local()
+
+    def initialize():
+        regions = {name: VirtualPointer(source=data) for name, data in buffers.items()}
+        for name, size in (scratch or {}).items():
+            regions[name] = VirtualPointer(source=bytearray(size))
+
+        local.regions = regions
+
+        if initializer is not None:
+            initializer(regions, *initargs)
+
+    def call(chunk: List[Any]) -> List[Any]:
+        regions = local.regions
+        return [func(item, regions) for item in chunk]
+
+    # Workers share patched classes, so switching profiles would affect all
+    # of them.
+    with _pin_profile(), ThreadPoolExecutor(
+        threads, initializer=initialize
+    ) as executor:
+        futures = [executor.submit(call, c) for c in _chunks(inputs, chunksize)]
+
+        if ordered:
+            completed: Iterable[Any] = futures
+        else:
+            completed = as_completed(futures)
+
+        return [result for future in completed for result in future.result()]
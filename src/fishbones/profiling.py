@@ -0,0 +1,262 @@
+"""Count operations of ported code.
+
+``Profile`` counts constructions of integer types and virtual pointers,
+operators and ``get_type`` lookups of integer types, methods of virtual pointers
+and calls of builtins. Hooks are installed when the profile is entered and
+removed when it exits, so nothing is slowed down otherwise::
+
+    with Profile(lines=True) as prof:
+        encrypt(data, key)
+
+    print(prof.report())
+
+Builtins are counted with ``sys.setprofile`` in the thread which enters the
+profile, other hooks count calls from all threads.
+"""
+
+import importlib.util
+import json
+import os
+import sys
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from .decompiler_builtins import _built_codes
+from .integer import _ARITHMETIC_OPERATORS, _COMPARISON_OPERATORS, Integer
+from .virtual_pointer import VirtualPointer
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Modules of builtins, mapped to the names used in reports.
+_BUILTIN_MODULES = {
+    "fishbones.decompiler_builtins.ida": "ida",
+    "fishbones.decompiler_builtins.ghidra": "ghidra",
+    "fishbones.simd": "simd",
+}
+
+_POINTER_METHODS = (
+    "copy",
+    "add",
+    "sub",
+    "cast",
+    "read",
+    "write",
+    "read_bytes",
+    "write_bytes",
+)
+
+_active: Optional["Profile"] = None
+
+
+def _caller() -> Tuple[str, int]:
+    """Get the first source line outside Fishbones in the call stack."""
+    frame = sys._getframe(2)
+
+    while frame.f_back is not None and frame.f_code.co_filename.startswith(
+        _PACKAGE_DIR
+    ):
+        frame = frame.f_back
+
+    return frame.f_code.co_filename, frame.f_lineno
+
+
+class Profile:
+    """Count operations of integer types, virtual pointers and builtins.
+
+    Counts are grouped by category:
+
+    - ``allocation``: constructions of integer types and virtual pointers.
+    - ``operator``: operators of integer types, such as ``UInt32.__add__``.
+    - ``lookup``: calls of ``Integer.get_type``.
+    - ``pointer``: methods of virtual pointers, such as ``VirtualPointer.read``.
+    - ``builtin``: builtins of IDA, Ghidra and SIMD, such as ``ida.rol4``.
+
+    Args:
+        lines: Also count operations by the source line which causes them,
+            the first line outside Fishbones in the call stack.
+    """
+
+    def __init__(self, lines: bool = False):
+        self.lines = lines
+
+        self.counts: Counter = Counter()
+        self.line_counts: Counter = Counter()
+
+        self._patches: List[Tuple[Any, str, Any]] = []
+        self._builtin_files: Dict[str, str] = {}
+        self._old_profile: Optional[Callable[..., Any]] = None
+
+    def __enter__(self) -> "Profile":
+        global _active
+
+        if _active is not None:
+            raise RuntimeError("Profiling is already enabled")
+
+        _active = self
+        self._install()
+        return self
+
+    def __exit__(self, *exc_info):
+        global _active
+
+        self._uninstall()
+        _active = None
+
+    def record(self, category: str, name: str):
+        """Count an operation."""
+        self.counts[(category, name)] += 1
+
+        if self.lines:
+            filename, lineno = _caller()
+            self.line_counts[(category, name, filename, lineno)] += 1
+
+    def _patch(self, owner: Any, name: str, value: Any):
+        self._patches.append((owner, name, owner.__dict__[name]))
+        setattr(owner, name, value)
+
+    def _install(self):
+        record = self.record
+
+        def wrap_operator(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+            def wrapper(*args):
+                record("operator", "%s.%s" % (type(args[0]).__name__, name))
+                return func(*args)
+
+            return wrapper
+
+        for name in _ARITHMETIC_OPERATORS + _COMPARISON_OPERATORS:
+            self._patch(Integer, name, wrap_operator(name, Integer.__dict__[name]))
+
+        integer_init = Integer.__init__
+
+        def init_integer(obj, x):
+            record("allocation", type(obj).__name__)
+            integer_init(obj, x)
+
+        self._patch(Integer, "__init__", init_integer)
+
+        get_type = Integer.__dict__["get_type"].__func__
+
+        def lookup(*args, **kwargs):
+            record("lookup", "Integer.get_type")
+            return get_type(*args, **kwargs)
+
+        self._patch(Integer, "get_type", staticmethod(lookup))
+
+        pointer_init = VirtualPointer.__init__
+
+        def init_pointer(obj, *args, **kwargs):
+            record("allocation", type(obj).__name__)
+            pointer_init(obj, *args, **kwargs)
+
+        self._patch(VirtualPointer, "__init__", init_pointer)
+
+        def wrap_method(name: str, func: Callable[..., Any]) -> Callable[..., Any]:
+            def wrapper(obj, *args, **kwargs):
+                record("pointer", "%s.%s" % (type(obj).__name__, name))
+                return func(obj, *args, **kwargs)
+
+            return wrapper
+
+        for name in _POINTER_METHODS:
+            method = VirtualPointer.__dict__[name]
+            self._patch(VirtualPointer, name, wrap_method(name, method))
+
+        for module_name, label in _BUILTIN_MODULES.items():
+            spec = importlib.util.find_spec(module_name)
+            if spec is not None and spec.origin is not None:
+                self._builtin_files[spec.origin] = label
+
+        self._old_profile = sys.getprofile()
+        sys.setprofile(self._profile_builtins)
+
+    def _uninstall(self):
+        sys.setprofile(self._old_profile)
+
+        while self._patches:
+            owner, name, value = self._patches.pop()
+            setattr(owner, name, value)
+
+    def _profile_builtins(self, frame: FrameType, event: str, arg: Any):
+        if event != "call":
+            return
+
+        code = frame.f_code
+        label = self._builtin_files.get(code.co_filename)
+        if label is None:
+            return
+
+        # Functions built on access are known by their code objects.
+        name = _built_codes.get(code)
+        if name is None:
+            name = code.co_name
+            if name.startswith("_"):
+                return
+
+            # Only count functions of the module, not methods or nested
+            # functions.
+            func = frame.f_globals.get(name)
+            if getattr(func, "__code__", None) is not code:
+                return
+
+        self.record("builtin", "%s.%s" % (label, name))
+
+    def get_counts(self, category: Optional[str] = None) -> Dict[str, int]:
+        """Get counts of operations, optionally of one category."""
+        return {
+            name: count
+            for (c, name), count in self.counts.items()
+            if category is None or c == category
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert counts to a JSON serializable ``dict``."""
+        return {
+            "counts": [
+                {"category": category, "name": name, "count": count}
+                for (category, name), count in self.counts.most_common()
+            ],
+            "lines": [
+                {
+                    "category": key[0],
+                    "name": key[1],
+                    "filename": key[2],
+                    "lineno": key[3],
+                    "count": count,
+                }
+                for key, count in self.line_counts.most_common()
+            ],
+        }
+
+    def dump(self, path: str):
+        """Write counts to a JSON file."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def report(self, limit: Optional[int] = None) -> str:
+        """Format counts as a table.
+
+        Args:
+            limit: The maximum number of rows in each section.
+        """
+        lines = ["%-12s %-40s %12s" % ("category", "name", "calls")]
+
+        categories: Set[str] = {c for c, _ in self.counts}
+        for category in sorted(categories):
+            counts = Counter(self.get_counts(category))
+            for name, count in counts.most_common(limit):
+                lines.append("%-12s %-40s %12d" % (category, name, count))
+
+        if self.line_counts:
+            lines.append("")
+            lines.append("%-40s %-40s %12s" % ("line", "name", "calls"))
+
+            for (_, name, filename, lineno), count in self.line_counts.most_common(
+                limit
+            ):
+                location = "%s:%d" % (os.path.basename(filename), lineno)
+                lines.append("%-40s %-40s %12d" % (location, name, count))
+
+        return "\n".join(lines)
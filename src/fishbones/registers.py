@@ -0,0 +1,230 @@
+"""Emulate CPU register files with aliased sub-registers.
+
+Code ported at a low level writes parts of registers, such as
+``LOBYTE(v5) = ...`` or ``mov al, ...``. A register file keeps one ``int`` per
+architectural register in ``__slots__``, and aliases read and write bits of it
+with masks computed once::
+
+    regs = X64Registers(rax=0x1122334455667788)
+    regs.al = 0xFF
+    assert regs.rax == 0x11223344556677FF
+
+    # Writes of 32-bit registers zero extend, same as the CPU.
+    regs.eax = 1
+    assert regs.rax == 1
+
+Aliases are read as integer types of their width.
+"""
+
+from typing import Any, ClassVar, Dict, SupportsInt, Tuple, Type
+
+from .integer import Integer, UInt8, UInt16, UInt32, UInt64, get_type_size
+
+# Names and types of architectural registers.
+_Registers = Dict[str, Type[Integer]]
+
+# Names of aliases, and the register, type, shift and whether writes zero
+# extend.
+_Aliases = Dict[str, Tuple[str, Type[Integer], int, bool]]
+
+
+class _Alias:
+    """Read and write bits of a register.
+
+    Args:
+        slot: The slot which stores the register.
+        data_type: The type of values, which decides the width.
+        shift: The index of the lowest bit.
+        zero_extend: Writes clear other bits of the register instead of
+            keeping them.
+    """
+
+    __slots__ = ("slot", "data_type", "shift", "mask", "clear_mask", "zero_extend")
+
+    def __init__(
+        self,
+        slot: Any,
+        data_type: Type[Integer],
+        shift: int = 0,
+        zero_extend: bool = False,
+    ):
+        self.slot = slot
+        self.data_type = data_type
+        self.shift = shift
+        self.mask = (1 << get_type_size(data_type) * 8) - 1
+        self.clear_mask = ~(self.mask << shift)
+        self.zero_extend = zero_extend
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+
+        return self.data_type((self.slot.__get__(obj) >> self.shift) & self.mask)
+
+    def __set__(self, obj: Any, value: SupportsInt):
+        if self.zero_extend:
+            self.slot.__set__(obj, int(value) & self.mask)
+        else:
+            self.slot.__set__(
+                obj,
+                (self.slot.__get__(obj) & self.clear_mask)
+                | ((int(value) & self.mask) << self.shift),
+            )
+
+
+class _Zero:
+    """A register which is always read as zero and ignores writes."""
+
+    __slots__ = ("data_type",)
+
+    def __init__(self, data_type: Type[Integer]):
+        self.data_type = data_type
+
+    def __get__(self, obj: Any, owner: Any = None) -> Any:
+        if obj is None:
+            return self
+
+        return self.data_type(0)
+
+    def __set__(self, obj: Any, value: SupportsInt):
+        pass
+
+
+class Registers:
+    """Base class of register files.
+
+    Subclasses set ``registers`` to names of architectural registers and
+    ``aliases`` to sub-registers of them.
+
+    Args:
+        values: Initial values of registers or aliases, others are zero.
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    registers: ClassVar[_Registers] = {}
+    aliases: ClassVar[_Aliases] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        for name, data_type in cls.registers.items():
+            slot = getattr(cls, "_" + name)
+            setattr(cls, name, _Alias(slot, data_type, zero_extend=True))
+
+        for name, (register, data_type, shift, zero_extend) in cls.aliases.items():
+            slot = getattr(cls, "_" + register)
+            setattr(cls, name, _Alias(slot, data_type, shift, zero_extend))
+
+    def __init__(self, **values: SupportsInt):
+        for name in self.registers:
+            setattr(self, "_" + name, 0)
+
+        for name, value in values.items():
+            if not hasattr(type(self), name):
+                raise AttributeError("Unknown register: %s" % name)
+
+            setattr(self, name, value)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Get values of architectural registers."""
+        return {name: getattr(self, "_" + name) for name in self.registers}
+
+    def copy(self) -> "Registers":
+        """Copy the register file."""
+        return type(self)(**self.to_dict())
+
+    def __eq__(self, other: Any) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        values = ", ".join(
+            "%s=%#x" % (name, value) for name, value in self.to_dict().items()
+        )
+        return "%s(%s)" % (self.__class__.__name__, values)
+
+
+def _x64_registers() -> Tuple[_Registers, _Aliases]:
+    registers: _Registers = {}
+    aliases: _Aliases = {}
+
+    for name in ("a", "b", "c", "d"):
+        register = "r%sx" % name
+        registers[register] = UInt64
+        aliases["e%sx" % name] = (register, UInt32, 0, True)
+        aliases["%sx" % name] = (register, UInt16, 0, False)
+        aliases["%sl" % name] = (register, UInt8, 0, False)
+        aliases["%sh" % name] = (register, UInt8, 8, False)
+
+    for name in ("si", "di", "bp", "sp"):
+        register = "r%s" % name
+        registers[register] = UInt64
+        aliases["e%s" % name] = (register, UInt32, 0, True)
+        aliases[name] = (register, UInt16, 0, False)
+        aliases["%sl" % name] = (register, UInt8, 0, False)
+
+    for i in range(8, 16):
+        register = "r%d" % i
+        registers[register] = UInt64
+        aliases["r%dd" % i] = (register, UInt32, 0, True)
+        aliases["r%dw" % i] = (register, UInt16, 0, False)
+        aliases["r%db" % i] = (register, UInt8, 0, False)
+
+    registers["rip"] = UInt64
+    registers["rflags"] = UInt64
+
+    return registers, aliases
+
+
+class X64Registers(Registers):
+    """Registers of x86-64.
+
+    General purpose registers ``rax`` to ``r15`` have aliases such as ``eax``,
+    ``ax``, ``al``, ``ah``, ``r8d``, ``r8w`` and ``r8b``. Writes of 32-bit
+    aliases zero extend into the 64-bit register, and writes of 8-bit and
+    16-bit aliases keep other bits.
+    """
+
+    registers, aliases = _x64_registers()
+
+    __slots__ = tuple("_" + name for name in registers)
+
+
+def _aarch64_registers() -> Tuple[_Registers, _Aliases]:
+    registers: _Registers = {}
+    aliases: _Aliases = {}
+
+    for i in range(31):
+        register = "x%d" % i
+        registers[register] = UInt64
+        aliases["w%d" % i] = (register, UInt32, 0, True)
+
+    aliases["fp"] = ("x29", UInt64, 0, True)
+    aliases["lr"] = ("x30", UInt64, 0, True)
+
+    registers["sp"] = UInt64
+    aliases["wsp"] = ("sp", UInt32, 0, True)
+
+    registers["pc"] = UInt64
+    registers["nzcv"] = UInt64
+
+    return registers, aliases
+
+
+class AArch64Registers(Registers):
+    """Registers of AArch64.
+
+    General purpose registers ``x0`` to ``x30`` have 32-bit aliases ``w0`` to
+    ``w30``, whose writes zero extend. ``fp`` and ``lr`` are ``x29`` and
+    ``x30``, and ``xzr`` and ``wzr`` are always zero.
+    """
+
+    registers, aliases = _aarch64_registers()
+
+    __slots__ = tuple("_" + name for name in registers)
+
+    xzr = _Zero(UInt64)
+    wzr = _Zero(UInt32)
@@ -0,0 +1,212 @@
+"""Search inputs which make a ported routine return a target value.
+
+``search`` splits a domain of integers into chunks and evaluates them in a
+pool of processes. A chunk is evaluated with ``batch_func`` in vectorised
+batches if it is given, or with ``func`` one input at a time otherwise. If
+``batch_func`` fails on a chunk, such as when NumPy is missing or the routine
+uses an operation which isn't vectorised, the chunk is evaluated with ``func``
+instead::
+
+    def check(x):
+        return license_hash(uint32(x))
+
+    def check_batch(x):
+        # The same routine written with NumPy arrays of uint64.
+        ...
+
+    found = search(check, 0x53683477, range(1 << 32), batch_func=check_batch)
+
+``batch_func`` requires NumPy, install it with ``pip install fishbones[simd]``.
+"""
+
+import json
+import os
+import warnings
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+# The domain of 32 bits inputs.
+DOMAIN_32 = range(1 << 32)
+
+# Function being searched in the current worker process.
+_state: Optional[Tuple[Callable[[int], Any], Any, Optional[Callable], int]] = None
+
+
+def _initialize(
+    func: Callable[[int], Any],
+    target: Any,
+    batch_func: Optional[Callable],
+    batch_size: int,
+):
+    global _state
+    _state = (func, target, batch_func, batch_size)
+
+
+def _search_range(domain: range) -> List[int]:
+    """Search a range in the current process."""
+    assert _state is not None
+    func, target, batch_func, batch_size = _state
+
+    if batch_func is not None:
+        try:
+            return _search_batches(domain, batch_func, target, batch_size)
+        except Exception as e:
+            warnings.warn(
+                "batch_func failed, searching the chunk with func: %r" % e,
+                RuntimeWarning,
+                stacklevel=2,
+            )
+
+    return [x for x in domain if func(x) == target]
+
+
+def _search_batches(
+    domain: range, batch_func: Callable, target: Any, batch_size: int
+) -> List[int]:
+    """Search a range with ``batch_func`` in vectorised batches."""
+    import numpy as np
+
+    matches: List[int] = []
+    for i in range(0, len(domain), batch_size):
+        part = domain[i : i + batch_size]
+        values = np.arange(part.start, part.stop, part.step, dtype=np.uint64)
+        results = np.asarray(batch_func(values))
+        matches.extend(int(x) for x in values[results == target])
+
+    return matches
+
+
+def _search_chunk(task: Tuple[int, range]) -> Tuple[int, List[int]]:
+    index, domain = task
+    return index, _search_range(domain)
+
+
+def _load_checkpoint(
+    path: str, domain: range, chunk_size: int
+) -> Tuple[Set[int], List[int]]:
+    """Load indexes of searched chunks and matches found in them."""
+    if not os.path.exists(path):
+        return set(), []
+
+    with open(path) as f:
+        data = json.load(f)
+
+    if data["domain"] != [domain.start, domain.stop, domain.step] or (
+        data["chunk_size"] != chunk_size
+    ):
+        raise ValueError("Checkpoint of a different search")
+
+    return set(data["done"]), data["matches"]
+
+
+def _save_checkpoint(
+    path: str, domain: range, chunk_size: int, done: Set[int], matches: List[int]
+):
+    data: Dict[str, Any] = {
+        "domain": [domain.start, domain.stop, domain.step],
+        "chunk_size": chunk_size,
+        "done": sorted(done),
+        "matches": sorted(matches),
+    }
+
+    # Write a temporary file first, so an interrupted write can't break it.
+    temp_path = path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(data, f)
+
+    os.replace(temp_path, path)
+
+
+def search(
+    func: Callable[[int], Any],
+    target: Any,
+    domain: range = DOMAIN_32,
+    batch_func: Optional[Callable] = None,
+    processes: Optional[int] = None,
+    chunk_size: int = 1 << 20,
+    batch_size: int = 1 << 16,
+    limit: Optional[int] = None,
+    progress: Optional[Callable[[int, int, int], Any]] = None,
+    checkpoint: Optional[str] = None,
+) -> List[int]:
+    """Find inputs in ``domain`` for which ``func`` returns ``target``.
+
+    ``func`` and ``batch_func`` must be picklable if ``processes`` is not 1,
+    which means they are defined at the top level of a module.
+
+    Args:
+        func: Called with an ``int`` input, returns a value compared with
+            ``target``.
+        target: The value to find.
+        domain: The inputs to search.
+        batch_func: The vectorised version of ``func``, which is called with a
+            NumPy array of ``uint64`` inputs and returns an array of results.
+            It is used instead of ``func`` if it is given, except for chunks
+            on which it raises.
+        processes: The number of worker processes, ``os.cpu_count()`` by
+            default. If it is 1, chunks are searched in the current process.
+        chunk_size: The number of inputs in a chunk, which is the unit of
+            distribution, progress and checkpoint.
+        batch_size: The number of inputs passed to ``batch_func`` at once.
+        limit: Stop after at least this many matches are found.
+        progress: Called with the number of searched inputs, the number of all
+            inputs and the number of matches after each chunk.
+        checkpoint: Path of a JSON file which searched chunks are saved into.
+            If it exists, the search resumes from it.
+
+    Returns:
+        Sorted matched inputs, at most ``limit`` of them.
+
+    Raises:
+        ValueError: If ``checkpoint`` is saved by a search of another domain or
+            chunk size.
+    """
+    processes = processes or os.cpu_count() or 1
+
+    done: Set[int] = set()
+    matches: List[int] = []
+
+    if checkpoint is not None:
+        done, matches = _load_checkpoint(checkpoint, domain, chunk_size)
+
+    chunk_count = (len(domain) + chunk_size - 1) // chunk_size
+    tasks = [
+        (i, domain[i * chunk_size : (i + 1) * chunk_size])
+        for i in range(chunk_count)
+        if i not in done
+    ]
+    searched = sum(len(domain[i * chunk_size : (i + 1) * chunk_size]) for i in done)
+
+    def finish_chunk(index: int, chunk_matches: List[int]) -> bool:
+        nonlocal searched
+
+        done.add(index)
+        matches.extend(chunk_matches)
+        searched += len(domain[index * chunk_size : (index + 1) * chunk_size])
+
+        if checkpoint is not None:
+            _save_checkpoint(checkpoint, domain, chunk_size, done, matches)
+
+        if progress is not None:
+            progress(searched, len(domain), len(matches))
+
+        return limit is not None and len(matches) >= limit
+
+    if limit is not None and len(matches) >= limit:
+        tasks = []
+
+    initargs = (func, target, batch_func, batch_size)
+
+    if processes == 1 or not tasks:
+        _initialize(*initargs)
+        for task in tasks:
+            if finish_chunk(*_search_chunk(task)):
+                break
+
+    else:
+        with Pool(processes, initializer=_initialize, initargs=initargs) as pool:
+            for index, chunk_matches in pool.imap_unordered(_search_chunk, tasks):
+                if finish_chunk(index, chunk_matches):
+                    break
+
+    return sorted(matches)[:limit]
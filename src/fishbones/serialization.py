@@ -0,0 +1,218 @@
+"""Serialize integers and virtual pointers compactly.
+
+Integer types are pickled as their type id and value. Virtual pointers are
+pickled with their whole buffer, unless the buffer is registered with a name
+by ``register_buffer``, in which case only the name is pickled and the buffer
+registered with the same name is used when unpickling::
+
+    register_buffer("state", state)
+    data = pickle.dumps(vptr(state, UInt32).add(4))
+
+``pack_pointer`` can also serialize only a window of a buffer, and
+``pack_integers`` packs a list of integers of one type into fixed-width bytes.
+"""
+
+import struct
+import sys
+from array import array
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Type
+
+from .integer import _INT_TYPES, _TYPE_IDS, Integer
+from .virtual_pointer import VirtualPointer
+
+_buffers: Dict[str, Any] = {}
+_names: Dict[int, str] = {}
+
+# Kinds of packed pointers.
+_EMBEDDED = 0
+_NAMED = 1
+
+_POINTER_HEADER = struct.Struct("<BBQ")
+_INTEGERS_HEADER = struct.Struct("<BI")
+
+
+def _find_typecodes() -> Dict[Type[Integer], str]:
+    """Find typecodes of ``array`` matching integer types on this platform."""
+    typecodes: Dict[Type[Integer], str] = {}
+
+    for int_type in _INT_TYPES:
+        for typecode in ("bhilq" if int_type._signed else "BHILQ"):
+            if array(typecode).itemsize == int_type._size:
+                typecodes[int_type] = typecode
+                break
+
+    return typecodes
+
+
+_TYPECODES = _find_typecodes()
+
+
+def register_buffer(name: str, buffer: Any):
+    """Register a buffer, so that pointers to it are serialized by name.
+
+    Raises:
+        ValueError: If the buffer is already registered with another name.
+    """
+    registered = _names.get(id(buffer))
+    if registered is not None and registered != name:
+        raise ValueError("Buffer is already registered: %s" % registered)
+
+    unregister_buffer(name)
+
+    _buffers[name] = buffer
+    _names[id(buffer)] = name
+
+
+def unregister_buffer(name: str):
+    """Unregister a buffer, it does nothing if ``name`` is not registered."""
+    buffer = _buffers.pop(name, None)
+    if buffer is not None:
+        del _names[id(buffer)]
+
+
+def get_buffer(name: str) -> Any:
+    """Get a registered buffer.
+
+    Raises:
+        ValueError: If ``name`` is not registered.
+    """
+    try:
+        return _buffers[name]
+    except KeyError as e:
+        raise ValueError("Buffer is not registered: %s" % name) from e
+
+
+def reduce_pointer(ptr: VirtualPointer):
+    """Implementation of ``VirtualPointer.__reduce__``.
+
+    Pointers are restored as ``VirtualPointer``, even if they are of a
+    subclass. The buffer is reduced as the object itself, so pointers to the
+    same buffer still share one after ``pickle`` or ``copy.deepcopy``. Buffers
+    other than ``bytes`` and ``bytearray``, such as ``memoryview``, are copied
+    into a ``bytearray``.
+    """
+    name = _names.get(id(ptr.source))
+    type_id = _TYPE_IDS[ptr.data_type]
+
+    if name is not None:
+        return _named_pointer, (name, type_id, ptr.offset)
+
+    source = ptr.source
+    if not isinstance(source, (bytes, bytearray)):
+        source = bytearray(source)
+
+    return _embedded_pointer, (source, type_id, ptr.offset)
+
+
+def _named_pointer(name: str, type_id: int, offset: int) -> VirtualPointer:
+    return VirtualPointer(get_buffer(name), _INT_TYPES[type_id], offset)
+
+
+def _embedded_pointer(source: bytearray, type_id: int, offset: int) -> VirtualPointer:
+    return VirtualPointer(source, _INT_TYPES[type_id], offset)
+
+
+def pack_pointer(ptr: VirtualPointer, size: Optional[int] = None) -> bytes:
+    """Serialize a pointer.
+
+    Args:
+        ptr: The pointer to serialize.
+        size: Only serialize this many bytes from the pointer, which are
+            unpacked into a new buffer. Otherwise, the pointer is serialized
+            by name if its buffer is registered, or with the whole buffer.
+    """
+    type_id = _TYPE_IDS[ptr.data_type]
+
+    if size is not None:
+        header = _POINTER_HEADER.pack(_EMBEDDED, type_id, 0)
+        return header + bytes(ptr.source[ptr.offset : ptr.offset + size])
+
+    name = _names.get(id(ptr.source))
+    if name is not None:
+        header = _POINTER_HEADER.pack(_NAMED, type_id, ptr.offset)
+        return header + name.encode()
+
+    return _POINTER_HEADER.pack(_EMBEDDED, type_id, ptr.offset) + bytes(ptr.source)
+
+
+def unpack_pointer(data: bytes) -> VirtualPointer:
+    """Deserialize a pointer serialized by ``pack_pointer``.
+
+    Raises:
+        ValueError: If the pointer refers to a buffer which is not registered.
+    """
+    kind, type_id, offset = _POINTER_HEADER.unpack_from(data)
+    body = data[_POINTER_HEADER.size :]
+
+    if kind == _NAMED:
+        return _named_pointer(bytes(body).decode(), type_id, offset)
+
+    return _embedded_pointer(bytearray(body), type_id, offset)
+
+
+def pack_integers(
+    values: Iterable[Integer], data_type: Optional[Type[Integer]] = None
+) -> bytes:
+    """Pack integers of the same type into bytes.
+
+    Args:
+        values: Integers to pack.
+        data_type: The type of packed values. If it is None, it is the type of
+            the first value, and all values must be of it.
+
+    Raises:
+        ValueError: If values are of different types and ``data_type`` is not
+            given.
+    """
+    values = list(values)
+
+    if data_type is None:
+        data_type = type(values[0]) if values else _INT_TYPES[0]
+
+        if any(type(v) is not data_type for v in values):
+            raise ValueError("Integers of different types")
+
+        ints = [int(v) for v in values]
+
+    else:
+        ints = [int(data_type(v)) for v in values]
+
+    header = _INTEGERS_HEADER.pack(_TYPE_IDS[data_type], len(ints))
+
+    typecode = _TYPECODES.get(data_type)
+    if typecode is None:
+        size = data_type._size
+        return header + b"".join(
+            v.to_bytes(size, "little", signed=data_type._signed) for v in ints
+        )
+
+    packed = array(typecode, ints)
+    if sys.byteorder != "little":
+        packed.byteswap()
+
+    return header + packed.tobytes()
+
+
+def unpack_integers(data: bytes) -> List[Integer]:
+    """Unpack integers packed by ``pack_integers``."""
+    type_id, count = _INTEGERS_HEADER.unpack_from(data)
+    data_type = _INT_TYPES[type_id]
+    body = data[_INTEGERS_HEADER.size :]
+
+    typecode = _TYPECODES.get(data_type)
+    if typecode is None:
+        size = data_type._size
+        ints: Sequence[int] = [
+            int.from_bytes(
+                body[i * size : (i + 1) * size], "little", signed=data_type._signed
+            )
+            for i in range(count)
+        ]
+
+    else:
+        ints = array(typecode)
+        ints.frombytes(body[: count * ints.itemsize])
+        if sys.byteorder != "little":
+            ints.byteswap()
+
+    return [data_type(v) for v in ints]
@@ -0,0 +1,880 @@
+"""Emulate SSE / AVX integer intrinsics which are used in decompiled code.
+
+Registers are ``M128i`` (``__m128i``) and ``M256i`` (``__m256i``), which hold
+their bytes in a NumPy array. Intrinsics compute on NumPy views of lanes, and
+each lane wraps the same as the integer type of its width. Like the hardware,
+256-bit byte shuffles and byte shifts operate on each 128-bit half separately.
+
+This module requires NumPy, which is installed with ``fishbones[simd]``.
+"""
+
+from typing import Sequence, SupportsInt, Type, TypeVar
+
+from .integer import Int32, Int64, Integer, get_type_size
+from .virtual_pointer import VirtualPointer
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "NumPy is required by fishbones.simd, install fishbones[simd]"
+    ) from e
+
+
+_V = TypeVar("_V", bound="Vector")
+
+# Lane types in little endian, so views are the same on every platform.
+_U8 = np.dtype("<u1")
+_U16 = np.dtype("<u2")
+_U32 = np.dtype("<u4")
+_U64 = np.dtype("<u8")
+_I8 = np.dtype("<i1")
+_I16 = np.dtype("<i2")
+_I32 = np.dtype("<i4")
+
+
+class Vector:
+    """Base class of vector register.
+
+    Args:
+        data: The bytes of the register, in little endian.
+    """
+
+    size = 0
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: "np.ndarray"):
+        if data.dtype != _U8 or data.shape != (self.size,):
+            raise ValueError("Invalid data")
+
+        self.data = data
+
+    def __eq__(self, other):
+        if not isinstance(other, Vector):
+            return NotImplemented
+
+        return type(self) is type(other) and bool(np.array_equal(self.data, other.data))
+
+    def __int__(self) -> int:
+        return int.from_bytes(self.data.tobytes(), "little")
+
+    def __repr__(self) -> str:
+        return "%s(0x%0*x)" % (self.__class__.__name__, self.size * 2, int(self))
+
+    @classmethod
+    def from_bytes(cls: Type[_V], data: bytes) -> _V:
+        """Return a register from given bytes."""
+        return cls(np.frombuffer(bytes(data), dtype=_U8).copy())
+
+    @classmethod
+    def from_int(cls: Type[_V], x: SupportsInt) -> _V:
+        """Return a register from given integer."""
+        mask = (1 << cls.size * 8) - 1
+        return cls.from_bytes((int(x) & mask).to_bytes(cls.size, "little"))
+
+    def to_bytes(self) -> bytes:
+        """Covert this register to bytes."""
+        return self.data.tobytes()
+
+    def lanes(self, dtype) -> "np.ndarray":
+        """Get a view of lanes of this register."""
+        return self.data.view(dtype)
+
+    def get_lane(self, data_type: Type[Integer], index: int) -> Integer:
+        """Get a lane as an integer type."""
+        size = get_type_size(data_type)
+        return data_type.from_bytes(
+            self.data[index * size : (index + 1) * size].tobytes()
+        )
+
+
+class M128i(Vector):
+    """Implementation of `__m128i`."""
+
+    size = 16
+
+    __slots__ = ()
+
+
+class M256i(Vector):
+    """Implementation of `__m256i`."""
+
+    size = 32
+
+    __slots__ = ()
+
+
+def _from_lanes(cls: Type[_V], lanes: "np.ndarray", dtype) -> _V:
+    return cls(np.ascontiguousarray(lanes, dtype=dtype).reshape(-1).view(_U8))
+
+
+def _set(cls: Type[_V], dtype, values: Sequence[SupportsInt]) -> _V:
+    mask = (1 << dtype.itemsize * 8) - 1
+    lanes = np.array([int(v) & mask for v in values], dtype=dtype.newbyteorder("="))
+    return _from_lanes(cls, lanes, dtype)
+
+
+def _set1(cls: Type[_V], dtype, value: SupportsInt) -> _V:
+    return _set(cls, dtype, [value] * (cls.size // dtype.itemsize))
+
+
+def _binary(a: _V, b: Vector, dtype, func) -> _V:
+    return _from_lanes(type(a), func(a.lanes(dtype), b.lanes(dtype)), dtype)
+
+
+def _compare(a: _V, b: Vector, dtype, func) -> _V:
+    mask = func(a.lanes(dtype), b.lanes(dtype))
+    return _from_lanes(type(a), np.where(mask, -1, 0), dtype)
+
+
+def _shift_left(a: _V, count: int, dtype) -> _V:
+    if count >= dtype.itemsize * 8:
+        return type(a)(np.zeros(a.size, dtype=_U8))
+
+    return _from_lanes(type(a), a.lanes(dtype) << count, dtype)
+
+
+def _shift_right(a: _V, count: int, dtype) -> _V:
+    nbits = dtype.itemsize * 8
+
+    if count >= nbits:
+        if dtype.kind == "u":
+            return type(a)(np.zeros(a.size, dtype=_U8))
+
+        count = nbits - 1
+
+    return _from_lanes(type(a), a.lanes(dtype) >> count, dtype)
+
+
+def _blocks(a: Vector, dtype=_U8) -> "np.ndarray":
+    """Get lanes of each 128-bit half as a row."""
+    return a.lanes(dtype).reshape(-1, 16 // np.dtype(dtype).itemsize)
+
+
+def _byte_shift_left(a: _V, count: int) -> _V:
+    blocks = _blocks(a)
+    result = np.zeros_like(blocks)
+
+    if count < 16:
+        result[:, count:] = blocks[:, : 16 - count]
+
+    return type(a)(result.reshape(-1))
+
+
+def _byte_shift_right(a: _V, count: int) -> _V:
+    blocks = _blocks(a)
+    result = np.zeros_like(blocks)
+
+    if count < 16:
+        result[:, : 16 - count] = blocks[:, count:]
+
+    return type(a)(result.reshape(-1))
+
+
+def _shuffle_epi8(a: _V, b: Vector) -> _V:
+    indexes = _blocks(b)
+    result = np.take_along_axis(_blocks(a), indexes & 0x0F, axis=1)
+    result[indexes & 0x80 != 0] = 0
+    return type(a)(result.reshape(-1))
+
+
+def _shuffle_epi32(a: _V, imm: int) -> _V:
+    indexes = [(imm >> (i * 2)) & 3 for i in range(4)]
+    return _from_lanes(type(a), _blocks(a, _U32)[:, indexes], _U32)
+
+
+def _alignr_epi8(a: _V, b: Vector, count: int) -> _V:
+    blocks = _blocks(a)
+    joined = np.concatenate([_blocks(b), blocks, np.zeros_like(blocks)], axis=1)
+    count = min(count, 32)
+    return type(a)(np.ascontiguousarray(joined[:, count : count + 16]).reshape(-1))
+
+
+def _unpack(a: _V, b: Vector, dtype, high: bool) -> _V:
+    blocks_a = _blocks(a, dtype)
+    blocks_b = _blocks(b, dtype)
+    half = blocks_a.shape[1] // 2
+    part = slice(half, None) if high else slice(None, half)
+    result = np.stack([blocks_a[:, part], blocks_b[:, part]], axis=2)
+    return _from_lanes(type(a), result, dtype)
+
+
+def _movemask_epi8(a: Vector) -> Int32:
+    bits = np.packbits(a.data >> 7, bitorder="little")
+    return Int32(int.from_bytes(bits.tobytes(), "little"))
+
+
+def _load(cls: Type[_V], p: VirtualPointer) -> _V:
+    return cls.from_bytes(p.read_bytes(cls.size))
+
+
+def _store(p: VirtualPointer, a: Vector):
+    p.write_bytes(a.to_bytes())
+
+
+# Refer to https://www.intel.com/content/www/us/en/docs/intrinsics-guide/index.html.
+
+
+def mm_loadu_si128(p: VirtualPointer) -> M128i:
+    """Implementation of `_mm_loadu_si128`."""
+    return _load(M128i, p)
+
+
+def mm_load_si128(p: VirtualPointer) -> M128i:
+    """Implementation of `_mm_load_si128`."""
+    return _load(M128i, p)
+
+
+def mm_loadl_epi64(p: VirtualPointer) -> M128i:
+    """Implementation of `_mm_loadl_epi64`."""
+    return M128i.from_bytes(p.read_bytes(8) + bytes(8))
+
+
+def mm_storeu_si128(p: VirtualPointer, a: M128i):
+    """Implementation of `_mm_storeu_si128`."""
+    _store(p, a)
+
+
+def mm_store_si128(p: VirtualPointer, a: M128i):
+    """Implementation of `_mm_store_si128`."""
+    _store(p, a)
+
+
+def mm_storel_epi64(p: VirtualPointer, a: M128i):
+    """Implementation of `_mm_storel_epi64`."""
+    p.write_bytes(a.to_bytes()[:8])
+
+
+def mm_setzero_si128() -> M128i:
+    """Implementation of `_mm_setzero_si128`."""
+    return M128i(np.zeros(16, dtype=_U8))
+
+
+def mm_set1_epi8(a: SupportsInt) -> M128i:
+    """Implementation of `_mm_set1_epi8`."""
+    return _set1(M128i, _U8, a)
+
+
+def mm_set1_epi16(a: SupportsInt) -> M128i:
+    """Implementation of `_mm_set1_epi16`."""
+    return _set1(M128i, _U16, a)
+
+
+def mm_set1_epi32(a: SupportsInt) -> M128i:
+    """Implementation of `_mm_set1_epi32`."""
+    return _set1(M128i, _U32, a)
+
+
+def mm_set1_epi64x(a: SupportsInt) -> M128i:
+    """Implementation of `_mm_set1_epi64x`."""
+    return _set1(M128i, _U64, a)
+
+
+def mm_set_epi8(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_set_epi8`."""
+    return _set(M128i, _U8, args[::-1])
+
+
+def mm_set_epi16(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_set_epi16`."""
+    return _set(M128i, _U16, args[::-1])
+
+
+def mm_set_epi32(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_set_epi32`."""
+    return _set(M128i, _U32, args[::-1])
+
+
+def mm_set_epi64x(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_set_epi64x`."""
+    return _set(M128i, _U64, args[::-1])
+
+
+def mm_setr_epi8(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_setr_epi8`."""
+    return _set(M128i, _U8, args)
+
+
+def mm_setr_epi16(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_setr_epi16`."""
+    return _set(M128i, _U16, args)
+
+
+def mm_setr_epi32(*args: SupportsInt) -> M128i:
+    """Implementation of `_mm_setr_epi32`."""
+    return _set(M128i, _U32, args)
+
+
+def mm_cvtsi32_si128(a: SupportsInt) -> M128i:
+    """Implementation of `_mm_cvtsi32_si128`."""
+    return _set(M128i, _U32, [a, 0, 0, 0])
+
+
+def mm_cvtsi64_si128(a: SupportsInt) -> M128i:
+    """Implementation of `_mm_cvtsi64_si128`."""
+    return _set(M128i, _U64, [a, 0])
+
+
+def mm_cvtsi128_si32(a: M128i) -> Int32:
+    """Implementation of `_mm_cvtsi128_si32`."""
+    return Int32.from_bytes(a.data[:4].tobytes())
+
+
+def mm_cvtsi128_si64(a: M128i) -> Int64:
+    """Implementation of `_mm_cvtsi128_si64`."""
+    return Int64.from_bytes(a.data[:8].tobytes())
+
+
+def mm_extract_epi8(a: M128i, imm: int) -> Int32:
+    """Implementation of `_mm_extract_epi8`."""
+    return Int32(int(a.data[imm & 15]))
+
+
+def mm_extract_epi16(a: M128i, imm: int) -> Int32:
+    """Implementation of `_mm_extract_epi16`."""
+    return Int32(int(a.lanes(_U16)[imm & 7]))
+
+
+def mm_extract_epi32(a: M128i, imm: int) -> Int32:
+    """Implementation of `_mm_extract_epi32`."""
+    return Int32(int(a.lanes(_U32)[imm & 3]))
+
+
+def mm_extract_epi64(a: M128i, imm: int) -> Int64:
+    """Implementation of `_mm_extract_epi64`."""
+    return Int64(int(a.lanes(_U64)[imm & 1]))
+
+
+def mm_insert_epi32(a: M128i, i: SupportsInt, imm: int) -> M128i:
+    """Implementation of `_mm_insert_epi32`."""
+    lanes = a.lanes(_U32).copy()
+    lanes[imm & 3] = int(i) & 0xFFFFFFFF
+    return _from_lanes(M128i, lanes, _U32)
+
+
+def mm_and_si128(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_and_si128`."""
+    return M128i(a.data & b.data)
+
+
+def mm_or_si128(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_or_si128`."""
+    return M128i(a.data | b.data)
+
+
+def mm_xor_si128(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_xor_si128`."""
+    return M128i(a.data ^ b.data)
+
+
+def mm_andnot_si128(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_andnot_si128`."""
+    return M128i(~a.data & b.data)
+
+
+def mm_add_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_add_epi8`."""
+    return _binary(a, b, _U8, np.add)
+
+
+def mm_add_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_add_epi16`."""
+    return _binary(a, b, _U16, np.add)
+
+
+def mm_add_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_add_epi32`."""
+    return _binary(a, b, _U32, np.add)
+
+
+def mm_add_epi64(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_add_epi64`."""
+    return _binary(a, b, _U64, np.add)
+
+
+def mm_sub_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_sub_epi8`."""
+    return _binary(a, b, _U8, np.subtract)
+
+
+def mm_sub_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_sub_epi16`."""
+    return _binary(a, b, _U16, np.subtract)
+
+
+def mm_sub_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_sub_epi32`."""
+    return _binary(a, b, _U32, np.subtract)
+
+
+def mm_sub_epi64(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_sub_epi64`."""
+    return _binary(a, b, _U64, np.subtract)
+
+
+def mm_mullo_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_mullo_epi16`."""
+    return _binary(a, b, _U16, np.multiply)
+
+
+def mm_mullo_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_mullo_epi32`."""
+    return _binary(a, b, _U32, np.multiply)
+
+
+def mm_mul_epu32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_mul_epu32`."""
+    low = np.uint64(0xFFFFFFFF)
+    return _binary(a, b, _U64, lambda x, y: (x & low) * (y & low))
+
+
+def mm_slli_epi16(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_slli_epi16`."""
+    return _shift_left(a, imm, _U16)
+
+
+def mm_slli_epi32(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_slli_epi32`."""
+    return _shift_left(a, imm, _U32)
+
+
+def mm_slli_epi64(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_slli_epi64`."""
+    return _shift_left(a, imm, _U64)
+
+
+def mm_srli_epi16(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_srli_epi16`."""
+    return _shift_right(a, imm, _U16)
+
+
+def mm_srli_epi32(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_srli_epi32`."""
+    return _shift_right(a, imm, _U32)
+
+
+def mm_srli_epi64(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_srli_epi64`."""
+    return _shift_right(a, imm, _U64)
+
+
+def mm_srai_epi16(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_srai_epi16`."""
+    return _shift_right(a, imm, _I16)
+
+
+def mm_srai_epi32(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_srai_epi32`."""
+    return _shift_right(a, imm, _I32)
+
+
+def mm_slli_si128(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_slli_si128`."""
+    return _byte_shift_left(a, imm)
+
+
+def mm_srli_si128(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_srli_si128`."""
+    return _byte_shift_right(a, imm)
+
+
+def mm_shuffle_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_shuffle_epi8`."""
+    return _shuffle_epi8(a, b)
+
+
+def mm_shuffle_epi32(a: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_shuffle_epi32`."""
+    return _shuffle_epi32(a, imm)
+
+
+def mm_alignr_epi8(a: M128i, b: M128i, imm: int) -> M128i:
+    """Implementation of `_mm_alignr_epi8`."""
+    return _alignr_epi8(a, b, imm)
+
+
+def mm_unpacklo_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpacklo_epi8`."""
+    return _unpack(a, b, _U8, high=False)
+
+
+def mm_unpacklo_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpacklo_epi16`."""
+    return _unpack(a, b, _U16, high=False)
+
+
+def mm_unpacklo_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpacklo_epi32`."""
+    return _unpack(a, b, _U32, high=False)
+
+
+def mm_unpacklo_epi64(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpacklo_epi64`."""
+    return _unpack(a, b, _U64, high=False)
+
+
+def mm_unpackhi_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpackhi_epi8`."""
+    return _unpack(a, b, _U8, high=True)
+
+
+def mm_unpackhi_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpackhi_epi16`."""
+    return _unpack(a, b, _U16, high=True)
+
+
+def mm_unpackhi_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpackhi_epi32`."""
+    return _unpack(a, b, _U32, high=True)
+
+
+def mm_unpackhi_epi64(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_unpackhi_epi64`."""
+    return _unpack(a, b, _U64, high=True)
+
+
+def mm_cmpeq_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_cmpeq_epi8`."""
+    return _compare(a, b, _I8, np.equal)
+
+
+def mm_cmpeq_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_cmpeq_epi16`."""
+    return _compare(a, b, _I16, np.equal)
+
+
+def mm_cmpeq_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_cmpeq_epi32`."""
+    return _compare(a, b, _I32, np.equal)
+
+
+def mm_cmpgt_epi8(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_cmpgt_epi8`."""
+    return _compare(a, b, _I8, np.greater)
+
+
+def mm_cmpgt_epi16(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_cmpgt_epi16`."""
+    return _compare(a, b, _I16, np.greater)
+
+
+def mm_cmpgt_epi32(a: M128i, b: M128i) -> M128i:
+    """Implementation of `_mm_cmpgt_epi32`."""
+    return _compare(a, b, _I32, np.greater)
+
+
+def mm_movemask_epi8(a: M128i) -> Int32:
+    """Implementation of `_mm_movemask_epi8`."""
+    return _movemask_epi8(a)
+
+
+def mm256_loadu_si256(p: VirtualPointer) -> M256i:
+    """Implementation of `_mm256_loadu_si256`."""
+    return _load(M256i, p)
+
+
+def mm256_load_si256(p: VirtualPointer) -> M256i:
+    """Implementation of `_mm256_load_si256`."""
+    return _load(M256i, p)
+
+
+def mm256_storeu_si256(p: VirtualPointer, a: M256i):
+    """Implementation of `_mm256_storeu_si256`."""
+    _store(p, a)
+
+
+def mm256_store_si256(p: VirtualPointer, a: M256i):
+    """Implementation of `_mm256_store_si256`."""
+    _store(p, a)
+
+
+def mm256_setzero_si256() -> M256i:
+    """Implementation of `_mm256_setzero_si256`."""
+    return M256i(np.zeros(32, dtype=_U8))
+
+
+def mm256_set1_epi8(a: SupportsInt) -> M256i:
+    """Implementation of `_mm256_set1_epi8`."""
+    return _set1(M256i, _U8, a)
+
+
+def mm256_set1_epi16(a: SupportsInt) -> M256i:
+    """Implementation of `_mm256_set1_epi16`."""
+    return _set1(M256i, _U16, a)
+
+
+def mm256_set1_epi32(a: SupportsInt) -> M256i:
+    """Implementation of `_mm256_set1_epi32`."""
+    return _set1(M256i, _U32, a)
+
+
+def mm256_set1_epi64x(a: SupportsInt) -> M256i:
+    """Implementation of `_mm256_set1_epi64x`."""
+    return _set1(M256i, _U64, a)
+
+
+def mm256_set_epi32(*args: SupportsInt) -> M256i:
+    """Implementation of `_mm256_set_epi32`."""
+    return _set(M256i, _U32, args[::-1])
+
+
+def mm256_setr_epi32(*args: SupportsInt) -> M256i:
+    """Implementation of `_mm256_setr_epi32`."""
+    return _set(M256i, _U32, args)
+
+
+def mm256_castsi128_si256(a: M128i) -> M256i:
+    """Implementation of `_mm256_castsi128_si256`.
+
+    The upper 128 bits are zero.
+    """
+    return M256i(np.concatenate([a.data, np.zeros(16, dtype=_U8)]))
+
+
+def mm256_castsi256_si128(a: M256i) -> M128i:
+    """Implementation of `_mm256_castsi256_si128`."""
+    return M128i(a.data[:16].copy())
+
+
+def mm256_extracti128_si256(a: M256i, imm: int) -> M128i:
+    """Implementation of `_mm256_extracti128_si256`."""
+    offset = (imm & 1) * 16
+    return M128i(a.data[offset : offset + 16].copy())
+
+
+def mm256_inserti128_si256(a: M256i, b: M128i, imm: int) -> M256i:
+    """Implementation of `_mm256_inserti128_si256`."""
+    data = a.data.copy()
+    offset = (imm & 1) * 16
+    data[offset : offset + 16] = b.data
+    return M256i(data)
+
+
+def mm256_permute2x128_si256(a: M256i, b: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_permute2x128_si256`."""
+    halves = [a.data[:16], a.data[16:], b.data[:16], b.data[16:]]
+    result = []
+
+    for control in (imm & 0xF, imm >> 4):
+        if control & 0x8:
+            result.append(np.zeros(16, dtype=_U8))
+        else:
+            result.append(halves[control & 3])
+
+    return M256i(np.concatenate(result))
+
+
+def mm256_permutevar8x32_epi32(a: M256i, idx: M256i) -> M256i:
+    """Implementation of `_mm256_permutevar8x32_epi32`."""
+    return _from_lanes(M256i, a.lanes(_U32)[idx.lanes(_U32) & 7], _U32)
+
+
+def mm256_and_si256(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_and_si256`."""
+    return M256i(a.data & b.data)
+
+
+def mm256_or_si256(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_or_si256`."""
+    return M256i(a.data | b.data)
+
+
+def mm256_xor_si256(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_xor_si256`."""
+    return M256i(a.data ^ b.data)
+
+
+def mm256_andnot_si256(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_andnot_si256`."""
+    return M256i(~a.data & b.data)
+
+
+def mm256_add_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_add_epi8`."""
+    return _binary(a, b, _U8, np.add)
+
+
+def mm256_add_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_add_epi16`."""
+    return _binary(a, b, _U16, np.add)
+
+
+def mm256_add_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_add_epi32`."""
+    return _binary(a, b, _U32, np.add)
+
+
+def mm256_add_epi64(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_add_epi64`."""
+    return _binary(a, b, _U64, np.add)
+
+
+def mm256_sub_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_sub_epi8`."""
+    return _binary(a, b, _U8, np.subtract)
+
+
+def mm256_sub_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_sub_epi16`."""
+    return _binary(a, b, _U16, np.subtract)
+
+
+def mm256_sub_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_sub_epi32`."""
+    return _binary(a, b, _U32, np.subtract)
+
+
+def mm256_sub_epi64(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_sub_epi64`."""
+    return _binary(a, b, _U64, np.subtract)
+
+
+def mm256_mullo_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_mullo_epi16`."""
+    return _binary(a, b, _U16, np.multiply)
+
+
+def mm256_mullo_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_mullo_epi32`."""
+    return _binary(a, b, _U32, np.multiply)
+
+
+def mm256_slli_epi16(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_slli_epi16`."""
+    return _shift_left(a, imm, _U16)
+
+
+def mm256_slli_epi32(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_slli_epi32`."""
+    return _shift_left(a, imm, _U32)
+
+
+def mm256_slli_epi64(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_slli_epi64`."""
+    return _shift_left(a, imm, _U64)
+
+
+def mm256_srli_epi16(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_srli_epi16`."""
+    return _shift_right(a, imm, _U16)
+
+
+def mm256_srli_epi32(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_srli_epi32`."""
+    return _shift_right(a, imm, _U32)
+
+
+def mm256_srli_epi64(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_srli_epi64`."""
+    return _shift_right(a, imm, _U64)
+
+
+def mm256_srai_epi16(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_srai_epi16`."""
+    return _shift_right(a, imm, _I16)
+
+
+def mm256_srai_epi32(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_srai_epi32`."""
+    return _shift_right(a, imm, _I32)
+
+
+def mm256_slli_si256(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_slli_si256`."""
+    return _byte_shift_left(a, imm)
+
+
+def mm256_srli_si256(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_srli_si256`."""
+    return _byte_shift_right(a, imm)
+
+
+def mm256_shuffle_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_shuffle_epi8`."""
+    return _shuffle_epi8(a, b)
+
+
+def mm256_shuffle_epi32(a: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_shuffle_epi32`."""
+    return _shuffle_epi32(a, imm)
+
+
+def mm256_alignr_epi8(a: M256i, b: M256i, imm: int) -> M256i:
+    """Implementation of `_mm256_alignr_epi8`."""
+    return _alignr_epi8(a, b, imm)
+
+
+def mm256_unpacklo_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpacklo_epi8`."""
+    return _unpack(a, b, _U8, high=False)
+
+
+def mm256_unpacklo_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpacklo_epi16`."""
+    return _unpack(a, b, _U16, high=False)
+
+
+def mm256_unpacklo_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpacklo_epi32`."""
+    return _unpack(a, b, _U32, high=False)
+
+
+def mm256_unpacklo_epi64(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpacklo_epi64`."""
+    return _unpack(a, b, _U64, high=False)
+
+
+def mm256_unpackhi_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpackhi_epi8`."""
+    return _unpack(a, b, _U8, high=True)
+
+
+def mm256_unpackhi_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpackhi_epi16`."""
+    return _unpack(a, b, _U16, high=True)
+
+
+def mm256_unpackhi_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpackhi_epi32`."""
+    return _unpack(a, b, _U32, high=True)
+
+
+def mm256_unpackhi_epi64(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_unpackhi_epi64`."""
+    return _unpack(a, b, _U64, high=True)
+
+
+def mm256_cmpeq_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_cmpeq_epi8`."""
+    return _compare(a, b, _I8, np.equal)
+
+
+def mm256_cmpeq_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_cmpeq_epi16`."""
+    return _compare(a, b, _I16, np.equal)
+
+
+def mm256_cmpeq_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_cmpeq_epi32`."""
+    return _compare(a, b, _I32, np.equal)
+
+
+def mm256_cmpgt_epi8(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_cmpgt_epi8`."""
+    return _compare(a, b, _I8, np.greater)
+
+
+def mm256_cmpgt_epi16(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_cmpgt_epi16`."""
+    return _compare(a, b, _I16, np.greater)
+
+
+def mm256_cmpgt_epi32(a: M256i, b: M256i) -> M256i:
+    """Implementation of `_mm256_cmpgt_epi32`."""
+    return _compare(a, b, _I32, np.greater)
+
+
+def mm256_movemask_epi8(a: M256i) -> Int32:
+    """Implementation of `_mm256_movemask_epi8`."""
+    return _movemask_epi8(a)
@@ -0,0 +1,175 @@
+"""Run ported routines over large files chunk by chunk.
+
+``stream`` reads a file into a reused buffer with ``readinto`` and passes
+every chunk to a ported function as a ``VirtualPointer``. The function
+transforms the chunk in place, and the chunk is written to the output in one
+call. A state is carried between chunks, so routines such as stream ciphers
+continue where the last chunk ends::
+
+    def decrypt(chunk, state):
+        rc4_crypt(state, chunk, len(chunk.source))
+        return state
+
+    stream(decrypt, "data.enc", "data.bin", state=rc4_init(key))
+
+Memory used is a few chunk sizes, regardless of the size of the file.
+"""
+
+import os
+from typing import IO, Any, Callable, Optional, Union
+
+from .virtual_pointer import VirtualPointer
+
+_File = Union[str, "os.PathLike[str]", IO[bytes]]
+
+
+def _read_full(f: IO[bytes], view: memoryview) -> int:
+    """Read into ``view`` until it is full or the end of file."""
+    total = 0
+
+    while total < len(view):
+        size = f.readinto(view[total:])  # type: ignore
+        if not size:
+            break
+
+        total += size
+
+    return total
+
+
+def _pointer(view: memoryview) -> VirtualPointer:
+    return VirtualPointer(source=view)  # type: ignore
+
+
+def _stream_chunks(
+    func: Callable[[VirtualPointer, Any], Any],
+    src: IO[bytes],
+    dst: Optional[IO[bytes]],
+    chunk_size: int,
+    state: Any,
+) -> Any:
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+
+    while True:
+        size = _read_full(src, view)
+        if not size:
+            break
+
+        chunk = view[:size]
+        state = func(_pointer(chunk), state)
+
+        if dst is not None:
+            dst.write(chunk)
+
+        if size < chunk_size:
+            break
+
+    return state
+
+
+def _stream_records(
+    func: Callable[[VirtualPointer, Any], Any],
+    src: IO[bytes],
+    dst: Optional[IO[bytes]],
+    chunk_size: int,
+    delimiter: bytes,
+    state: Any,
+) -> Any:
+    buffer = bytearray(chunk_size)
+    filled = 0
+
+    while True:
+        view = memoryview(buffer)
+        size = _read_full(src, view[filled:])
+        eof = filled + size < len(buffer)
+        filled += size
+
+        start = 0
+        while True:
+            end = buffer.find(delimiter, start, filled)
+            if end < 0:
+                break
+
+            state = func(_pointer(view[start:end]), state)
+            start = end + len(delimiter)
+
+        # The last record may not end with the delimiter.
+        if eof and start < filled:
+            state = func(_pointer(view[start:filled]), state)
+            start = filled
+
+        if dst is not None and start:
+            dst.write(view[:start])
+
+        if eof:
+            return state
+
+        remaining = filled - start
+
+        # A record is larger than the buffer.
+        if not start:
+            buffer = bytearray(len(buffer) * 2)
+            buffer[:remaining] = view[start:filled]
+
+        else:
+            buffer[:remaining] = buffer[start:filled]
+
+        filled = remaining
+
+
+def stream(
+    func: Callable[[VirtualPointer, Any], Any],
+    src: _File,
+    dst: Optional[_File] = None,
+    chunk_size: int = 1 << 20,
+    delimiter: Optional[bytes] = None,
+    state: Any = None,
+) -> Any:
+    """Call ``func(chunk, state)`` for every chunk of ``src``.
+
+    ``chunk`` is a ``VirtualPointer`` over a ``memoryview`` of the chunk, so
+    its size is ``len(chunk.source)``. The buffer is reused by the next chunk,
+    so copy what should be kept. ``func`` returns the state passed with the
+    next chunk.
+
+    Args:
+        func: The function to call.
+        src: Path or binary file to read.
+        dst: Path or binary file which chunks are written to after ``func``.
+        chunk_size: The size of chunks. The last chunk may be smaller.
+        delimiter: If it is given, ``func`` is called with every record ended
+            by ``delimiter`` instead of fixed-size chunks. The delimiter is not
+            passed to ``func`` but is written to ``dst``. The buffer grows if a
+            record is larger than ``chunk_size``.
+        state: The state passed with the first chunk.
+
+    Returns:
+        The state returned with the last chunk.
+
+    Raises:
+        ValueError: If ``delimiter`` is empty.
+    """
+    if delimiter is not None and not delimiter:
+        raise ValueError("Empty delimiter")
+
+    src_file = open(src, "rb") if isinstance(src, (str, os.PathLike)) else src
+
+    try:
+        dst_file = open(dst, "wb") if isinstance(dst, (str, os.PathLike)) else dst
+
+        try:
+            if delimiter is None:
+                return _stream_chunks(func, src_file, dst_file, chunk_size, state)
+
+            return _stream_records(
+                func, src_file, dst_file, chunk_size, delimiter, state
+            )
+
+        finally:
+            if dst_file is not dst and dst_file is not None:
+                dst_file.close()
+
+    finally:
+        if src_file is not src:
+            src_file.close()
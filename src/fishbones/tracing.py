@@ -0,0 +1,312 @@
+"""Trace memory accesses of virtual pointers.
+
+``Tracer`` records every ``read``, ``write``, ``read_bytes`` and ``write_bytes``
+of virtual pointers into a ring buffer of arrays, which keeps the latest
+``capacity`` accesses in a few bytes each::
+
+    with Tracer() as tracer:
+        encrypt(data, key)
+
+    hot_pages = tracer.page_heatmap(source=data)
+    tracer.export("encrypt.trace")
+
+Hooks are installed when the tracer is entered and removed when it exits.
+"""
+
+import struct
+import sys
+from array import array
+from collections import Counter
+from typing import Any, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .consts import LITTLE_ENDIAN
+from .virtual_pointer import VirtualPointer
+
+PAGE_SIZE = 4096
+
+# Magic and version of exported trace files.
+_MAGIC = b"FBTRACE\0"
+_VERSION = 1
+
+_HEADER = struct.Struct("<8sHIH")
+
+# The type code of ``read_bytes`` / ``write_bytes``, which have no data type.
+_BYTES = "bytes"
+
+_WRITE = 1
+
+
+class Access(NamedTuple):
+    """A memory access.
+
+    Attributes:
+        buffer: The index of the accessed buffer in ``Tracer.sources``.
+        offset: The offset of the access in the buffer.
+        size: The number of accessed bytes.
+        data_type: The name of the accessed type, ``"bytes"`` for
+            ``read_bytes`` / ``write_bytes``.
+        write: If the access is a write.
+    """
+
+    buffer: int
+    offset: int
+    size: int
+    data_type: str
+    write: bool
+
+
+class Tracer:
+    """Record memory accesses of virtual pointers.
+
+    Accesses are stored in parallel arrays used as a ring buffer. Once
+    ``capacity`` accesses are recorded, the oldest ones are overwritten.
+
+    Args:
+        capacity: The maximum number of kept accesses.
+    """
+
+    def __init__(self, capacity: int = 1 << 20):
+        self.capacity = capacity
+
+        self.offsets = array("q", bytes(8 * capacity))
+        self.sizes = array("I", bytes(4 * capacity))
+        self.kinds = array("H", bytes(2 * capacity))
+        self.buffers = array("H", bytes(2 * capacity))
+
+        # The number of recorded accesses, including overwritten ones.
+        self.count = 0
+
+        self.sources: List[Any] = []
+        self.type_names: List[str] = [_BYTES]
+
+        self._buffer_indexes: Dict[int, int] = {}
+        self._type_codes: Dict[Any, int] = {None: 0}
+        self._patches: List[Tuple[str, Any]] = []
+
+    def __enter__(self) -> "Tracer":
+        self._install()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._uninstall()
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def record(self, source: Any, offset: int, size: int, data_type: Any, kind: int):
+        """Record an access.
+
+        Args:
+            source: The accessed buffer.
+            offset: The offset of the access.
+            size: The number of accessed bytes.
+            data_type: The accessed integer type, or None for bytes.
+            kind: 1 for a write, 0 for a read.
+        """
+        buffer = self._buffer_indexes.get(id(source))
+        if buffer is None:
+            buffer = self._buffer_indexes[id(source)] = len(self.sources)
+            self.sources.append(source)
+
+        code = self._type_codes.get(data_type)
+        if code is None:
+            code = self._type_codes[data_type] = len(self.type_names)
+            self.type_names.append(data_type.__name__.lower())
+
+        i = self.count % self.capacity
+        self.offsets[i] = offset
+        self.sizes[i] = size
+        self.kinds[i] = code << 1 | kind
+        self.buffers[i] = buffer
+        self.count += 1
+
+    def _install(self):
+        record = self.record
+
+        read = VirtualPointer.read
+        write = VirtualPointer.write
+        read_bytes = VirtualPointer.read_bytes
+        write_bytes = VirtualPointer.write_bytes
+
+        def traced_read(ptr, byteorder=LITTLE_ENDIAN):
+            data_type = ptr.data_type
+            record(ptr.source, ptr.offset, data_type._size, data_type, 0)
+            return read(ptr, byteorder=byteorder)
+
+        def traced_write(ptr, value, byteorder=LITTLE_ENDIAN):
+            data_type = ptr.data_type
+            record(ptr.source, ptr.offset, data_type._size, data_type, _WRITE)
+            write(ptr, value, byteorder=byteorder)
+
+        def traced_read_bytes(ptr, size):
+            record(ptr.source, ptr.offset, size, None, 0)
+            return read_bytes(ptr, size)
+
+        def traced_write_bytes(ptr, data):
+            record(ptr.source, ptr.offset, len(data), None, _WRITE)
+            write_bytes(ptr, data)
+
+        for name, func in (
+            ("read", traced_read),
+            ("write", traced_write),
+            ("read_bytes", traced_read_bytes),
+            ("write_bytes", traced_write_bytes),
+        ):
+            self._patches.append((name, VirtualPointer.__dict__[name]))
+            setattr(VirtualPointer, name, func)
+
+    def _uninstall(self):
+        while self._patches:
+            name, func = self._patches.pop()
+            setattr(VirtualPointer, name, func)
+
+    def _indexes(self) -> range:
+        """Get the indexes of kept accesses in the arrays, oldest first."""
+        if self.count <= self.capacity:
+            return range(self.count)
+
+        start = self.count % self.capacity
+        return range(start, start + self.capacity)
+
+    def accesses(self) -> Iterator[Access]:
+        """Iterate over kept accesses, oldest first."""
+        capacity = self.capacity
+
+        for i in self._indexes():
+            i %= capacity
+            kind = self.kinds[i]
+            yield Access(
+                buffer=self.buffers[i],
+                offset=self.offsets[i],
+                size=self.sizes[i],
+                data_type=self.type_names[kind >> 1],
+                write=bool(kind & _WRITE),
+            )
+
+    def _buffer_filter(self, source: Any) -> Optional[int]:
+        if source is None:
+            return None
+
+        buffer = self._buffer_indexes.get(id(source))
+        if buffer is None:
+            raise ValueError("Buffer is not traced")
+
+        return buffer
+
+    def heatmap(
+        self,
+        source: Any = None,
+        granularity: int = 1,
+        write: Optional[bool] = None,
+    ) -> Dict[int, int]:
+        """Count accesses by position.
+
+        An access is counted once in every unit of ``granularity`` bytes it
+        touches.
+
+        Args:
+            source: Only count accesses of this buffer.
+            granularity: The size of counted units.
+            write: Only count writes if it is True, or reads if it is False.
+
+        Returns:
+            Counts mapped from the offsets of units.
+        """
+        buffer = self._buffer_filter(source)
+        counts: Counter = Counter()
+        capacity = self.capacity
+
+        for i in self._indexes():
+            i %= capacity
+            if buffer is not None and self.buffers[i] != buffer:
+                continue
+
+            if write is not None and bool(self.kinds[i] & _WRITE) != write:
+                continue
+
+            offset = self.offsets[i]
+            first = offset // granularity
+            last = (offset + max(self.sizes[i], 1) - 1) // granularity
+
+            for unit in range(first, last + 1):
+                counts[unit * granularity] += 1
+
+        return dict(sorted(counts.items()))
+
+    def page_heatmap(
+        self,
+        source: Any = None,
+        page_size: int = PAGE_SIZE,
+        write: Optional[bool] = None,
+    ) -> Dict[int, int]:
+        """Count accesses by page, see ``heatmap``."""
+        return self.heatmap(source=source, granularity=page_size, write=write)
+
+    def type_counts(self) -> Dict[str, int]:
+        """Count accesses by accessed type."""
+        counts: Counter = Counter()
+        capacity = self.capacity
+
+        for i in self._indexes():
+            counts[self.type_names[self.kinds[i % capacity] >> 1]] += 1
+
+        return dict(counts)
+
+    def export(self, path: str):
+        """Write kept accesses to a binary trace file.
+
+        The file starts with a header (magic, version, number of accesses and
+        number of type names), followed by the type names, each prefixed with
+        its length in a byte. Then come the offsets (int64), sizes (uint32),
+        kinds (uint16, type code << 1 | write) and buffer indexes (uint16) of
+        accesses, each as a little-endian array, oldest first.
+        """
+        start = self.count % self.capacity if self.count > self.capacity else 0
+        end = len(self)
+
+        with open(path, "wb") as f:
+            f.write(_HEADER.pack(_MAGIC, _VERSION, end, len(self.type_names)))
+
+            for name in self.type_names:
+                data = name.encode()
+                f.write(bytes([len(data)]) + data)
+
+            for values in (self.offsets, self.sizes, self.kinds, self.buffers):
+                ordered = values[start:end] + values[:start]
+                if sys.byteorder != "little":
+                    ordered.byteswap()
+                f.write(ordered.tobytes())
+
+    @classmethod
+    def load(cls, path: str) -> "Tracer":
+        """Read a binary trace file written by ``export``.
+
+        The buffers of the returned tracer are unknown, so ``sources`` is
+        empty and accesses can't be filtered by buffer.
+        """
+        with open(path, "rb") as f:
+            magic, version, length, type_count = _HEADER.unpack(f.read(_HEADER.size))
+            if magic != _MAGIC or version != _VERSION:
+                raise ValueError("Invalid trace file")
+
+            tracer = cls(capacity=max(length, 1))
+            tracer.count = length
+
+            tracer.type_names = []
+            for _ in range(type_count):
+                size = f.read(1)[0]
+                tracer.type_names.append(f.read(size).decode())
+
+            for values in (
+                tracer.offsets,
+                tracer.sizes,
+                tracer.kinds,
+                tracer.buffers,
+            ):
+                loaded = array(values.typecode)
+                loaded.frombytes(f.read(values.itemsize * length))
+                if sys.byteorder != "little":
+                    loaded.byteswap()
+                values[:length] = loaded
+
+        return tracer
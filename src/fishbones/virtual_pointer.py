@@ -38,6 +38,9 @@ class VirtualPointer:
         return self.add(other)
 
     def __sub__(self, other):
+        if isinstance(other, VirtualPointer):
+            return self.diff(other)
+
         return self.sub(other)
 
     def __rsub__(self, other):
@@ -48,11 +51,49 @@ class VirtualPointer:
             return False
 
         return (
-            self.source == other.source
+            self.source is other.source
             and self.offset == other.offset
             and self.data_type == other.data_type
         )
 
+    def __lt__(self, other):
+        if not isinstance(other, VirtualPointer):
+            return NotImplemented
+
+        return self._distance(other) < 0
+
+    def __le__(self, other):
+        if not isinstance(other, VirtualPointer):
+            return NotImplemented
+
+        return self._distance(other) <= 0
+
+    def __gt__(self, other):
+        if not isinstance(other, VirtualPointer):
+            return NotImplemented
+
+        return self._distance(other) > 0
+
+    def __ge__(self, other):
+        if not isinstance(other, VirtualPointer):
+            return NotImplemented
+
+        return self._distance(other) >= 0
+
+    def __reduce__(self):
+        from .serialization import reduce_pointer
+
+        return reduce_pointer(self)
+
+    def __copy__(self):
+        return self.copy()
+
+    def _distance(self, other: "VirtualPointer") -> int:
+        if self.source is not other.source:
+            raise ValueError("Pointers to different sources")
+
+        return self.offset - other.offset
+
     @property
     def data_type(self):
         return self._data_type
@@ -93,6 +134,14 @@ class VirtualPointer:
         """Reverse offset this pointer position."""
         return self.add(-num)
 
+    def diff(self, other: "VirtualPointer") -> int:
+        """Get the distance from ``other`` to this pointer in units of data type.
+
+        Raises:
+            ValueError: If the two pointers operate on different sources.
+        """
+        return self._distance(other) // get_type_size(self.data_type)
+
     def cast(self, data_type: Union[Type[Integer], str]) -> "VirtualPointer":
         """Cast to the specified type."""
         obj = self.copy()
@@ -101,31 +150,98 @@ class VirtualPointer:
 
     def read_bytes(self, size: int) -> bytes:
         """Read bytes from source ``bytearray``."""
-        if self.offset + size > len(self.source):
+        if not 0 <= self.offset <= len(self.source) - size:
             raise ValueError("Read out of range")
 
         return bytes(self.source[self.offset : self.offset + size])
 
     def write_bytes(self, data: Union[bytes, bytearray, List[SupportsInt]]):
         """Write bytes into source ``bytearray``."""
-        try:
-            for i, v in enumerate(data):
-                self.source[self.offset + i] = int(v)
+        if not isinstance(data, (bytes, bytearray)):
+            data = bytes([int(v) for v in data])
+
+        if not 0 <= self.offset <= len(self.source) - len(data):
+            raise ValueError("Write out of range")
 
-        except IndexError as e:
-            raise ValueError("Write out of range") from e
+        self.source[self.offset : self.offset + len(data)] = data
 
     def read(self, byteorder: Literal["big", "little"] = LITTLE_ENDIAN) -> Integer:
         """Read an integer from source ``bytearray``."""
-        data = self.read_bytes(get_type_size(self.data_type))
-        return self.data_type.from_bytes(data, byteorder=byteorder)
+        size = get_type_size(self.data_type)
+        if not 0 <= self.offset <= len(self.source) - size:
+            raise ValueError("Read out of range")
+
+        return self.data_type.from_bytes(
+            self.source[self.offset : self.offset + size], byteorder=byteorder
+        )
 
     def write(
         self, value: SupportsInt, byteorder: Literal["big", "little"] = LITTLE_ENDIAN
     ):
         """Write an integer into source ``bytearray``."""
         data = self.data_type(value).to_bytes(byteorder=byteorder)
-        self.write_bytes(data)
+
+        if not 0 <= self.offset <= len(self.source) - len(data):
+            raise ValueError("Write out of range")
+
+        self.source[self.offset : self.offset + len(data)] = data
+
+
+# Unchecked implementations of methods, used by the fast profile. Writes still
+# check their ranges with one comparison, since slice assignment out of range
+# would resize the buffer instead of failing.
+
+
+def _fast_copy(self: VirtualPointer) -> VirtualPointer:
+    obj = object.__new__(self.__class__)
+    obj.__dict__.update(self.__dict__)
+    return obj
+
+
+def _fast_add(self: VirtualPointer, num: int) -> VirtualPointer:
+    obj = self.copy()
+    obj.offset += num * self._data_type._size
+    return obj
+
+
+def _fast_read_bytes(self: VirtualPointer, size: int) -> bytes:
+    return bytes(self.source[self.offset : self.offset + size])
+
+
+def _fast_write_bytes(
+    self: VirtualPointer, data: Union[bytes, bytearray, List[SupportsInt]]
+):
+    if not isinstance(data, (bytes, bytearray)):
+        data = bytes([int(v) for v in data])
+
+    offset = self.offset
+    if not 0 <= offset <= len(self.source) - len(data):
+        raise ValueError("Write out of range")
+
+    self.source[offset : offset + len(data)] = data
+
+
+def _fast_read(
+    self: VirtualPointer, byteorder: Literal["big", "little"] = LITTLE_ENDIAN
+) -> Integer:
+    data_type = self._data_type
+    data = self.source[self.offset : self.offset + data_type._size]
+    return data_type(int.from_bytes(data, byteorder, signed=data_type._signed))
+
+
+def _fast_write(
+    self: VirtualPointer,
+    value: SupportsInt,
+    byteorder: Literal["big", "little"] = LITTLE_ENDIAN,
+):
+    data_type = self._data_type
+    size = data_type._size
+    offset = self.offset
+    if not 0 <= offset <= len(self.source) - size:
+        raise ValueError("Write out of range")
+
+    data = (int(value) & data_type._mask).to_bytes(size, byteorder)
+    self.source[offset : offset + size] = data
 
 
 def vptr(
@@ -0,0 +1,19 @@
+import pytest
+
+from fishbones.execution import FAST, PROFILES, global_profile
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "checked: test which only holds in the checked profile"
+    )
+
+
+@pytest.fixture(autouse=True, params=PROFILES)
+def profile(request):
+    """Run every test under all execution profiles."""
+    if request.param == FAST and request.node.get_closest_marker("checked"):
+        pytest.skip("Only for checked profile")
+
+    with global_profile(request.param):
+        yield request.param
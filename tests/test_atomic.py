@@ -0,0 +1,84 @@
+import threading
+
+import pytest
+
+from fishbones import atomic, vptr
+from fishbones.integer import Int8, UInt32, UInt64
+
+
+@pytest.mark.parametrize(
+    "func,value,operand,expected,written",
+    [
+        (atomic.fetch_add, 0xFFFFFFFF, 2, 0xFFFFFFFF, 1),
+        (atomic.fetch_sub, 0, 1, 0, 0xFFFFFFFF),
+        (atomic.fetch_and, 0xFF, 0x0F, 0xFF, 0x0F),
+        (atomic.fetch_or, 0xF0, 0x0F, 0xF0, 0xFF),
+        (atomic.fetch_xor, 0xFF, 0x0F, 0xFF, 0xF0),
+        (atomic.fetch_nand, 0xFF, 0x0F, 0xFF, 0xFFFFFFF0),
+        (atomic.add_fetch, 0xFFFFFFFF, 2, 1, 1),
+        (atomic.sub_fetch, 0, 1, 0xFFFFFFFF, 0xFFFFFFFF),
+        (atomic.and_fetch, 0xFF, 0x0F, 0x0F, 0x0F),
+        (atomic.or_fetch, 0xF0, 0x0F, 0xFF, 0xFF),
+        (atomic.xor_fetch, 0xFF, 0x0F, 0xF0, 0xF0),
+        (atomic.nand_fetch, 0xFF, 0x0F, 0xFFFFFFF0, 0xFFFFFFF0),
+        (atomic.exchange, 5, 7, 5, 7),
+    ],
+)
+def test_fetch(func, value, operand, expected, written):
+    ptr = vptr(bytearray(8), UInt32).add(1)
+    ptr.write(value)
+
+    result = func(ptr, operand)
+
+    assert type(result) is UInt32
+    assert result == expected
+    assert atomic.load(ptr) == written
+
+
+@pytest.mark.parametrize(
+    "value,expected,desired,written",
+    [
+        (5, 5, 7, 7),
+        (5, 6, 7, 5),
+        (-1, 0xFF, 1, 1),
+    ],
+)
+def test_compare_exchange(value, expected, desired, written):
+    ptr = vptr(bytearray(1), Int8)
+    atomic.store(ptr, value)
+
+    result = atomic.compare_exchange(ptr, expected, desired)
+
+    assert result == value
+    assert ptr.read() == written
+
+
+def test_get_lock():
+    data = bytearray(64)
+
+    # Pointers to the same address share a lock, whatever their types are.
+    assert atomic.get_lock(vptr(data).add(8)) is atomic.get_lock(
+        vptr(data, UInt64).add(1)
+    )
+
+
+def test_threads():
+    data = bytearray(24)
+    counters = [vptr(data, UInt32).add(i) for i in range(4)]
+
+    def run():
+        for _ in range(1000):
+            for counter in counters:
+                atomic.fetch_add(counter, 1)
+
+            atomic.add_fetch(vptr(data, UInt64).add(2), 3)
+
+    threads = [threading.Thread(target=run) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+
+    for thread in threads:
+        thread.join()
+
+    assert [int(counter.read()) for counter in counters] == [8000] * 4
+    assert vptr(data, UInt64).add(2).read() == 8000 * 3
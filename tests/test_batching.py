@@ -0,0 +1,85 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+
+from fishbones import uint32
+from fishbones.batching import Batcher
+
+
+def decode_batch(tokens):
+    return [int(uint32(t) * 0x9E3779B1) for t in tokens]
+
+
+def decode_array(tokens):
+    return (tokens * 0x9E3779B1) & 0xFFFFFFFF
+
+
+def fail(tokens):
+    raise RuntimeError("Failed")
+
+
+async def gather(batcher, count):
+    return await asyncio.gather(*(batcher(i) for i in range(count)))
+
+
+def test_batcher():
+    sizes = []
+
+    def func(tokens):
+        sizes.append(len(tokens))
+        return decode_batch(tokens)
+
+    batcher = Batcher(func, max_size=16, delay=0.01)
+    results = asyncio.run(gather(batcher, 40))
+
+    assert results == decode_batch(range(40))
+    assert sizes == [16, 16, 8]
+
+
+def test_batcher_delay():
+    sizes = []
+
+    def func(tokens):
+        sizes.append(len(tokens))
+        return tokens
+
+    async def main():
+        batcher = Batcher(func, max_size=100, delay=0.01)
+        first = asyncio.ensure_future(gather(batcher, 3))
+        await asyncio.sleep(0.05)
+        second = await gather(batcher, 2)
+        return await first, second
+
+    assert asyncio.run(main()) == ([0, 1, 2], [0, 1])
+    assert sizes == [3, 2]
+
+
+@pytest.mark.parametrize("executor_type", [ThreadPoolExecutor, ProcessPoolExecutor])
+def test_batcher_executor(executor_type):
+    async def main(executor):
+        async with Batcher(decode_batch, max_size=8, executor=executor) as batcher:
+            return await gather(batcher, 20)
+
+    with executor_type(2) as executor:
+        assert asyncio.run(main(executor)) == decode_batch(range(20))
+
+
+def test_batcher_dtype():
+    np = pytest.importorskip("numpy")
+
+    batcher = Batcher(decode_array, max_size=8, dtype=np.uint64)
+    assert asyncio.run(gather(batcher, 20)) == decode_batch(range(20))
+
+
+def test_batcher_error():
+    async def main():
+        batcher = Batcher(fail)
+        return await asyncio.gather(batcher(1), batcher(2), return_exceptions=True)
+
+    results = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) for r in results)
+
+    batcher = Batcher(lambda tokens: tokens[:1])
+    with pytest.raises(ValueError):
+        asyncio.run(gather(batcher, 2))
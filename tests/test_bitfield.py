@@ -0,0 +1,102 @@
+import pytest
+
+from fishbones import int16, uint8, uint32, vptr
+from fishbones.bitfield import Bitfield, Field, extract, insert
+from fishbones.integer import Int16, UInt8, UInt16, UInt32
+
+
+class Header(Bitfield):
+    data_type = UInt16
+
+    kind = Field(0, 3)
+    flag = Field(3, 1)
+    delta = Field(4, 4, signed=True)
+    length = Field(11, 5)
+
+
+class ExtendedHeader(Header):
+    extra = Field(8, 3)
+
+
+@pytest.mark.parametrize(
+    "x,lo,width,expected",
+    [
+        (uint32(0x53683477), 11, 5, uint32(0x6)),
+        (uint32(0x53683477), 0, 32, uint32(0x53683477)),
+        (int16(-1), 4, 8, int16(0xFF)),
+        (uint8(0xA5), 4, 4, uint8(0xA)),
+        (0x53683477, 16, 8, 0x68),
+    ],
+)
+def test_extract(x, lo, width, expected):
+    result = extract(x, lo, width)
+
+    assert type(result) is type(expected)
+    assert int(result) == int(expected)
+
+
+@pytest.mark.parametrize(
+    "x,lo,width,value,expected",
+    [
+        (uint32(0x53683477), 11, 5, 0x1F, uint32(0x5368FC77)),
+        (uint32(0x53683477), 0, 8, 0x1FF, uint32(0x536834FF)),
+        (int16(-1), 4, 8, 0, int16(-0xFF1)),
+        (uint8(0xA5), 4, 4, uint8(0x3), uint8(0x35)),
+        (0, 4, 4, 0xF, 0xF0),
+    ],
+)
+def test_insert(x, lo, width, value, expected):
+    result = insert(x, lo, width, value)
+
+    assert type(result) is type(expected)
+    assert int(result) == int(expected)
+
+
+def test_bitfield():
+    header = Header(0x5ADB)
+
+    assert header.kind == 0x3
+    assert header.flag == 1
+    assert header.delta == -0x3
+    assert header.length == 0xB
+
+    header.length += 1
+    header.delta = 7
+    header.flag = 0
+
+    assert header.length == 0xC
+    assert header.delta == 7
+    assert isinstance(header.value, UInt16)
+    assert int(header) == 0x6273
+    assert repr(header) == "Header(kind=3, flag=0, delta=7, length=12)"
+
+
+def test_bitfield_pointer():
+    data = bytearray(b"\x00\x00\x5b\x5a")
+    header = Header(vptr(data).add(2), kind=7)
+
+    assert data == b"\x00\x00\x5f\x5a"
+    assert header.length == 0xB
+
+    data[3] = 0x0A
+    assert header.length == 0x1
+
+
+def test_bitfield_subclass():
+    header = ExtendedHeader(Int16(-1), extra=0)
+
+    assert header.extra == 0
+    assert header.length == 0x1F
+    assert int(header) == 0xF8FF
+
+    with pytest.raises(AttributeError):
+        Header(unknown=1)
+
+    with pytest.raises(ValueError):
+
+        class Invalid(Bitfield):
+            data_type = UInt8
+
+            field = Field(4, 5)
+
+    assert UInt32 is Bitfield.data_type
@@ -0,0 +1,53 @@
+import numpy as np
+import pytest
+
+from fishbones import bits
+
+
+@pytest.mark.parametrize(
+    "value,expected",
+    [
+        (0, 0),
+        (0x53683477, 16),
+        (2**100 - 1, 100),
+        (-7, 3),
+    ],
+)
+def test_bit_count(value, expected):
+    assert bits.bit_count(value) == expected
+    assert bits._table_bit_count(value) == expected
+
+
+@pytest.mark.parametrize(
+    "func,values,dtype,expected",
+    [
+        (bits.popcount_array, [0, 1, 0x53683477, -1], np.uint32, [0, 1, 16, 32]),
+        (bits.popcount_array, [0, -1, -128], np.int8, [0, 8, 1]),
+        (bits.parity_array, [0, 1, 0x53683477, -1], np.uint32, [0, 1, 0, 0]),
+        (bits.clz_array, [0, 1, 0x53683477, -1], np.uint32, [32, 31, 1, 0]),
+        (bits.clz_array, [0, 1, 2**63], np.uint64, [64, 63, 0]),
+        (bits.clz_array, [-1, 1], np.int16, [0, 15]),
+        (bits.ctz_array, [0, 1, 0x53683400, -1], np.uint32, [32, 0, 10, 0]),
+        (bits.ctz_array, [0, 2**63], np.uint64, [64, 63]),
+        (bits.ctz_array, [-8, 0], np.int8, [3, 8]),
+    ],
+)
+def test_array(func, values, dtype, expected):
+    result = func(np.array(values).astype(dtype))
+
+    assert result.tolist() == expected
+
+
+def test_array_table(monkeypatch):
+    # NumPy before 2.0 has no ``bitwise_count``.
+    monkeypatch.delattr(np, "bitwise_count", raising=False)
+
+    values = np.array([[0, 1], [0x53683477, 0xFFFFFFFF]], dtype=np.uint32)
+
+    assert bits.popcount_array(values).tolist() == [[0, 1], [16, 32]]
+    assert bits.clz_array(values).tolist() == [[32, 31], [1, 0]]
+
+
+def test_array_type():
+    with pytest.raises(TypeError):
+        bits.popcount_array(np.array([1.0]))
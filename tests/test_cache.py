@@ -0,0 +1,127 @@
+import gc
+import os
+import weakref
+
+import pytest
+
+from fishbones import uint32, vptr
+from fishbones.cache import cached_table, get_cache_dir
+from fishbones.integer import UInt32
+from fishbones.virtual_pointer import VirtualPointer
+
+calls = []
+
+
+def make_crc_table(poly):
+    calls.append(poly)
+
+    table = vptr(bytearray(1024), UInt32)
+    for i in range(256):
+        c = uint32(i)
+        for _ in range(8):
+            c = (c >> 1) ^ poly if (c & 1) != 0 else c >> 1
+        table.add(i).write(c)
+
+    return table
+
+
+def make_sbox(seed):
+    calls.append(seed)
+    return bytes((i * 7 + seed) & 0xFF for i in range(256)), vptr(bytearray(4))
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    calls.clear()
+    return str(tmp_path)
+
+
+def test_cached_table(cache_dir):
+    func = cached_table(make_crc_table, directory=cache_dir)
+    expected = make_crc_table(0xEDB88320)
+    calls.clear()
+
+    for _ in range(2):
+        table = func(0xEDB88320)
+
+        assert isinstance(table, VirtualPointer)
+        assert table.data_type is UInt32
+        assert [int(table.add(i).read()) for i in range(256)] == [
+            int(expected.add(i).read()) for i in range(256)
+        ]
+
+    assert calls == [0xEDB88320]
+    assert os.path.exists(func.cache_path(0xEDB88320))
+
+    func(0x82F63B78)
+    assert calls == [0xEDB88320, 0x82F63B78]
+
+
+def test_cached_table_tuple(cache_dir):
+    func = cached_table(directory=cache_dir)(make_sbox)
+
+    for _ in range(2):
+        sbox, state = func(seed=3)
+
+        assert bytes(sbox.source) == bytes((i * 7 + 3) & 0xFF for i in range(256))
+        assert len(state.source) == 4
+
+    assert calls == [3]
+
+
+def test_cached_table_copy(cache_dir):
+    func = cached_table(make_crc_table, directory=cache_dir)
+
+    table = func(0xEDB88320).add(1)
+    table.write(0x53683477)
+
+    assert int(table.read()) == 0x53683477
+    assert int(func(0xEDB88320).add(1).read()) == 0x77073096
+
+
+def test_cached_table_integer_args(cache_dir):
+    func = cached_table(make_crc_table, directory=cache_dir)
+
+    for _ in range(2):
+        func(uint32(0xEDB88320))
+
+    assert calls == [0xEDB88320]
+    assert len(os.listdir(cache_dir)) == 1
+    assert func.cache_path(uint32(5)) == func.cache_path(uint32(5))
+    assert func.cache_path(uint32(5)) != func.cache_path(5)
+    assert func.cache_path((uint32(5),)) != func.cache_path(uint32(5))
+
+
+def test_cached_table_unstable_args(cache_dir):
+    func = cached_table(make_crc_table, directory=cache_dir)
+
+    for arg in [object(), [0xEDB88320], (0xEDB88320, 1.5)]:
+        with pytest.raises(TypeError):
+            func(arg)
+
+    assert calls == []
+
+    # Only types are checked, not repr.
+    assert func.cache_path("<object at 0x1>") == func.cache_path("<object at 0x1>")
+
+
+def test_cached_table_close(cache_dir):
+    func = cached_table(make_sbox, directory=cache_dir)
+
+    for _ in range(2):
+        sbox, state = func(3)
+        mapping = weakref.ref(sbox.source.obj)
+        assert state.source.obj is mapping()
+
+        del sbox
+        gc.collect()
+        assert mapping() is not None
+
+        del state
+        gc.collect()
+        assert mapping() is None
+
+
+def test_get_cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("FISHBONES_CACHE_DIR", str(tmp_path))
+    assert get_cache_dir() == str(tmp_path)
@@ -0,0 +1,87 @@
+import pytest
+
+from fishbones import uint32, vptr
+from fishbones.execution import (
+    CHECKED,
+    FAST,
+    get_profile,
+    set_profile,
+    global_profile,
+)
+from fishbones.integer import UInt32
+from fishbones.virtual_pointer import VirtualPointer
+
+
+def test_profile(profile):
+    assert get_profile() == profile
+
+
+def test_global_profile(profile):
+    read = VirtualPointer.read
+
+    with global_profile(FAST):
+        assert get_profile() == FAST
+
+        with global_profile(CHECKED):
+            assert get_profile() == CHECKED
+
+        assert get_profile() == FAST
+
+    assert get_profile() == profile
+    assert VirtualPointer.read is read
+
+
+def test_set_profile():
+    with pytest.raises(ValueError):
+        set_profile("unknown")
+
+
+@pytest.mark.checked
+def test_checked():
+    with pytest.raises(TypeError):
+        uint32(1) + "1"
+
+    with pytest.raises(ValueError):
+        vptr(bytearray(2), UInt32).read()
+
+
+@pytest.mark.parametrize("offset", [4, 3, -1, -4])
+def test_fast_write_out_of_range(offset):
+    data = bytearray(6)
+    p = VirtualPointer(data, UInt32, offset)
+
+    with global_profile(FAST):
+        with pytest.raises(ValueError):
+            p.write(0x53683477)
+
+        with pytest.raises(ValueError):
+            p.write_bytes(b"\x01\x02\x03\x04")
+
+        with pytest.raises(ValueError):
+            p.write_bytes([1, 2, 3, 4])
+
+    assert data == bytearray(6)
+
+
+@pytest.mark.parametrize("offset", [4, 3, -1, -2, -4])
+def test_checked_out_of_range(offset):
+    data = bytearray(6)
+    p = VirtualPointer(data, UInt32, offset)
+
+    with global_profile(CHECKED):
+        with pytest.raises(ValueError):
+            p.read()
+
+        with pytest.raises(ValueError):
+            p.read_bytes(4)
+
+        with pytest.raises(ValueError):
+            p.write(0x11223344)
+
+        with pytest.raises(ValueError):
+            p.write_bytes(b"\x01\x02\x03\x04")
+
+        with pytest.raises(ValueError):
+            p.write_bytes([1, 2, 3, 4])
+
+    assert data == bytearray(6)
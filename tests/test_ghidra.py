@@ -1,6 +1,7 @@
 import pytest
 
-from fishbones import uint16, uint32, uint64
+from fishbones import int8, int32, uint16, uint32, uint64
+from fishbones.decompiler_builtins import ghidra
 from fishbones.decompiler_builtins.ghidra import sub42, zext24, sext48
 
 
@@ -38,3 +39,71 @@ def test_sext(x, expected):
     result = sext48(x)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "name,args,expected",
+    [
+        ("sub53", (0xAABBCCDDEE, 1), 0xBBCCDD),
+        ("sub168", (0x00112233445566778899AABBCCDDEEFF, 8), 0x0011223344556677),
+        ("zext13", (0xAA,), 0xAA),
+        ("sext13", (0xAA,), 0xFFFFAA),
+        ("concat11", (0xAA, 0xBB), 0xAABB),
+        ("concat44", (uint32(0xAABBCCDD), uint32(0x11223344)), 0xAABBCCDD11223344),
+        ("concat31", (0xAABBCC, 0xDD), 0xAABBCCDD),
+        ("zext816", (uint64(0xFFFFFFFFFFFFFFFF),), 0xFFFFFFFFFFFFFFFF),
+        ("concat88", (0x1, 0x2), 0x10000000000000002),
+    ],
+)
+def test_generated(name, args, expected):
+    result = getattr(ghidra, name)(*args)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "name,x,y,expected",
+    [
+        ("carry4", uint32(0xFFFFFFFF), uint32(0), 0),
+        ("carry4", uint32(0xFFFFFFFF), uint32(1), 1),
+        ("scarry4", uint32(0x7FFFFFFF), uint32(0), 0),
+        ("scarry4", uint32(0x7FFFFFFF), uint32(1), 1),
+        ("sborrow4", uint32(0x80000000), uint32(0), 0),
+        ("sborrow4", uint32(0x80000000), uint32(1), 1),
+    ],
+)
+def test_flags(name, x, y, expected):
+    result = getattr(ghidra, name)(x, y)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize("name", ["sub", "sub4", "sub24", "concat99", "carry0", "foo"])
+def test_unknown_name(name):
+    with pytest.raises(AttributeError):
+        getattr(ghidra, name)
+
+
+@pytest.mark.parametrize("name", ["sub21", "zext14", "sext816", "concat44", "carry4"])
+def test_star_import(name):
+    namespace = {}
+    exec("from fishbones.decompiler_builtins.ghidra import *", namespace)
+
+    assert namespace[name] is getattr(ghidra, name)
+    assert name in dir(ghidra)
+
+
+@pytest.mark.parametrize(
+    "func,x,expected",
+    [
+        (ghidra.lzcount, uint32(0x53683477), 1),
+        (ghidra.lzcount, uint16(0), 16),
+        (ghidra.lzcount, int32(-1), 0),
+        (ghidra.popcount, uint64(0x5368347753683477), 32),
+        (ghidra.popcount, int8(-1), 8),
+    ],
+)
+def test_bit_count(func, x, expected):
+    result = func(x)
+
+    assert result == expected
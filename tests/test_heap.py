@@ -0,0 +1,140 @@
+import pytest
+
+from fishbones.heap import Heap, size_class
+from fishbones.integer import UInt32
+
+
+@pytest.mark.parametrize(
+    "size,expected",
+    [
+        (0, 16),
+        (1, 16),
+        (16, 16),
+        (17, 32),
+        (512, 512),
+        (513, 1024),
+        (5000, 8192),
+    ],
+)
+def test_size_class(size, expected):
+    result = size_class(size)
+
+    assert result == expected
+
+
+def test_malloc():
+    heap = Heap()
+    p1 = heap.malloc(8)
+    p2 = heap.malloc(40)
+
+    p1.cast(UInt32).write(0x53683477)
+    p2.cast(UInt32).add(9).write(0x53683477)
+
+    assert p1.source is p2.source
+    assert p2 - p1 == 16
+    assert p1 < p2
+    assert p1.cast(UInt32).read() == 0x53683477
+    assert heap.stats().heap_size == 64
+
+
+def test_free():
+    heap = Heap()
+    p1 = heap.malloc(8)
+    heap.free(p1)
+    p2 = heap.malloc(10)
+
+    assert p2 == p1
+    assert heap.stats().allocations == 1
+
+    with pytest.raises(ValueError):
+        heap.free(p1.add(1))
+
+
+def test_calloc():
+    heap = Heap()
+    p1 = heap.malloc(4)
+    p1.write_bytes(b"\xff" * 4)
+    heap.free(p1)
+    p2 = heap.calloc(2, 2)
+
+    assert p2.read_bytes(4) == bytes(4)
+
+
+@pytest.mark.parametrize(
+    "old_size,new_size,moved",
+    [
+        (4, 12, False),
+        (4, 100, True),
+    ],
+)
+def test_realloc(old_size, new_size, moved):
+    heap = Heap()
+    p1 = heap.malloc(old_size)
+    p1.write_bytes(b"\x01\x02\x03\x04")
+    p2 = heap.realloc(p1, new_size)
+
+    assert (p2 != p1) == moved
+    assert p2.read_bytes(4) == b"\x01\x02\x03\x04"
+    assert heap.stats().in_use == new_size
+
+
+def test_fixed_region():
+    source = bytearray(64)
+    heap = Heap(source, offset=32, size=32)
+    heap.malloc(32)
+
+    with pytest.raises(MemoryError):
+        heap.malloc(1)
+
+
+def test_bounds_check():
+    heap = Heap(bounds_check=True)
+    p = heap.malloc(6).cast(UInt32)
+    p.write(1)
+
+    with pytest.raises(ValueError):
+        p.add(1).read()
+
+    heap.free(p)
+
+    with pytest.raises(ValueError):
+        p.read()
+
+
+def test_bounds_check_reused_block():
+    heap = Heap(bounds_check=True)
+    p = heap.malloc(8).cast(UInt32)
+    heap.free(p)
+
+    # The block is reused by the next allocation of the same size class.
+    q = heap.malloc(8).cast(UInt32)
+    assert q.offset == p.offset
+
+    q.write(1)
+    assert q.read() == 1
+
+    with pytest.raises(ValueError):
+        p.read()
+
+    with pytest.raises(ValueError):
+        p.write(2)
+
+    with pytest.raises(ValueError):
+        heap.free(p)
+
+    heap.free(q)
+
+
+def test_stats():
+    heap = Heap()
+    p1 = heap.malloc(10)
+    heap.malloc(24)
+    heap.free(p1)
+    stats = heap.stats()
+
+    assert stats.heap_size == 48
+    assert stats.in_use == 24
+    assert stats.peak_in_use == 34
+    assert stats.free == 16
+    assert stats.fragmentation == 16 / 48
+    assert stats.internal_fragmentation == 8 / 32
@@ -1,18 +1,74 @@
 import pytest
 
-from fishbones import uint32
+from fishbones import int8, int16, int32, int64, uint8, uint16, uint32, uint64, vptr
+from fishbones.decompiler_builtins import ida
 from fishbones.decompiler_builtins.ida import (
     byten,
     sbyten,
+    hiword,
+    zero_extend,
+    sign_extend,
+    rol,
     rol4,
     ror4,
+    rol8,
+    ror1,
+    mkcshl,
+    mkcshr,
+    sar,
+    shiftleft128,
+    shiftright128,
+    umulh,
+    mulh,
+    umul128,
+    mul128,
     ofsub,
     ofadd,
     cfsub,
     cfadd,
+    add_with_flags,
+    sub_with_flags,
+    adc,
+    sbb,
     bswap32,
     clz,
+    interlocked_increment,
+    interlocked_decrement64,
+    interlocked_exchange_add,
+    interlocked_compare_exchange,
+    interlocked_or8,
+    sync_fetch_and_nand,
+    sync_sub_and_fetch,
+    sync_bool_compare_and_swap,
+    sync_val_compare_and_swap,
+    sync_lock_test_and_set,
+    atomic_fetch_xor,
+    atomic_compare_exchange_n,
+    udiv,
+    sdiv,
+    urem,
+    srem,
+    divsi3,
+    udivdi3,
+    umodsi3,
+    moddi3,
+    ctz,
+    popcount,
+    parity,
+    clz32,
+    clz64,
+    ctz32,
+    ctz64,
+    popcount32,
+    popcount64,
+    parity32,
+    parity64,
+    bit_scan_forward,
+    bit_scan_forward64,
+    bit_scan_reverse,
+    bit_scan_reverse64,
 )
+from fishbones.integer import Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64
 
 
 @pytest.mark.parametrize(
@@ -28,6 +84,80 @@ def test_byte_n(x, n, signed, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "name,x,expected",
+    [
+        ("byte1", uint32(0x53683477), 0x34),
+        ("byte5", int32(-1), 0),
+        ("byte15", uint64(0xFF), 0),
+        ("word1", uint64(0x1122334455667788), 0x5566),
+        ("dword1", int64(-2), 0xFFFFFFFF),
+        ("sbyte3", uint32(0x80000000), -0x80),
+        ("sword1", int32(-2), -1),
+        ("sdword1", uint64(0x7FFFFFFF00000000), 0x7FFFFFFF),
+    ],
+)
+def test_numbered(name, x, expected):
+    result = getattr(ida, name)(x)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize("name", ["byte1", "byte15", "word7", "sdword3", "hiword"])
+def test_star_import(name):
+    namespace = {}
+    exec("from fishbones.decompiler_builtins.ida import *", namespace)
+
+    assert namespace[name] is getattr(ida, name)
+    assert name in dir(ida)
+
+
+@pytest.mark.parametrize("name", ["byte0", "byte16", "word8", "dword4", "qword1"])
+def test_unknown_numbered(name):
+    with pytest.raises(AttributeError):
+        getattr(ida, name)
+
+
+@pytest.mark.parametrize(
+    "x,expected",
+    [
+        (uint32(0x53683477), 0x5368),
+        (uint64(0xFFFFFFFFFFFFFFFF), 0xFFFF),
+    ],
+)
+def test_hiword(x, expected):
+    result = hiword(x)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,to_type,expected",
+    [
+        (int8(-1), UInt16, 0xFF),
+        (uint16(0xFFFF), UInt64, 0xFFFF),
+    ],
+)
+def test_zero_extend(x, to_type, expected):
+    result = zero_extend(x, to_type)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,to_type,expected",
+    [
+        (int8(-1), UInt16, 0xFFFF),
+        (uint16(0x7FFF), UInt32, 0x7FFF),
+        (uint16(0x8000), Int16, -0x8000),
+    ],
+)
+def test_sign_extend(x, to_type, expected):
+    result = sign_extend(x, to_type)
+
+    assert result == expected
+
+
 @pytest.mark.parametrize(
     "value,count,expected",
     [
@@ -54,6 +184,67 @@ def test_ror(value, count, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "func,value,count,expected",
+    [
+        (rol, int8(-0x80), 1, 1),
+        (rol, uint16(0x8001), -1, 0xC000),
+        (rol8, uint64(0x8000000000000001), 4, 0x18),
+        (ror1, uint8(0x01), 1, 0x80),
+        (rol4, uint32(0x53683477), 0, 0x53683477),
+        (ror4, uint32(0x53683477), 32, 0x53683477),
+    ],
+)
+def test_rotate(func, value, count, expected):
+    result = func(value, count)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "func,value,count,expected",
+    [
+        (mkcshl, uint32(0x40000000), 2, 1),
+        (mkcshl, uint32(0x40000000), 1, 0),
+        (mkcshr, uint32(0x2), 2, 1),
+        (mkcshr, int8(-0x80), 8, 1),
+    ],
+)
+def test_mkcsh(func, value, count, expected):
+    result = func(value, count)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "value,count,expected",
+    [
+        (uint32(0x80000000), 4, 0xF8000000),
+        (uint32(0x40000000), 4, 0x04000000),
+        (int8(-0x80), 7, -1),
+    ],
+)
+def test_sar(value, count, expected):
+    result = sar(value, count)
+
+    assert result == expected
+    assert type(result) is type(value)
+
+
+@pytest.mark.parametrize(
+    "func,low,high,shift,expected",
+    [
+        (shiftleft128, 0x8000000000000000, 0x1, 4, 0x18),
+        (shiftright128, 0x10, 0x1, 4, 0x1000000000000001),
+        (shiftleft128, 0x1, 0x2, 0, 0x2),
+    ],
+)
+def test_shift128(func, low, high, shift, expected):
+    result = func(uint64(low), uint64(high), shift)
+
+    assert result == expected
+
+
 @pytest.mark.parametrize(
     "x,y,expected",
     [
@@ -106,6 +297,106 @@ def test_cfadd(x, y, expected):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "x,y,expected",
+    [
+        (uint32(0xFFFFFFFF), uint32(1), (0, 1, 0, 0, 1)),
+        (uint32(0x7FFFFFFF), uint32(1), (0x80000000, 0, 1, 1, 0)),
+        (uint8(0xFF), uint32(1), (0x100, 0, 0, 0, 0)),
+    ],
+)
+def test_add_with_flags(x, y, expected):
+    result = add_with_flags(x, y)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,y,expected",
+    [
+        (uint32(0), uint32(1), (0xFFFFFFFF, 1, 0, 1, 0)),
+        (uint32(0x80000000), uint32(1), (0x7FFFFFFF, 0, 1, 0, 0)),
+        (uint32(1), uint32(1), (0, 0, 0, 0, 1)),
+    ],
+)
+def test_sub_with_flags(x, y, expected):
+    result = sub_with_flags(x, y)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,y,carry,expected",
+    [
+        (uint32(0xFFFFFFFE), uint32(1), 1, (0, 1, 0, 0, 1)),
+        (uint32(0x7FFFFFFE), uint32(1), 1, (0x80000000, 0, 1, 1, 0)),
+    ],
+)
+def test_adc(x, y, carry, expected):
+    result = adc(x, y, carry)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,y,borrow,expected",
+    [
+        (uint32(1), uint32(1), 1, (0xFFFFFFFF, 1, 0, 1, 0)),
+        (uint32(0x80000000), uint32(0), 1, (0x7FFFFFFF, 0, 1, 0, 0)),
+    ],
+)
+def test_sbb(x, y, borrow, expected):
+    result = sbb(x, y, borrow)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "func,args,result_type,expected",
+    [
+        (adc, (0xFFFFFFFF, 1, 0), Int32, (0, 1, 0, 0, 1)),
+        (adc, (1, uint8(0xFF), 0), UInt8, (0, 1, 0, 0, 1)),
+        (sbb, (0, 1, 0), Int32, (-1, 1, 0, 1, 0)),
+        (add_with_flags, (0x7FFFFFFF, 1), Int32, (-0x80000000, 0, 1, 1, 0)),
+        (sub_with_flags, (1, 1), Int32, (0, 0, 0, 0, 1)),
+    ],
+)
+def test_flags_of_int(func, args, result_type, expected):
+    result = func(*args)
+
+    assert result == expected
+    assert type(result.value) is result_type
+
+
+@pytest.mark.parametrize(
+    "func,a,b,expected",
+    [
+        (umulh, uint64(0xFFFFFFFFFFFFFFFF), uint64(0xFFFFFFFFFFFFFFFF), 2**64 - 2),
+        (umulh, uint64(0x100000000), uint64(0x100000000), 1),
+        (mulh, int64(-1), int64(1), -1),
+        (mulh, int64(-(2**63)), int64(-(2**63)), 2**62),
+    ],
+)
+def test_mulh(func, a, b, expected):
+    result = func(a, b)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "func,a,b,high_type,expected",
+    [
+        (umul128, uint64(2**63), uint64(6), UInt64, (0, 3)),
+        (mul128, int64(-2), int64(2**62 + 1), Int64, (2**63 - 2, -1)),
+    ],
+)
+def test_mul128(func, a, b, high_type, expected):
+    high = vptr(bytearray(8), high_type)
+    low = func(a, b, high)
+
+    assert (int(low) & (2**64 - 1), high.read()) == expected
+
+
 @pytest.mark.parametrize(
     "value,expected",
     [
@@ -123,9 +414,122 @@ def test_bswap(value, expected):
     [
         (uint32(0x53), 25),
         (uint32(0x683477), 9),
+        (uint32(0), 32),
+        (int32(-1), 0),
+        (int8(1), 7),
     ],
 )
 def test_clz(x, expected):
     result = clz(x)
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "func,data_type,value,args,expected,written",
+    [
+        (interlocked_increment, UInt32, 0xFFFFFFFF, (), 0, 0),
+        (interlocked_decrement64, Int64, 0, (), -1, -1),
+        (interlocked_exchange_add, UInt16, 0xFFFF, (2,), 0xFFFF, 1),
+        (interlocked_compare_exchange, UInt32, 5, (7, 5), 5, 7),
+        (interlocked_compare_exchange, UInt32, 5, (7, 6), 5, 5),
+        (interlocked_or8, UInt8, 0x0F, (0xF0,), 0x0F, 0xFF),
+        (sync_fetch_and_nand, UInt8, 0x0F, (0x3C,), 0x0F, 0xF3),
+        (sync_sub_and_fetch, UInt32, 0, (1,), 0xFFFFFFFF, 0xFFFFFFFF),
+        (sync_bool_compare_and_swap, UInt32, 5, (5, 7), True, 7),
+        (sync_bool_compare_and_swap, UInt32, 5, (6, 7), False, 5),
+        (sync_val_compare_and_swap, Int16, -1, (0xFFFF, 1), -1, 1),
+        (sync_lock_test_and_set, UInt32, 0, (1,), 0, 1),
+        (atomic_fetch_xor, UInt64, 0xFF, (0x0F, 5), 0xFF, 0xF0),
+    ],
+)
+def test_atomic(func, data_type, value, args, expected, written):
+    ptr = vptr(bytearray(8), data_type)
+    ptr.write(value)
+
+    result = func(ptr, *args)
+
+    assert result == expected
+    assert ptr.read() == written
+
+
+def test_atomic_compare_exchange_n():
+    ptr = vptr(bytearray(4), UInt32)
+    expected = vptr(bytearray(4), UInt32)
+    ptr.write(5)
+
+    assert not atomic_compare_exchange_n(ptr, expected, 7)
+    assert expected.read() == 5
+
+    assert atomic_compare_exchange_n(ptr, expected, 7, True)
+    assert ptr.read() == 7
+
+
+@pytest.mark.parametrize(
+    "func,x,y,expected",
+    [
+        (udiv, int32(-1), 2, 0x7FFFFFFF),
+        (udiv, uint64(2**64 - 1), uint64(3), 0x5555555555555555),
+        (sdiv, uint32(0xFFFFFFF9), 2, 0xFFFFFFFD),
+        (sdiv, int8(-128), -1, -128),
+        (urem, int32(-1), 10, 5),
+        (srem, int32(-7), 2, -1),
+        (srem, int32(7), -2, 1),
+        (divsi3, 0xFFFFFFF9, 2, -3),
+        (udivdi3, -1, 2, 2**63 - 1),
+        (umodsi3, -1, 10, 5),
+        (moddi3, -7, 2, -1),
+    ],
+)
+def test_division(func, x, y, expected):
+    result = func(x, y)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "func,x,expected",
+    [
+        (ctz, uint32(0x53683400), 10),
+        (ctz, uint32(0), 32),
+        (ctz, int16(-8), 3),
+        (popcount, uint32(0x53683477), 16),
+        (popcount, int8(-1), 8),
+        (popcount, int64(-(2**63)), 1),
+        (parity, uint32(0x53683477), 0),
+        (parity, int16(-1), 0),
+        (clz32, 1, 31),
+        (clz32, -1, 0),
+        (clz64, 0x53683477, 33),
+        (ctz32, 0, 32),
+        (ctz64, 2**63, 63),
+        (popcount32, -1, 32),
+        (popcount64, -1, 64),
+        (parity32, 0x53683477, 0),
+        (parity64, 2**64 - 1, 0),
+    ],
+)
+def test_bit_count(func, x, expected):
+    result = func(x)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "func,mask,expected",
+    [
+        (bit_scan_forward, 0x53683400, (1, 10)),
+        (bit_scan_forward, 2**32, (0, 0xFF)),
+        (bit_scan_forward64, 2**40, (1, 40)),
+        (bit_scan_reverse, 0x53683477, (1, 30)),
+        (bit_scan_reverse, -1, (1, 31)),
+        (bit_scan_reverse64, -1, (1, 63)),
+        (bit_scan_reverse64, 0, (0, 0xFF)),
+    ],
+)
+def test_bit_scan(func, mask, expected):
+    index = vptr(bytearray(b"\xff\0\0\0"), UInt32)
+
+    result = func(index, mask)
+
+    assert (result, index.read()) == expected
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+
+import pytest
+
+# Budget of time (microseconds) spent in modules of Fishbones when imported.
+IMPORT_TIME_BUDGET = 50000
+
+
+def import_time(module):
+    """Get self import time (microseconds) of every module with ``-X importtime``."""
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import %s" % module],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        fields = line[len("import time:") :].split("|")
+        if not fields[0].strip().isdigit():
+            continue
+
+        times[fields[2].strip()] = int(fields[0])
+
+    return times
+
+
+@pytest.mark.parametrize(
+    "module",
+    [
+        "fishbones",
+        "fishbones.decompiler_builtins.ida",
+        "fishbones.decompiler_builtins.ghidra",
+    ],
+)
+def test_import_time(module):
+    results = [import_time(module) for _ in range(3)]
+    total = min(
+        sum(t for name, t in times.items() if name.startswith("fishbones"))
+        for times in results
+    )
+
+    assert total < IMPORT_TIME_BUDGET
+    assert "numpy" not in results[0]
+
+
+def test_lazy_import():
+    times = import_time("fishbones")
+
+    assert "fishbones.decompiler_builtins.ida" not in times
+    assert "fishbones.decompiler_builtins.ghidra" not in times
@@ -2,8 +2,8 @@ import operator
 
 import pytest
 
-from fishbones import int8, uint8, uint32
-from fishbones.integer import UInt8, UInt32
+from fishbones import int8, int32, int64, int128, uint8, uint32, uint64, uint128
+from fishbones.integer import Int8, Int32, Int128, UInt8, UInt32, UInt64, UInt128
 
 
 @pytest.mark.parametrize(
@@ -89,6 +89,8 @@ def test_comparison_with_float(x, y, op, expected):
         (int8(1), uint8(1), UInt8),
         (uint8(1), 1, UInt8),
         (uint8(1), uint32(1), UInt32),
+        (uint64(1), uint128(1), UInt128),
+        (int128(1), uint64(1), Int128),
     ],
 )
 def test_type_conversion(x, y, expected):
@@ -101,9 +103,62 @@ def test_type_conversion(x, y, expected):
     "x,y,expected",
     [
         (uint32(0x53683477), uint32(0x53683477), 0xD5708F51),
+        (uint128(2**127), uint128(2), 0),
+        (int128(2**126), int128(2), -(2**127)),
     ],
 )
 def test_overflow(x, y, expected):
     result = x * y
 
     assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,y,op,expected",
+    [
+        (uint8(1), uint32(5), operator.sub, 0xFFFFFFFC),
+        (uint8(8), uint32(2), operator.rshift, 2),
+        (uint8(7), uint32(2), operator.floordiv, 3),
+        (int32(1), int64(-5), operator.sub, 6),
+    ],
+)
+def test_mixed_size_operation(x, y, op, expected):
+    result = op(x, y)
+
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "x,y,op,expected_type,expected",
+    [
+        (int32(-7), int32(2), operator.truediv, Int32, -3),
+        (int32(-7), int32(2), operator.floordiv, Int32, -3),
+        (int32(-7), int32(2), operator.mod, Int32, -1),
+        (int32(7), int32(-2), operator.floordiv, Int32, -3),
+        (int32(7), int32(-2), operator.mod, Int32, 1),
+        (int32(-7), 2, operator.mod, Int32, -1),
+        (-7, int32(2), operator.floordiv, Int32, -3),
+        (-7, int32(2), operator.mod, Int32, -1),
+        (7, int32(-2), operator.truediv, Int32, -3),
+        (int32(-1), uint32(2), operator.truediv, UInt32, 0x7FFFFFFF),
+        (int32(-1), uint32(2), operator.mod, UInt32, 1),
+        (uint32(10), -1, operator.floordiv, UInt32, 0),
+        (int8(-128), int8(-1), operator.truediv, Int8, -128),
+        (uint64(2**64 - 1), uint64(3), operator.truediv, UInt64, 0x5555555555555555),
+        (uint64(2**64 - 1), uint64(10), operator.mod, UInt64, 5),
+        (uint8(200), int32(-3), operator.truediv, Int32, -66),
+    ],
+)
+def test_division(x, y, op, expected_type, expected):
+    result = op(x, y)
+
+    assert type(result) is expected_type
+    assert result == expected
+
+
+def test_division_by_zero():
+    with pytest.raises(ZeroDivisionError):
+        uint32(1) / 0
+
+    with pytest.raises(ZeroDivisionError):
+        int32(-1) % int32(0)
@@ -0,0 +1,185 @@
+import sys
+import zlib
+
+import pytest
+
+from fishbones import parallel, uint32
+from fishbones.execution import FAST, get_profile, global_profile, set_profile
+from fishbones.integer import UInt32
+
+TABLE = bytes(range(256))
+
+# Worker-local state prepared by ``initialize``.
+_base = 0
+
+requires_shared_memory = pytest.mark.skipif(
+    sys.version_info < (3, 8), reason="Shared memory requires Python 3.8"
+)
+
+
+def lookup(item, regions):
+    return regions["table"].add(item).read()
+
+
+def crc32(item, regions):
+    return zlib.crc32(regions["data"].add(item * 16).read_bytes(16))
+
+
+def write_square(item, regions):
+    regions["output"].cast(UInt32).add(item).write(uint32(item) * item)
+
+
+def initialize(regions, base):
+    global _base
+    _base = base + int(regions["table"].add(1).read())
+
+
+def add_base(item, regions):
+    return _base + item
+
+
+@requires_shared_memory
+def test_map():
+    results = parallel.map(lookup, range(256), shared={"table": TABLE}, processes=2)
+    assert results == list(range(256))
+
+
+@requires_shared_memory
+def test_map_unordered():
+    data = bytes(range(256)) * 4
+
+    results = parallel.map(
+        crc32,
+        iter(range(64)),
+        shared={"data": data},
+        processes=3,
+        chunksize=5,
+        ordered=False,
+    )
+    assert sorted(results) == sorted(
+        zlib.crc32(data[i * 16 : (i + 1) * 16]) for i in range(64)
+    )
+
+
+@requires_shared_memory
+def test_map_output():
+    output = bytearray(4 * 100)
+
+    parallel.map(write_square, range(100), shared={"output": output}, processes=2)
+
+    assert output == b"".join(UInt32(i * i).to_bytes() for i in range(100))
+
+
+@requires_shared_memory
+def test_map_initializer():
+    results = parallel.map(
+        add_base,
+        range(10),
+        shared={"table": TABLE},
+        processes=2,
+        initializer=initialize,
+        initargs=(100,),
+    )
+    assert results == list(range(101, 111))
+
+
+@requires_shared_memory
+def test_close():
+    memory = parallel._create_memory(TABLE)
+
+    try:
+        parallel._initialize(lookup, {"table": (memory.name, len(TABLE))}, None, ())
+        assert parallel._call(5) == 5
+
+        parallel._close()
+        assert not parallel._memories
+        assert not parallel._regions
+    finally:
+        memory.close()
+        memory.unlink()
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 8), reason="Shared memory is available")
+def test_map_without_shared_memory():
+    with pytest.raises(ImportError):
+        parallel.map(lookup, range(4), shared={"table": TABLE})
+
+
+def test_thread_map():
+    results = parallel.thread_map(
+        lookup, range(256), shared={"table": TABLE}, threads=4
+    )
+    assert results == list(range(256))
+
+
+def test_thread_map_scratch():
+    data = bytes(range(256)) * 4
+
+    def checksum(item, regions):
+        # Every thread has its own scratch buffer.
+        block = regions["block"]
+        block.write_bytes(regions["data"].add(item * 16).read_bytes(16))
+        return zlib.crc32(block.read_bytes(16))
+
+    results = parallel.thread_map(
+        checksum,
+        iter(range(64)),
+        shared={"data": data},
+        scratch={"block": 16},
+        threads=3,
+        chunksize=5,
+        ordered=False,
+    )
+    assert sorted(results) == sorted(
+        zlib.crc32(data[i * 16 : (i + 1) * 16]) for i in range(64)
+    )
+
+
+def test_thread_map_output():
+    output = bytearray(4 * 100)
+
+    parallel.thread_map(write_square, range(100), shared={"output": output})
+
+    assert output == b"".join(UInt32(i * i).to_bytes() for i in range(100))
+
+
+def test_thread_map_initializer():
+    states = []
+
+    def initialize_thread(regions, base):
+        regions["state"].write(base)
+        states.append(regions["state"])
+
+    def add_state(item, regions):
+        return int(regions["state"].read()) + item
+
+    results = parallel.thread_map(
+        add_state,
+        range(10),
+        scratch={"state": 1},
+        threads=2,
+        initializer=initialize_thread,
+        initargs=(100,),
+    )
+    assert results == list(range(100, 110))
+    assert len({id(state.source) for state in states}) == len(states)
+
+
+def test_thread_map_read_only():
+    with pytest.raises(TypeError):
+        parallel.thread_map(write_square, range(4), shared={"output": bytes(16)})
+
+
+def switch_profile(item, regions):
+    with global_profile(FAST):
+        return item
+
+
+def test_thread_map_profile(profile):
+    with pytest.raises(RuntimeError):
+        parallel.thread_map(switch_profile, range(4), threads=2)
+
+    assert get_profile() == profile
+
+    # Profiles can be switched again once thread_map returns.
+    set_profile(profile)
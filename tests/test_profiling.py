@@ -0,0 +1,114 @@
+import json
+
+import pytest
+
+from fishbones import uint32, vptr
+from fishbones.decompiler_builtins import _built_codes, ghidra, ida
+from fishbones.decompiler_builtins.ida import rol4
+from fishbones.integer import Integer, UInt32
+from fishbones.profiling import Profile
+from fishbones.virtual_pointer import VirtualPointer
+
+
+def test_counts():
+    with Profile() as prof:
+        x = uint32(5) + 3
+        x = x ^ uint32(1)
+        Integer.get_type(type_name="uint64")
+
+    assert prof.get_counts("allocation") == {"UInt32": 4}
+    assert prof.get_counts("operator") == {"UInt32.__add__": 1, "UInt32.__xor__": 1}
+    assert prof.get_counts("lookup") == {"Integer.get_type": 1}
+
+
+@pytest.mark.checked
+def test_pointer():
+    with Profile() as prof:
+        p = vptr(bytearray(8), UInt32).add(1)
+        p.write(1)
+        p.read()
+
+    assert prof.get_counts("allocation") == {"VirtualPointer": 2, "UInt32": 2}
+    assert prof.get_counts("pointer") == {
+        "VirtualPointer.add": 1,
+        "VirtualPointer.copy": 1,
+        "VirtualPointer.write": 1,
+        "VirtualPointer.read": 1,
+    }
+
+
+def test_builtins():
+    with Profile() as prof:
+        rol4(uint32(1), 3)
+        ida.byte1(uint32(0x1234))
+        ida.byte2(uint32(0x1234))
+        ida.byte2(uint32(0x1234))
+        ghidra.concat22(uint32(1), uint32(2))
+        ghidra.concat11(uint32(1), uint32(2))
+
+    assert prof.get_counts("builtin") == {
+        "ida.rol4": 1,
+        "ida.byte1": 1,
+        "ida.byte2": 2,
+        "ghidra.concat22": 1,
+        "ghidra.concat11": 1,
+    }
+
+
+@pytest.mark.parametrize(
+    "module,name",
+    [(ida, "byte3"), (ida, "sdword1"), (ghidra, "zext48"), (ghidra, "carry2")],
+)
+def test_built_codes(module, name):
+    func = getattr(module, name)
+
+    # Functions built by the same builder do not share code objects.
+    assert func.__code__.co_name == name
+    assert _built_codes[func.__code__] == name
+
+
+def test_lines():
+    with Profile(lines=True) as prof:
+        for _ in range(3):
+            uint32(1) + 1
+
+    lines = {
+        (name, filename, count)
+        for (_, name, filename, _), count in prof.line_counts.items()
+    }
+    assert ("UInt32.__add__", __file__, 3) in lines
+
+
+def test_uninstall():
+    add = UInt32.__add__
+    init = VirtualPointer.__init__
+
+    with Profile():
+        assert UInt32.__add__ is not add
+
+    assert UInt32.__add__ is add
+    assert VirtualPointer.__init__ is init
+
+    with Profile() as prof:
+        with pytest.raises(RuntimeError):
+            with Profile():
+                pass
+
+    uint32(1)
+    assert not prof.counts
+
+
+def test_report(tmp_path):
+    with Profile(lines=True) as prof:
+        uint32(1) + 1
+
+    assert "UInt32.__add__" in prof.report()
+
+    path = tmp_path / "profile.json"
+    prof.dump(str(path))
+
+    data = json.loads(path.read_text())
+    assert {"category": "operator", "name": "UInt32.__add__", "count": 1} in data[
+        "counts"
+    ]
+    assert data["lines"]
@@ -0,0 +1,98 @@
+import pytest
+
+from fishbones import uint8, uint32
+from fishbones.integer import UInt8, UInt16, UInt32, UInt64
+from fishbones.registers import AArch64Registers, X64Registers
+
+
+@pytest.mark.parametrize(
+    "name,data_type,expected",
+    [
+        ("rax", UInt64, 0x1122334455667788),
+        ("eax", UInt32, 0x55667788),
+        ("ax", UInt16, 0x7788),
+        ("al", UInt8, 0x88),
+        ("ah", UInt8, 0x77),
+    ],
+)
+def test_x64_read(name, data_type, expected):
+    regs = X64Registers(rax=0x1122334455667788)
+    result = getattr(regs, name)
+
+    assert type(result) is data_type
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "name,value,expected",
+    [
+        ("rax", -1, 0xFFFFFFFFFFFFFFFF),
+        ("eax", 0xAABBCCDD, 0xAABBCCDD),
+        ("ax", 0xAABB, 0x112233445566AABB),
+        ("al", uint8(0xAA), 0x11223344556677AA),
+        ("ah", 0x1AA, 0x112233445566AA88),
+    ],
+)
+def test_x64_write(name, value, expected):
+    regs = X64Registers(rax=0x1122334455667788)
+    setattr(regs, name, value)
+
+    assert regs.rax == expected
+
+
+@pytest.mark.parametrize(
+    "register,aliases",
+    [
+        ("rsi", ("esi", "si", "sil")),
+        ("rsp", ("esp", "sp", "spl")),
+        ("r8", ("r8d", "r8w", "r8b")),
+        ("r15", ("r15d", "r15w", "r15b")),
+    ],
+)
+def test_x64_aliases(register, aliases):
+    regs = X64Registers()
+
+    setattr(regs, register, 0x1122334455667788)
+    for alias in aliases:
+        setattr(regs, alias, 0xFF)
+
+    assert getattr(regs, register) == 0xFF
+    assert regs.rax == 0
+
+
+def test_aarch64():
+    regs = AArch64Registers(x0=-1, lr=0x1000)
+
+    assert regs.w0 == 0xFFFFFFFF
+    assert regs.x30 == 0x1000
+
+    regs.w0 = uint32(5)
+    regs.x29 = 0x2000
+    regs.xzr = 1
+    regs.wsp = 0x123456789
+
+    assert regs.x0 == 5
+    assert regs.fp == 0x2000
+    assert regs.xzr == 0
+    assert type(regs.wzr) is UInt32
+    assert regs.sp == 0x23456789
+
+
+def test_registers():
+    regs = X64Registers(rbx=1, ecx=2)
+    copy = regs.copy()
+
+    assert copy == regs
+    assert copy.to_dict()["rcx"] == 2
+
+    copy.bl = 3
+    assert copy != regs
+    assert regs.rbx == 1
+
+    assert repr(regs).startswith("X64Registers(rax=0x0, rbx=0x1, rcx=0x2,")
+
+    with pytest.raises(AttributeError):
+        X64Registers(x0=1)
+
+    with pytest.raises(AttributeError):
+        regs.foo = 1
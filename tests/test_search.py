@@ -0,0 +1,142 @@
+import json
+
+import pytest
+
+from fishbones import uint32
+from fishbones.decompiler_builtins import ida
+from fishbones.search import search
+
+
+def check(x):
+    v = uint32(x) * 0x9E3779B1
+    return ida.rol4(v, 5) & 0xFFFF
+
+
+def check_batch(x):
+    v = (x * 0x9E3779B1) & 0xFFFFFFFF
+    return ((v << 5) | (v >> 27)) & 0xFFFF
+
+
+def check_batch_partial(x):
+    # Unsupported for some chunks, which are searched with ``check`` instead.
+    if int(x[0]) >= 1 << 15:
+        raise TypeError("Unsupported operation")
+
+    return check_batch(x)
+
+
+EXPECTED = [x for x in range(1 << 16) if check(x) == 0x3477]
+
+
+def test_search():
+    assert search(check, 0x3477, range(1 << 16), processes=1, chunk_size=4096) == (
+        EXPECTED
+    )
+
+
+def test_search_processes():
+    found = search(check, 0x3477, range(1 << 16), processes=2, chunk_size=4096)
+    assert found == EXPECTED
+
+
+def test_search_batch():
+    pytest.importorskip("numpy")
+
+    found = search(
+        check,
+        0x3477,
+        range(1 << 16),
+        batch_func=check_batch,
+        processes=2,
+        chunk_size=4096,
+        batch_size=1000,
+    )
+    assert found == EXPECTED
+
+
+def test_search_batch_fallback():
+    pytest.importorskip("numpy")
+
+    with pytest.warns(RuntimeWarning):
+        found = search(
+            check,
+            0x3477,
+            range(1 << 16),
+            batch_func=check_batch_partial,
+            processes=1,
+            chunk_size=4096,
+            batch_size=1000,
+        )
+
+    assert found == EXPECTED
+
+
+def test_search_batch_fallback_processes():
+    pytest.importorskip("numpy")
+
+    found = search(
+        check,
+        0x3477,
+        range(1 << 16),
+        batch_func=check_batch_partial,
+        processes=2,
+        chunk_size=4096,
+        batch_size=1000,
+    )
+    assert found == EXPECTED
+
+
+def test_search_limit():
+    calls = []
+
+    found = search(
+        check,
+        0x3477,
+        range(1 << 16),
+        processes=1,
+        chunk_size=256,
+        limit=1,
+        progress=lambda *args: calls.append(args),
+    )
+
+    assert found == EXPECTED[:1]
+    assert calls[-1][0] < 1 << 16
+    assert calls[-1][1:] == (1 << 16, 1)
+
+
+def test_search_checkpoint(tmp_path):
+    path = str(tmp_path / "checkpoint.json")
+
+    found = search(
+        check, 0x3477, range(1 << 16), processes=1, chunk_size=1024, checkpoint=path
+    )
+    assert found == EXPECTED
+
+    with open(path) as f:
+        data = json.load(f)
+
+    assert data["done"] == list(range(64))
+
+    # Drop half of searched chunks, they are searched again.
+    data["done"] = data["done"][:32]
+    data["matches"] = [x for x in data["matches"] if x < 32 * 1024]
+    with open(path, "w") as f:
+        json.dump(data, f)
+
+    calls = []
+    found = search(
+        check,
+        0x3477,
+        range(1 << 16),
+        processes=1,
+        chunk_size=1024,
+        checkpoint=path,
+        progress=lambda *args: calls.append(args),
+    )
+
+    assert found == EXPECTED
+    assert len(calls) == 32
+    assert calls[0][0] == 33 * 1024
+
+    with pytest.raises(ValueError):
+        search(check, 0x3477, range(1 << 16), chunk_size=512, checkpoint=path)
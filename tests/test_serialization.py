@@ -0,0 +1,154 @@
+import copy
+import pickle
+
+import pytest
+
+from fishbones import int8, int128, uint16, uint32, uint64, vptr
+from fishbones.integer import Int32, UInt16, UInt32, UInt128
+from fishbones.serialization import (
+    get_buffer,
+    pack_integers,
+    pack_pointer,
+    register_buffer,
+    unpack_integers,
+    unpack_pointer,
+    unregister_buffer,
+)
+
+
+@pytest.fixture
+def buffer():
+    data = bytearray(range(64))
+    register_buffer("test", data)
+    yield data
+    unregister_buffer("test")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [int8(-1), uint16(0x3477), uint32(0x53683477), uint64(1 << 63), int128(-5)],
+)
+def test_pickle_integer(value):
+    loaded = pickle.loads(pickle.dumps(value))
+
+    assert type(loaded) is type(value)
+    assert int(loaded) == int(value)
+
+
+def test_pickle_integer_size():
+    values = [uint32(i) for i in range(100)]
+    assert len(pickle.dumps(values)) < 20 * len(values)
+
+
+def test_pickle_pointer():
+    data = bytearray(range(16))
+    p = vptr(data, UInt32).add(2)
+
+    loaded = pickle.loads(pickle.dumps(p))
+
+    assert loaded.source == data
+    assert loaded.source is not data
+    assert loaded.data_type is UInt32
+    assert loaded.offset == 8
+
+
+def test_copy_pointer():
+    data = bytearray(range(16))
+    p = vptr(data, UInt32).add(2)
+
+    copied = copy.copy(p)
+
+    assert copied == p
+    assert copied is not p
+    assert copied.source is data
+
+
+@pytest.mark.parametrize(
+    "clone", [lambda v: pickle.loads(pickle.dumps(v)), copy.deepcopy]
+)
+def test_clone_pointers_to_one_buffer(clone):
+    data = bytearray(range(16))
+    p, q = clone([vptr(data, UInt32).add(1), vptr(data, UInt16).add(3)])
+
+    assert p.source is q.source
+    assert p.source is not data
+    assert p.source == data
+
+    p.write(0x53683477)
+    assert q.read() == 0x5368
+
+
+def test_pickle_pointer_named(buffer):
+    p = vptr(buffer, UInt32).add(2)
+
+    data = pickle.dumps(p)
+    assert len(data) < 100
+
+    loaded = pickle.loads(data)
+    assert loaded == p
+    assert loaded.data_type is UInt32
+
+    unregister_buffer("test")
+
+    with pytest.raises(ValueError):
+        pickle.loads(data)
+
+    with pytest.raises(ValueError):
+        get_buffer("test")
+
+
+def test_register_buffer_twice(buffer):
+    with pytest.raises(ValueError):
+        register_buffer("other", buffer)
+
+    register_buffer("test", buffer)
+    unregister_buffer("other")
+
+    assert get_buffer("test") is buffer
+    assert pickle.loads(pickle.dumps(vptr(buffer))).source is buffer
+
+
+def test_pack_pointer(buffer):
+    p = vptr(buffer, Int32).add(3)
+
+    loaded = unpack_pointer(pack_pointer(p))
+    assert loaded == p
+
+    window = pack_pointer(p, size=8)
+    loaded = unpack_pointer(window)
+    assert loaded.source == buffer[12:20]
+    assert loaded.offset == 0
+    assert loaded.read() == p.read()
+
+    data = bytearray(range(16))
+    loaded = unpack_pointer(pack_pointer(vptr(data).add(1)))
+    assert loaded.source == data
+    assert loaded.offset == 1
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [],
+        [uint32(0x53683477), uint32(0), uint32(0xFFFFFFFF)],
+        [int8(-1), int8(127)],
+        [int128(-5), int128(1 << 100)],
+    ],
+)
+def test_pack_integers(values):
+    data = pack_integers(values)
+    loaded = unpack_integers(data)
+
+    assert [type(v) for v in loaded] == [type(v) for v in values]
+    assert [int(v) for v in loaded] == [int(v) for v in values]
+
+
+def test_pack_integers_type():
+    values = [uint32(1), uint16(2), 3]
+
+    with pytest.raises(ValueError):
+        pack_integers(values)
+
+    loaded = unpack_integers(pack_integers(values, UInt128))
+    assert [(type(v), int(v)) for v in loaded] == [(UInt128, i) for i in (1, 2, 3)]
+    assert len(pack_integers([uint32(i) for i in range(100)])) == 5 + 400
@@ -0,0 +1,165 @@
+import pytest
+
+pytest.importorskip("numpy")
+
+from fishbones import uint32, vptr  # noqa: E402
+from fishbones.integer import Int32, UInt8, UInt32  # noqa: E402
+from fishbones.simd import (  # noqa: E402
+    M128i,
+    M256i,
+    mm_loadu_si128,
+    mm_storeu_si128,
+    mm_set_epi32,
+    mm_setr_epi32,
+    mm_set1_epi8,
+    mm_set1_epi32,
+    mm_xor_si128,
+    mm_andnot_si128,
+    mm_add_epi32,
+    mm_sub_epi8,
+    mm_mullo_epi32,
+    mm_mul_epu32,
+    mm_slli_epi32,
+    mm_srli_epi32,
+    mm_srai_epi32,
+    mm_slli_si128,
+    mm_srli_si128,
+    mm_shuffle_epi8,
+    mm_shuffle_epi32,
+    mm_alignr_epi8,
+    mm_unpacklo_epi32,
+    mm_unpackhi_epi8,
+    mm_cmpeq_epi32,
+    mm_cmpgt_epi32,
+    mm_movemask_epi8,
+    mm_cvtsi128_si32,
+    mm_extract_epi32,
+    mm256_loadu_si256,
+    mm256_setr_epi32,
+    mm256_shuffle_epi8,
+    mm256_slli_si256,
+    mm256_add_epi32,
+    mm256_extracti128_si256,
+    mm256_permute2x128_si256,
+    mm256_movemask_epi8,
+)
+
+A = mm_setr_epi32(0x53683477, 0xFFFFFFFF, 0x80000000, 0x00000001)
+B = mm_setr_epi32(0x00000001, 0x00000001, 0x80000000, 0x7FFFFFFF)
+
+
+def lanes32(v):
+    return [int(v.get_lane(UInt32, i)) for i in range(v.size // 4)]
+
+
+def test_load_store():
+    data = bytearray(range(20))
+    p = vptr(data)
+    v = mm_loadu_si128(p.add(2))
+
+    assert v.to_bytes() == bytes(range(2, 18))
+
+    mm_storeu_si128(p.add(4), mm_set1_epi8(0xFF))
+
+    assert data[4:20] == b"\xff" * 16
+
+
+@pytest.mark.parametrize(
+    "func,op",
+    [
+        (mm_add_epi32, lambda x, y: x + y),
+        (mm_mullo_epi32, lambda x, y: x * y),
+        (mm_xor_si128, lambda x, y: x ^ y),
+        (mm_andnot_si128, lambda x, y: ~x & y),
+    ],
+)
+def test_lane_semantics(func, op):
+    result = func(A, B)
+    expected = [int(op(uint32(x), uint32(y))) for x, y in zip(lanes32(A), lanes32(B))]
+
+    assert lanes32(result) == expected
+
+
+def test_set():
+    assert mm_set_epi32(4, 3, 2, 1) == mm_setr_epi32(1, 2, 3, 4)
+    assert int(mm_set1_epi32(-1)) == 2**128 - 1
+    assert lanes32(mm_sub_epi8(mm_set1_epi8(0), mm_set1_epi8(1))) == [0xFFFFFFFF] * 4
+
+
+@pytest.mark.parametrize(
+    "func,count,expected",
+    [
+        (mm_slli_epi32, 4, [0x36834770, 0xFFFFFFF0, 0, 0x10]),
+        (mm_srli_epi32, 4, [0x05368347, 0x0FFFFFFF, 0x08000000, 0]),
+        (mm_srai_epi32, 4, [0x05368347, 0xFFFFFFFF, 0xF8000000, 0]),
+        (mm_slli_epi32, 32, [0, 0, 0, 0]),
+        (mm_srai_epi32, 40, [0, 0xFFFFFFFF, 0xFFFFFFFF, 0]),
+    ],
+)
+def test_shift(func, count, expected):
+    result = func(A, count)
+
+    assert lanes32(result) == expected
+
+
+def test_byte_shift():
+    v = M128i.from_bytes(bytes(range(16)))
+
+    assert mm_slli_si128(v, 3).to_bytes() == bytes(3) + bytes(range(13))
+    assert mm_srli_si128(v, 3).to_bytes() == bytes(range(3, 16)) + bytes(3)
+    assert mm_alignr_epi8(v, v, 4).to_bytes() == bytes(range(4, 16)) + bytes(range(4))
+
+
+def test_shuffle():
+    v = M128i.from_bytes(bytes(range(16)))
+    control = M128i.from_bytes(bytes(range(15, -1, -1))[:15] + b"\x80")
+
+    assert mm_shuffle_epi8(v, control).to_bytes() == bytes(range(15, 0, -1)) + b"\x00"
+    assert lanes32(mm_shuffle_epi32(A, 0x1B)) == lanes32(A)[::-1]
+
+
+def test_unpack():
+    a = M128i.from_bytes(bytes(range(16)))
+    b = M128i.from_bytes(bytes(range(16, 32)))
+
+    assert lanes32(mm_unpacklo_epi32(A, B)) == [0x53683477, 1, 0xFFFFFFFF, 1]
+    assert mm_unpackhi_epi8(a, b).to_bytes() == bytes(
+        x for i in range(8, 16) for x in (i, i + 16)
+    )
+
+
+def test_compare():
+    assert lanes32(mm_cmpeq_epi32(A, B)) == [0, 0, 0xFFFFFFFF, 0]
+    assert lanes32(mm_cmpgt_epi32(A, B)) == [0xFFFFFFFF, 0, 0, 0]
+    assert mm_movemask_epi8(mm_cmpeq_epi32(A, B)) == 0x0F00
+
+
+def test_scalar():
+    assert mm_cvtsi128_si32(A) == 0x53683477
+    assert mm_extract_epi32(A, 1) == -1
+    assert type(mm_extract_epi32(A, 1)) is Int32
+    assert lanes32(mm_mul_epu32(A, B)) == [0x53683477, 0, 0, 0x40000000]
+
+
+def test_avx2():
+    data = bytearray(range(32))
+    v = mm256_loadu_si256(vptr(data))
+
+    assert mm256_shuffle_epi8(v, M256i.from_bytes(bytes(32))).to_bytes() == (
+        bytes(16) + bytes([16] * 16)
+    )
+    assert mm256_slli_si256(v, 1).to_bytes() == (
+        b"\x00" + bytes(range(15)) + b"\x00" + bytes(range(16, 31))
+    )
+    assert mm256_extracti128_si256(v, 1).to_bytes() == bytes(range(16, 32))
+    assert mm256_permute2x128_si256(v, v, 0x81).to_bytes() == (
+        bytes(range(16, 32)) + bytes(16)
+    )
+    assert lanes32(mm256_add_epi32(mm256_setr_epi32(*range(8)), v)) == [
+        int(uint32(x) + i) for i, x in enumerate(lanes32(v))
+    ]
+    assert mm256_movemask_epi8(M256i.from_int(-1)) == -1
+
+
+def test_get_lane():
+    assert mm_set1_epi8(0x80).get_lane(UInt8, 3) == 0x80
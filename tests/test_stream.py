@@ -0,0 +1,96 @@
+import io
+
+import pytest
+
+from fishbones.integer import UInt8
+from fishbones.stream import stream
+
+DATA = bytes(range(256)) * 40
+
+
+class ShortReader(io.RawIOBase):
+    """File which returns at most 7 bytes for every read."""
+
+    def __init__(self, data):
+        self.data = io.BytesIO(data)
+
+    def readable(self):
+        return True
+
+    def readinto(self, b):
+        return self.data.readinto(memoryview(b)[:7])
+
+
+def xor_stream(chunk, key):
+    size = len(chunk.source)
+    for i in range(size):
+        p = chunk.add(i)
+        p.write(p.read() ^ key)
+        key = (key * 5 + 1) & 0xFF
+    return key
+
+
+def xor_all(data, key):
+    result = bytearray(data)
+    for i in range(len(result)):
+        result[i] ^= key
+        key = (key * 5 + 1) & 0xFF
+    return bytes(result)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 100, 4096, 1 << 20])
+def test_stream(chunk_size):
+    dst = io.BytesIO()
+
+    stream(xor_stream, io.BytesIO(DATA), dst, chunk_size=chunk_size, state=0x53)
+
+    assert dst.getvalue() == xor_all(DATA, 0x53)
+
+
+def test_stream_short_reads(tmp_path):
+    path = tmp_path / "output.bin"
+
+    stream(xor_stream, ShortReader(DATA), str(path), chunk_size=64, state=0x53)
+
+    assert path.read_bytes() == xor_all(DATA, 0x53)
+
+
+def test_stream_state(tmp_path):
+    path = tmp_path / "input.bin"
+    path.write_bytes(DATA)
+
+    def count(chunk, state):
+        return state + [len(chunk.source)]
+
+    assert stream(count, path, chunk_size=1000, state=[]) == [1000] * 10 + [240]
+
+
+@pytest.mark.parametrize("chunk_size", [4, 16, 1024])
+@pytest.mark.parametrize("data", [b"ab\r\ncde\r\n\r\nf", b"abc\r\n", b""])
+def test_stream_records(chunk_size, data):
+    records = []
+    dst = io.BytesIO()
+
+    def upper(chunk, state):
+        records.append(bytes(chunk.source))
+        for i in range(len(chunk.source)):
+            p = chunk.add(i).cast(UInt8)
+            p.write(p.read() & ~0x20)
+        return state + 1
+
+    count = stream(
+        upper, io.BytesIO(data), dst, chunk_size=chunk_size, delimiter=b"\r\n", state=0
+    )
+
+    expected = data.split(b"\r\n")
+    if expected[-1] == b"":
+        expected.pop()
+
+    assert records == expected
+    assert count == len(expected)
+    assert dst.getvalue() == data.upper()
+
+
+def test_stream_empty_delimiter():
+    with pytest.raises(ValueError):
+        stream(lambda chunk, state: state, io.BytesIO(b"abc"), delimiter=b"")
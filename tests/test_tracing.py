@@ -0,0 +1,83 @@
+import pytest
+
+from fishbones import vptr
+from fishbones.integer import UInt16, UInt32
+from fishbones.tracing import Access, Tracer
+from fishbones.virtual_pointer import VirtualPointer
+
+
+def test_record():
+    data = bytearray(16)
+    other = bytearray(4)
+
+    with Tracer() as tracer:
+        p = vptr(data, UInt32)
+        p.add(1).write(0x53683477)
+        p.add(1).cast(UInt16).read()
+        vptr(other).write_bytes(b"\x01\x02")
+        vptr(other).read_bytes(4)
+
+    assert list(tracer.accesses()) == [
+        Access(buffer=0, offset=4, size=4, data_type="uint32", write=True),
+        Access(buffer=0, offset=4, size=2, data_type="uint16", write=False),
+        Access(buffer=1, offset=0, size=2, data_type="bytes", write=True),
+        Access(buffer=1, offset=0, size=4, data_type="bytes", write=False),
+    ]
+    assert tracer.type_counts() == {"uint32": 1, "uint16": 1, "bytes": 2}
+
+
+def test_ring_buffer():
+    data = bytearray(16)
+
+    with Tracer(capacity=4) as tracer:
+        for i in range(10):
+            vptr(data).add(i).read()
+
+    assert len(tracer) == 4
+    assert tracer.count == 10
+    assert [a.offset for a in tracer.accesses()] == [6, 7, 8, 9]
+
+
+def test_heatmap():
+    data = bytearray(0x3000)
+
+    with Tracer() as tracer:
+        p = vptr(data, UInt32)
+        p.add(1).write(1)
+        p.add(1).read()
+        p.add(0x3FF).read()
+
+    assert tracer.heatmap(source=data, granularity=4) == {
+        4: 2,
+        0xFFC: 1,
+    }
+    assert tracer.heatmap(write=True) == {4: 1, 5: 1, 6: 1, 7: 1}
+    assert tracer.page_heatmap(page_size=0x800) == {0: 2, 0x800: 1}
+    assert tracer.page_heatmap() == {0: 3}
+
+    with pytest.raises(ValueError):
+        tracer.heatmap(source=bytearray(4))
+
+
+def test_uninstall():
+    read = VirtualPointer.read
+
+    with Tracer():
+        assert VirtualPointer.read is not read
+
+    assert VirtualPointer.read is read
+
+
+def test_export(tmp_path):
+    data = bytearray(16)
+
+    with Tracer(capacity=3) as tracer:
+        for i in range(4):
+            vptr(data, UInt16).add(i).write(i)
+        vptr(data).read_bytes(8)
+
+    path = tmp_path / "test.trace"
+    tracer.export(str(path))
+
+    loaded = Tracer.load(str(path))
+    assert list(loaded.accesses()) == list(tracer.accesses())
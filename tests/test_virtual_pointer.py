@@ -1,13 +1,25 @@
 import pytest
 
 from fishbones import vptr
-from fishbones.integer import Int8, Int16, Int32, Int64, UInt8, UInt16, UInt32, UInt64
+from fishbones.integer import (
+    Int8,
+    Int16,
+    Int32,
+    Int64,
+    Int128,
+    UInt8,
+    UInt16,
+    UInt32,
+    UInt64,
+    UInt128,
+)
 
 
 @pytest.mark.parametrize(
     "source_data,read_offset,read_type,expected",
     [
         (bytearray([71, 114, 97, 118, 105, 116, 117, 109]), 4, UInt8, 105),
+        (bytearray(range(16)), 0, UInt128, 0x0F0E0D0C0B0A09080706050403020100),
     ],
 )
 def test_read(source_data, read_offset, read_type, expected):
@@ -26,6 +38,12 @@ def test_read(source_data, read_offset, read_type, expected):
             UInt32(0x53683477),
             bytearray([71, 114, 119, 52, 104, 83, 117, 109]),
         ),
+        (
+            bytearray(17),
+            1,
+            Int128(-1),
+            bytearray([0] + [255] * 16),
+        ),
     ],
 )
 def test_write(source_data, write_offset, write_value, expected):
@@ -94,6 +112,8 @@ def test_write_bytes(source_data, write_offset, write_data, expected):
         UInt16,
         UInt32,
         UInt64,
+        UInt128,
+        Int128,
         "int8",
         "int16",
         "int32",
@@ -102,9 +122,25 @@ def test_write_bytes(source_data, write_offset, write_data, expected):
         "uint16",
         "uint32",
         "uint64",
+        "int128",
+        "uint128",
     ],
 )
 def test_cast(type_or_name):
     data = bytearray([])
     p = vptr(data)
     p.cast(type_or_name)
+
+
+@pytest.mark.checked
+def test_out_of_range():
+    data = bytearray(6)
+    p = vptr(data, UInt32).add(1)
+
+    with pytest.raises(ValueError):
+        p.read()
+
+    with pytest.raises(ValueError):
+        p.write(1)
+
+    assert data == bytearray(6)